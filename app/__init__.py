@@ -17,27 +17,61 @@ def create_app(config_object=Config):
     
     app = Flask(__name__)
     app.config.from_object(config_object)
+    # Falha já na partida se o cache por processo fosse usado por vários workers
+    from .services.cache_backends import check_worker_setup
+    check_worker_setup(app.config)
+    # Provider de JSON (orjson quando disponível) usado por jsonify e request.get_json
+    from .json_provider import create_json_provider
+    app.json = create_json_provider(app)
     CORS(app, resources={r"/api/*": {"origins": "http://localhost:4200"}})
 
     # Inicializa as extensões com a aplicação Flask
     db.init_app(app)
     jwt.init_app(app)
 
-    # Registro dos Modelos
-    # Importamos os modelos para que o SQLAlchemy saiba quais tabelas criar
+    # Pool dedicado para o hash de senhas (método/custo inválido falha já na inicialização)
+    from .services.password_hasher import PasswordHasher
+    app.extensions['password_hasher'] = PasswordHasher(
+        app.config['PASSWORD_HASH_METHOD'],
+        max_workers=app.config['PASSWORD_HASH_WORKERS'],
+        max_pending=app.config['PASSWORD_HASH_MAX_PENDING'],
+        wait_timeout=app.config['PASSWORD_HASH_WAIT_TIMEOUT']
+    )
+
+    # Lista de tokens revogados (logout), consultada em toda rota com @jwt_required()
+    from .services.token_blocklist import TokenBlocklist
+    app.extensions['token_blocklist'] = TokenBlocklist(
+        capacity=app.config['TOKEN_BLOCKLIST_CAPACITY'],
+        error_rate=app.config['TOKEN_BLOCKLIST_ERROR_RATE'],
+        refresh_seconds=app.config['TOKEN_BLOCKLIST_REFRESH_SECONDS']
+    )
+
+    # PRAGMAs do SQLite em cada conexão (antes da primeira ser aberta).
+    # O esquema não é criado aqui: use `flask --app run db upgrade` (ver app/migrations.py).
+    # Os caches (tipos, tokens revogados) e os serviços são montados no primeiro uso.
     with app.app_context():
-        from .models import user_model
-        from .models import tipo_pokemon_model
-        from .models import pokemon_usuario_model
-        db.create_all()
+        from .sqlite_pragmas import register_sqlite_pragmas, register_sqlite_transactions
+        register_sqlite_pragmas(db.engine, app.config['SQLITE_PROFILES'][app.config['SQLITE_PROFILE']])
+        register_sqlite_transactions(db.engine)
 
     # Registro das Rotas (APIs)
     # Importamos o blueprint de autenticação
-    from .api.auth_routes import auth_bp
+    from .api.auth_routes import auth_bp, is_token_revoked
     app.register_blueprint(auth_bp, url_prefix='/api/v1/auth')
+    jwt.token_in_blocklist_loader(is_token_revoked)
 
     # Registro da nova rota de Pokémon
     from .api.pokemon_routes import pokemon_bp
     app.register_blueprint(pokemon_bp, url_prefix='/api/v1/pokemon')
+
+    # Registro das rotas de monitoramento
+    from .api.monitoring_routes import monitoring_bp
+    app.register_blueprint(monitoring_bp, url_prefix='/api/v1/monitoring')
+
+    # Registro dos comandos de linha de comando (ex.: flask --app run catalog sync)
+    from .cli import catalog_cli, db_cli, users_cli
+    app.cli.add_command(catalog_cli)
+    app.cli.add_command(db_cli)
+    app.cli.add_command(users_cli)
     
     return app
\ No newline at end of file
@@ -1,10 +1,23 @@
 
-from flask import Blueprint, request, jsonify
-from app.services.user_service import UserService
+from flask import Blueprint, request, jsonify, current_app
+from flask_jwt_extended import jwt_required, get_jwt
+from werkzeug.local import LocalProxy
+from app.services.password_hasher import PasswordHasherBusyError
 
 # Cria um Blueprint (módulo de rotas) para as rotas de autenticação
 auth_bp = Blueprint('auth', __name__)
-user_service = UserService() # Instância do nosso Serviço
+
+
+def get_user_service():
+    """Instância do nosso Serviço para a aplicação atual, criada no primeiro uso e não ao importar as rotas."""
+    service = current_app.extensions.get('user_service')
+    if service is None:
+        from app.services.user_service import UserService
+        service = current_app.extensions.setdefault('user_service', UserService())
+    return service
+
+
+user_service = LocalProxy(get_user_service)
 
 @auth_bp.route('/register', methods=['POST'])
 def register():
@@ -32,6 +45,9 @@ def register():
     except ValueError as e:
         # Erro de negócio (login/email já em uso)
         return jsonify({"msg": str(e)}), 409
+    except PasswordHasherBusyError as e:
+        # Pool de hashing saturado: o cliente deve tentar de novo
+        return jsonify({"msg": str(e)}), 503, {'Retry-After': '1'}
     except Exception:
         # Erro genérico do servidor
         return jsonify({"msg": "Erro interno ao registrar usuário."}), 500
@@ -57,5 +73,24 @@ def login():
     except ValueError as e:
         # Erro de negócio (credenciais inválidas)
         return jsonify({"msg": str(e)}), 401 
+    except PasswordHasherBusyError as e:
+        return jsonify({"msg": str(e)}), 503, {'Retry-After': '1'}
     except Exception:
-        return jsonify({"msg": "Erro interno ao realizar login."}), 500
\ No newline at end of file
+        return jsonify({"msg": "Erro interno ao realizar login."}), 500
+@auth_bp.route('/logout', methods=['POST'])
+@jwt_required()
+def logout():
+    """
+    Endpoint para encerrar a sessão: revoga o Token JWT usado na requisição.
+    URL: POST /api/v1/auth/logout
+    """
+    try:
+        user_service.logout(get_jwt())
+        return jsonify({"msg": "Logout realizado com sucesso."}), 200
+    except Exception as e:
+        print(f"Erro interno no logout: {e}")
+        return jsonify({"msg": "Erro interno ao realizar logout."}), 500
+
+def is_token_revoked(jwt_header, jwt_payload) -> bool:
+    """Callback do flask_jwt_extended (token_in_blocklist_loader): o token foi revogado?"""
+    return current_app.extensions['token_blocklist'].is_revoked(jwt_payload['jti'])
@@ -0,0 +1,37 @@
+
+import hashlib
+from typing import Optional
+from flask import Response, request, make_response
+
+# Respostas por usuário: o navegador pode guardar, mas deve revalidar (ETag) a cada uso
+PRIVATE_CACHE_CONTROL = 'private, no-cache'
+
+
+def build_etag(*parts) -> str:
+    """Gera uma ETag forte a partir das partes que determinam o conteúdo da resposta."""
+    return hashlib.sha1('|'.join(str(p) for p in parts).encode()).hexdigest()
+
+
+def apply_cache_headers(response: Response, etag: str) -> Response:
+    """Adiciona ETag, Cache-Control e Vary à resposta."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = PRIVATE_CACHE_CONTROL
+    response.vary.add('Authorization')
+    return response
+
+
+def apply_no_store_headers(response: Response) -> Response:
+    """Marca uma resposta que não deve ser guardada nem revalidada (sem ETag)."""
+    response.headers['Cache-Control'] = 'no-store'
+    response.vary.add('Authorization')
+    return response
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    """
+    Retorna uma resposta 304 se o cliente já tem a versão atual (If-None-Match),
+    ou None se a resposta completa precisa ser gerada.
+    """
+    if etag and request.if_none_match.contains(etag):
+        return apply_cache_headers(make_response('', 304), etag)
+    return None
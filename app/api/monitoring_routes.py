@@ -0,0 +1,63 @@
+
+from flask import Blueprint, jsonify, current_app
+from flask_jwt_extended import jwt_required
+from app.api.pokemon_routes import pokemon_service
+
+# Cria o Blueprint para as rotas de monitoramento.
+# Os contadores expõem detalhes internos: todas as rotas exigem um JWT válido.
+monitoring_bp = Blueprint('monitoring', __name__)
+
+@monitoring_bp.route('/pokeapi', methods=['GET'])
+@jwt_required()
+def pokeapi_stats():
+    """
+    Endpoint de monitoramento da integração com a PokeAPI: estado do circuit
+    breaker, dados antigos servidos, cache e deduplicação de requisições.
+    URL: GET /api/v1/monitoring/pokeapi
+    """
+    stats = pokemon_service.api_client.get_stats()
+    return jsonify({
+        "msg": "Estatísticas da PokeAPI obtidas com sucesso.",
+        "data": stats
+    }), 200
+
+@monitoring_bp.route('/user-cache', methods=['GET'])
+@jwt_required()
+def user_cache_stats():
+    """
+    Endpoint de monitoramento do cache de favoritos/time por usuário.
+    URL: GET /api/v1/monitoring/user-cache
+    """
+    stats = pokemon_service.get_user_cache_stats()
+    return jsonify({
+        "msg": "Estatísticas do cache de usuários obtidas com sucesso.",
+        "data": stats
+    }), 200
+
+@monitoring_bp.route('/password-hashing', methods=['GET'])
+@jwt_required()
+def password_hashing_stats():
+    """
+    Endpoint de monitoramento do pool de hash de senhas: método atual,
+    hashes/verificações feitos e pedidos recusados por fila cheia.
+    URL: GET /api/v1/monitoring/password-hashing
+    """
+    stats = current_app.extensions['password_hasher'].get_stats()
+    return jsonify({
+        "msg": "Estatísticas do hash de senhas obtidas com sucesso.",
+        "data": stats
+    }), 200
+
+@monitoring_bp.route('/token-blocklist', methods=['GET'])
+@jwt_required()
+def token_blocklist_stats():
+    """
+    Endpoint de monitoramento da revogação de tokens: consultas respondidas
+    pelo filtro de Bloom (sem I/O) e consultas que foram ao BD.
+    URL: GET /api/v1/monitoring/token-blocklist
+    """
+    stats = current_app.extensions['token_blocklist'].get_stats()
+    return jsonify({
+        "msg": "Estatísticas da revogação de tokens obtidas com sucesso.",
+        "data": stats
+    }), 200
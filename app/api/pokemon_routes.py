@@ -1,11 +1,71 @@
 
-from flask import Blueprint, request, jsonify
-from app.services.pokemon_service import PokemonService
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, request, jsonify, current_app
+from werkzeug.local import LocalProxy
+from app.api.http_cache import build_etag, apply_cache_headers, apply_no_store_headers, not_modified_response
+from app.json_provider import fragments_response
+from app.services.generation_index import GenerationIndexUnavailableError
+from flask_jwt_extended import jwt_required, get_jwt_identity, verify_jwt_in_request
 
 # Cria o Blueprint para as rotas de Pokémon
 pokemon_bp = Blueprint('pokemon', __name__)
-pokemon_service = PokemonService()
+
+
+def get_pokemon_service():
+    """
+    Serviço de Pokémon (e cliente da PokeAPI) da aplicação atual, criado no
+    primeiro uso e não ao importar as rotas. Cada aplicação tem o seu, montado
+    com a própria configuração.
+    """
+    service = current_app.extensions.get('pokemon_service')
+    if service is None:
+        from app.services.pokemon_service import PokemonService
+        service = current_app.extensions.setdefault('pokemon_service', PokemonService())
+    return service
+
+
+pokemon_service = LocalProxy(get_pokemon_service)
+
+
+def _is_valid_pokemon_data(pokemon_data) -> bool:
+    """Dados enviados pelo cliente para criar o registro: nome, imagem_uri e ao menos um tipo."""
+    if not isinstance(pokemon_data, dict):
+        return False
+    tipos = pokemon_data.get('tipos')
+    return (isinstance(pokemon_data.get('nome'), str) and bool(pokemon_data['nome'].strip())
+            and isinstance(pokemon_data.get('imagem_uri'), str)
+            and isinstance(tipos, list) and bool(tipos)
+            and all(isinstance(tipo, str) and tipo.strip() for tipo in tipos))
+
+def _listing_args() -> dict:
+    """Paginação e filtros da listagem: ?limit=...&offset=...&name=<filtro>&generation=<id>"""
+    return {
+        'limit': request.args.get('limit', default=20, type=int),
+        'offset': request.args.get('offset', default=0, type=int),
+        'name_filter': request.args.get('name', default=None, type=str),
+        'generation_id': request.args.get('generation', default=None, type=int),
+    }
+
+
+def _listing_etag(user_token: str) -> str:
+    return build_etag('list', user_token, request.query_string, pokemon_service.get_listing_token())
+
+
+def _listing_response(page: dict, user_token: str):
+    """Resposta da listagem a partir da página de fragmentos, com os cabeçalhos de cache."""
+    response = fragments_response(current_app, {
+        "msg": "Lista de Pokémon obtida com sucesso.",
+        "total_retornado": len(page['data']),
+        # Paginação sobre o resultado filtrado
+        "total": page['total'],
+        "next_offset": page['next_offset']
+    }, 'data', page['data'])
+    if not page['complete']:
+        # Pokémon que falharam na PokeAPI ficaram de fora: sem ETag, o cliente
+        # não recebe 304 para esta página incompleta quando a PokeAPI voltar
+        return apply_no_store_headers(response), 200
+    # O índice de nomes pode ter sido montado durante esta requisição
+    return apply_cache_headers(response, _listing_etag(user_token)), 200
+
 
 @pokemon_bp.route('/', methods=['GET'])
 @jwt_required() # Requisito: Acesso a esta rota requer um JWT válido
@@ -14,28 +74,47 @@ def list_pokemons():
     Endpoint para listar Pokémon com paginação e FILTROS (Requisito 2).
     URL: GET /api/v1/pokemon/?limit=...&offset=...&name=<filtro>&generation=<id>
     """
-    limit = request.args.get('limit', default=20, type=int)
-    offset = request.args.get('offset', default=0, type=int)
-    
-    # NOVOS FILTROS
-    name_filter = request.args.get('name', default=None, type=str)
-
     id_usuario = int(get_jwt_identity()) # Convertemos para int aqui
+
+    # Cache HTTP: a versão do usuário é lida ANTES dos dados, assim uma
+    # alteração concorrente nunca fica escondida atrás de uma ETag antiga.
+    user_token = pokemon_service.get_user_state_token(id_usuario)
+    cached = not_modified_response(_listing_etag(user_token))
+    if cached is not None:
+        return cached
     
     try:
-        pokemons = pokemon_service.get_pokemons_for_listing(
-            user_id=id_usuario, 
-            limit=limit, 
-            offset=offset,
-            name_filter=name_filter
-        )
-        
-        return jsonify({
-            "msg": "Lista de Pokémon obtida com sucesso.",
-            "data": pokemons,
-            "total_retornado": len(pokemons)
-        }), 200
-        
+        # Os Pokémon chegam já serializados (cache de fragmentos JSON do catálogo)
+        page = pokemon_service.get_pokemon_listing_fragments(user_id=id_usuario, **_listing_args())
+        return _listing_response(page, user_token)
+
+    except GenerationIndexUnavailableError as e:
+        return jsonify({"msg": str(e)}), 503
+    except Exception as e:
+        print(f"Erro ao listar Pokémon: {e}")
+        return jsonify({"msg": "Erro interno ao buscar lista de Pokémon."}), 500
+
+
+async def list_pokemons_async():
+    """
+    Mesma listagem de `list_pokemons`, como corrotina. Servida pelo asgi.py no
+    lugar da view síncrona: enquanto a PokeAPI responde, a requisição espera no
+    event loop do servidor sem ocupar uma thread.
+    """
+    verify_jwt_in_request() # Equivalente ao @jwt_required()
+    id_usuario = int(get_jwt_identity())
+
+    user_token = pokemon_service.get_user_state_token(id_usuario)
+    cached = not_modified_response(_listing_etag(user_token))
+    if cached is not None:
+        return cached
+
+    try:
+        page = await pokemon_service.get_pokemon_listing_fragments_async(user_id=id_usuario, **_listing_args())
+        return _listing_response(page, user_token)
+
+    except GenerationIndexUnavailableError as e:
+        return jsonify({"msg": str(e)}), 503
     except Exception as e:
         print(f"Erro ao listar Pokémon: {e}")
         return jsonify({"msg": "Erro interno ao buscar lista de Pokémon."}), 500
@@ -108,23 +187,95 @@ def toggle_battle_team(pokemon_code):
         print(f"Erro interno no toggle_battle_team: {e}")
         return jsonify({"msg": "Erro interno ao processar Grupo de Batalha."}), 500
 
+@pokemon_bp.route('/batch', methods=['POST'])
+@jwt_required()
+def apply_batch():
+    """
+    Endpoint para aplicar em lote operações de favorito/time (sincronização offline).
+    As operações são idempotentes (marcar/desmarcar) e aplicadas em uma única transação.
+    URL: POST /api/v1/pokemon/batch
+    Corpo: {"operations": [{"pokemon_code": "25", "field": "favorite" | "team", "value": true, "pokemon_data": {...}}]}
+    """
+    id_usuario = int(get_jwt_identity())
+    data = request.get_json(silent=True)
+    operations = data.get('operations') if isinstance(data, dict) else None
+
+    # Validação da estrutura do lote
+    if not isinstance(operations, list) or not operations:
+        return jsonify({"msg": "Dados incompletos. Requer: operations (lista não vazia)."}), 400
+    max_operations = current_app.config['BATCH_MAX_OPERATIONS']
+    if len(operations) > max_operations:
+        return jsonify({"msg": f"Máximo de {max_operations} operações por lote."}), 400
+    for position, op in enumerate(operations):
+        if not isinstance(op, dict) or not op.get('pokemon_code') \
+                or op.get('field') not in ('favorite', 'team') or not isinstance(op.get('value'), bool):
+            return jsonify({
+                "msg": f"Operação inválida na posição {position}. Requer: pokemon_code, field ('favorite' ou 'team') e value (booleano)."
+            }), 400
+        # pokemon_data é opcional, mas se enviado é usado como está para criar o registro
+        if op.get('pokemon_data') is not None and not _is_valid_pokemon_data(op['pokemon_data']):
+            return jsonify({
+                "msg": f"pokemon_data inválido na posição {position}. Requer: nome, imagem_uri e tipos (lista não vazia)."
+            }), 400
+
+    try:
+        results = pokemon_service.apply_batch_operations(id_usuario, operations)
+
+        return jsonify({
+            "msg": "Operações em lote processadas.",
+            "results": results,
+            "applied": sum(1 for r in results if r['status'] == 'applied'),
+            "errors": sum(1 for r in results if r['status'] == 'error')
+        }), 200
+    except ValueError as e:
+        # Conflito com uma alteração simultânea do time: nada foi gravado
+        return jsonify({"msg": str(e)}), 409
+    except Exception as e:
+        print(f"Erro interno no lote de operações: {e}")
+        return jsonify({"msg": "Erro interno ao processar operações em lote."}), 500
+
 @pokemon_bp.route('/favorites', methods=['GET'])
 @jwt_required()
 def list_favorites():
     """
-    Endpoint para listar todos os Pokémon favoritos do usuário (Requisito 3).
-    URL: GET /api/v1/pokemon/favorites
+    Endpoint para listar os Pokémon favoritos do usuário (Requisito 3), paginado por cursor.
+    URL: GET /api/v1/pokemon/favorites?limit=...&cursor=...&sort=added|name|id&order=asc|desc&type=<tipo>&name=<prefixo>
+    A resposta traz 'next_cursor', a ser enviado em 'cursor' para obter a próxima página.
     """
     # Lembre-se: id_usuario é string, o serviço espera um int.
     id_usuario = int(get_jwt_identity())
+    limit = request.args.get('limit', default=50, type=int)
+    cursor = request.args.get('cursor', default=None, type=str)
+    sort = request.args.get('sort', default='added', type=str)
+    order = request.args.get('order', default='asc', type=str)
+    type_filter = request.args.get('type', default=None, type=str)
+    name_prefix = request.args.get('name', default=None, type=str)
+
+    etag = build_etag('favorites', pokemon_service.get_user_state_token(id_usuario), request.query_string)
+    cached = not_modified_response(etag)
+    if cached is not None:
+        return cached
     
     try:
-        favorites = pokemon_service.get_user_favorite_list(id_usuario)
+        page = pokemon_service.get_user_favorites_page(
+            id_usuario,
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            order=order,
+            type_filter=type_filter,
+            name_prefix=name_prefix
+        )
         
-        return jsonify({
+        response = jsonify({
             "msg": "Lista de favoritos obtida com sucesso.",
-            "data": favorites
-        }), 200
+            "data": page['data'],
+            "next_cursor": page['next_cursor']
+        })
+        return apply_cache_headers(response, etag), 200
+    except ValueError as e:
+        # Parâmetros de paginação/ordenação inválidos
+        return jsonify({"msg": str(e)}), 400
     except Exception as e:
         print(f"Erro ao listar favoritos: {e}")
         return jsonify({"msg": "Erro interno ao buscar lista de favoritos."}), 500
@@ -137,15 +288,21 @@ def get_battle_team():
     URL: GET /api/v1/pokemon/team
     """
     id_usuario = int(get_jwt_identity())
+
+    etag = build_etag('team', pokemon_service.get_user_state_token(id_usuario))
+    cached = not_modified_response(etag)
+    if cached is not None:
+        return cached
     
     try:
         team = pokemon_service.get_user_battle_team_list(id_usuario)
         
-        return jsonify({
+        response = jsonify({
             "msg": "Equipe de Batalha obtida com sucesso.",
             "data": team,
             "count": len(team)
-        }), 200
+        })
+        return apply_cache_headers(response, etag), 200
     except Exception as e:
         print(f"Erro ao obter equipe de batalha: {e}")
         return jsonify({"msg": "Erro interno ao buscar Equipe de Batalha."}), 500
\ No newline at end of file
@@ -0,0 +1,183 @@
+
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict
+from werkzeug.exceptions import HTTPException
+
+
+def build_environ(scope: Dict[str, Any], body: bytes) -> Dict[str, Any]:
+    """Monta o environ WSGI de uma requisição ASGI (escopo 'http') com o corpo já lido."""
+    root_path = scope.get('root_path', '')
+    path = scope['path']
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    server = scope.get('server') or ('localhost', 80)
+
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': root_path.encode('utf8').decode('latin1'),
+        'PATH_INFO': path.encode('utf8').decode('latin1'),
+        'QUERY_STRING': scope['query_string'].decode('ascii'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope['http_version']}",
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': True,
+        'wsgi.run_once': False,
+    }
+    if scope.get('client'):
+        environ['REMOTE_ADDR'] = scope['client'][0]
+
+    for raw_name, raw_value in scope.get('headers', []):
+        name = raw_name.decode('latin1').upper().replace('-', '_')
+        if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            name = f"HTTP_{name}"
+        value = raw_value.decode('latin1')
+        # Cabeçalhos repetidos viram um só, separados por vírgula (como no WSGI)
+        environ[name] = f"{environ[name]},{value}" if name in environ else value
+    environ.setdefault('CONTENT_LENGTH', str(len(body)))
+    return environ
+
+
+class AsgiApp:
+    """
+    Aplicação ASGI sobre a aplicação Flask (ver asgi.py).
+
+    As views registradas em `async_views` (pelo endpoint do Flask) rodam como
+    corrotinas no event loop do servidor, dentro do contexto de requisição do
+    Flask: várias listagens esperam a PokeAPI juntas sem ocupar threads. As
+    demais rotas são as views síncronas de sempre, executadas pela aplicação
+    WSGI em um pool de threads (várias ao mesmo tempo).
+
+    As respostas são montadas inteiras antes do envio: a API só devolve JSON.
+    """
+
+    def __init__(self, flask_app, async_views: Dict[str, Callable[[], Awaitable]], max_threads: int = 32):
+        """
+        Args:
+            flask_app: A aplicação Flask (create_app).
+            async_views: Endpoint do Flask (ex.: 'pokemon.list_pokemons') -> corrotina
+                sem argumentos que a substitui nas requisições GET.
+            max_threads: Threads que executam as rotas síncronas.
+        """
+        self.flask_app = flask_app
+        self.async_views = async_views
+        self._executor = ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix='asgi-wsgi')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            raise ValueError(f"Escopo ASGI não suportado: {scope['type']}")
+
+        environ = build_environ(scope, await self._read_body(receive))
+        view = self._match_async_view(environ)
+        if view is not None:
+            response = await self._call_async_view(view, environ)
+            status, headers, body = response.status_code, response.headers.to_wsgi_list(), response.get_data()
+        else:
+            status, headers, body = await asyncio.get_running_loop().run_in_executor(self._executor, self._call_wsgi, environ)
+
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(name.lower().encode('latin1'), value.encode('latin1')) for name, value in headers],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _read_body(self, receive) -> bytes:
+        chunks = []
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                break
+            chunks.append(message.get('body', b''))
+            if not message.get('more_body'):
+                break
+        return b''.join(chunks)
+
+    async def _lifespan(self, receive, send):
+        """Partida e desligamento do worker: ao desligar, libera o pool de threads."""
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    def _match_async_view(self, environ) -> Callable[[], Awaitable] or None: # type: ignore
+        """Corrotina registrada para a rota pedida, se houver (apenas GET)."""
+        if environ['REQUEST_METHOD'] != 'GET':
+            return None
+        try:
+            endpoint, _ = self.flask_app.url_map.bind_to_environ(environ).match()
+        except HTTPException:
+            # 404/405/redirecionamentos ficam com o Flask
+            return None
+        return self.async_views.get(endpoint)
+
+    async def _call_async_view(self, view, environ):
+        """
+        Executa a corrotina no contexto de requisição do Flask, com o mesmo ciclo de
+        `Flask.full_dispatch_request` (before/after_request, tratadores de erro e
+        teardown). Os contextos do Flask usam contextvars: cada requisição ASGI roda
+        na própria task, então as que esperam juntas não se misturam.
+        """
+        app = self.flask_app
+        with app.request_context(environ):
+            try:
+                try:
+                    rv = app.preprocess_request()
+                    if rv is None:
+                        rv = await view()
+                except Exception as e:
+                    rv = app.handle_user_exception(e)
+                return app.finalize_request(rv)
+            except Exception as e:
+                return app.handle_exception(e)
+
+    def _call_wsgi(self, environ) -> tuple:
+        """Executa a aplicação WSGI (em uma thread do pool) e devolve (status, cabeçalhos, corpo)."""
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = headers
+
+        result = self.flask_app(environ, start_response)
+        try:
+            body = b''.join(result)
+        finally:
+            if hasattr(result, 'close'):
+                result.close()
+        return started['status'], started['headers'], body
+
+
+def create_asgi_app(flask_app) -> AsgiApp:
+    """
+    Expõe a aplicação Flask a servidores ASGI, com a listagem de Pokémon servida
+    pela versão assíncrona (buscas na PokeAPI pelo cliente httpx).
+
+    Raises:
+        RuntimeError: Se o pacote `httpx` não estiver instalado.
+    """
+    # Falha na partida, e não na primeira listagem, se o httpx não estiver instalado
+    from app.external.async_poke_api_client import httpx
+    if httpx is None:
+        raise RuntimeError("O servidor ASGI requer o pacote 'httpx' (pip install httpx).")
+
+    from app.api.pokemon_routes import list_pokemons_async
+    return AsgiApp(
+        flask_app,
+        async_views={'pokemon.list_pokemons': list_pokemons_async},
+        max_threads=flask_app.config['ASGI_THREADS']
+    )
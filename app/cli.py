@@ -0,0 +1,99 @@
+
+import os
+import click
+from flask.cli import AppGroup
+from app.services.user_import import SUPPORTED_FORMATS, detect_format, read_user_rows
+
+# Os serviços são importados dentro de cada comando: o módulo é carregado
+# pelo create_app em todo processo, inclusive nos workers do servidor.
+
+# Grupo de comandos do esquema do BD.
+# Uso: flask --app run db upgrade
+db_cli = AppGroup('db', help='Comandos do banco de dados.')
+
+
+@db_cli.command('upgrade')
+def upgrade_db():
+    """Cria as tabelas que faltam e aplica as atualizações de esquema (idempotente)."""
+    from app.migrations import migrate
+    indexes = migrate()
+    click.echo(f"Esquema atualizado ({len(indexes)} índices verificados).")
+
+# Grupo de comandos do catálogo local.
+# Uso: flask --app run catalog sync --workers 8 --batch-size 100
+catalog_cli = AppGroup('catalog', help='Comandos do catálogo local de Pokémon.')
+
+
+@catalog_cli.command('sync')
+@click.option('--workers', default=8, show_default=True, help='Requisições simultâneas à PokeAPI.')
+@click.option('--batch-size', default=100, show_default=True, help='Pokémon gravados por lote (checkpoint).')
+def sync_catalog(workers, batch_size):
+    """Baixa o catálogo completo da PokeAPI para o BD local (retomável)."""
+    from app.services.catalog_service import CatalogService
+
+    def progress(done, total):
+        click.echo(f"{done}/{total} Pokémon processados.")
+
+    service = CatalogService()
+    summary = service.sync_catalog(workers=workers, batch_size=batch_size, progress=progress)
+    click.echo(
+        f"Catálogo sincronizado: {summary['inserted']} inseridos, "
+        f"{summary['skipped']} já existentes, {summary['failed']} com falha."
+    )
+    # Sem isso o arquivo do cache em disco só cresce: as entradas vencidas nunca eram removidas
+    purged = service.api_client.cache.purge_expired()
+    click.echo(f"{purged} respostas expiradas removidas do cache da PokeAPI.")
+
+
+@catalog_cli.command('sync-generations')
+def sync_generations():
+    """Monta o índice geração -> Pokémon a partir da PokeAPI."""
+    from app.services.catalog_service import CatalogService
+    summary = CatalogService().sync_generations()
+    for generation_id, count in sorted(summary.items()):
+        click.echo(f"Geração {generation_id}: {count} Pokémon.")
+
+
+# Grupo de comandos de usuários.
+# Uso: flask --app run users import usuarios.csv --workers 8
+users_cli = AppGroup('users', help='Comandos de usuários.')
+
+
+@users_cli.command('import')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(SUPPORTED_FORMATS), default=None,
+              help='Formato do arquivo (padrão: pela extensão).')
+@click.option('--batch-size', default=1000, show_default=True, help='Usuários gravados por lote (checkpoint).')
+@click.option('--workers', default=os.cpu_count() or 1, show_default=True, help='Processos para o hash das senhas.')
+@click.option('--hash-method', default=None, help='Método/custo do hash (padrão: PASSWORD_HASH_METHOD).')
+def import_users(path, fmt, batch_size, workers, hash_method):
+    """Importa usuários de um arquivo CSV ou JSONL (colunas: nome, login, email, senha)."""
+    from app.services.user_service import UserService
+
+    def progress(summary):
+        click.echo(f"{summary['total']} linhas processadas, {summary['inserted']} usuários inseridos.")
+
+    try:
+        fmt = fmt or detect_format(path)
+        with open(path, encoding='utf-8-sig', newline='') as stream:
+            summary = UserService().import_users(
+                read_user_rows(stream, fmt), batch_size=batch_size, workers=workers,
+                hash_method=hash_method, progress=progress
+            )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    for line_number, error in summary['errors']:
+        click.echo(f"Linha {line_number}: {error}", err=True)
+    click.echo(
+        f"Importação concluída: {summary['inserted']} inseridos, {summary['skipped']} já existentes, "
+        f"{summary['invalid']} inválidos."
+    )
+
+
+@users_cli.command('purge-tokens')
+def purge_tokens():
+    """Remove do BD as revogações de tokens já expirados."""
+    from app.services.token_blocklist import TokenBlocklist
+    removed = TokenBlocklist().purge_expired()
+    click.echo(f"{removed} revogações expiradas removidas.")
@@ -12,17 +12,128 @@ class Config:
     # O caminho 'sqlite:///pokedex.db' cria o arquivo no diretório raiz do projeto
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URL', 'sqlite:///default.db')
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Pool de conexões (vale para qualquer banco). pool_size/max_overflow só
+    # são repassados se definidos, pois o SQLite em memória usa um pool sem esses parâmetros.
+    # pool_pre_ping (um SELECT a cada checkout) é opcional: útil com bancos remotos
+    # que derrubam conexões ociosas, custo puro com SQLite local.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_recycle': int(os.getenv('DB_POOL_RECYCLE', 3600)),
+        'pool_pre_ping': os.getenv('DB_POOL_PRE_PING', '0') == '1',
+        **({'pool_size': int(os.getenv('DB_POOL_SIZE'))} if os.getenv('DB_POOL_SIZE') else {}),
+        **({'max_overflow': int(os.getenv('DB_MAX_OVERFLOW'))} if os.getenv('DB_MAX_OVERFLOW') else {}),
+    }
+
+    # Perfil do SQLite: 'tuned' (WAL, etc.) ou 'default' (configuração padrão do SQLite)
+    # As PRAGMAs são aplicadas em cada conexão aberta; são ignoradas para outros bancos.
+    SQLITE_PROFILE = os.getenv('SQLITE_PROFILE', 'tuned')
+    SQLITE_PROFILES = {
+        'default': {},
+        'tuned': {
+            # Leitores não bloqueiam o escritor (e vice-versa)
+            'journal_mode': 'WAL',
+            # Com WAL, NORMAL só sincroniza no checkpoint: seguro contra corrupção
+            'synchronous': 'NORMAL',
+            # Espera (ms) pelo lock em vez de falhar com "database is locked"
+            'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT', 5000)),
+            # Leituras via mmap (bytes) e cache de páginas (negativo = KiB)
+            'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+            'cache_size': int(os.getenv('SQLITE_CACHE_SIZE', -64000)),
+        },
+    }
     
     # Chave Secreta para o Flask e JWT 
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key_nao_segura')
     JWT_SECRET_KEY = SECRET_KEY  
 
+    # Configuração do cliente da PokeAPI
+    # Número máximo de requisições simultâneas ao buscar detalhes em lote
+    POKEAPI_MAX_CONCURRENCY = int(os.getenv('POKEAPI_MAX_CONCURRENCY', 10))
+    # Prazo máximo (em segundos) para concluir um lote de requisições concorrentes
+    POKEAPI_BATCH_TIMEOUT = float(os.getenv('POKEAPI_BATCH_TIMEOUT', 15))
+    # Conexões HTTP mantidas abertas (keep-alive) com a PokeAPI
+    POKEAPI_POOL_SIZE = int(os.getenv('POKEAPI_POOL_SIZE', 20))
+    # Timeout (em segundos) de cada tentativa
+    POKEAPI_TIMEOUT = float(os.getenv('POKEAPI_TIMEOUT', 10))
+    # Novas tentativas para falhas transitórias (429/5xx e erros de conexão)
+    POKEAPI_MAX_RETRIES = int(os.getenv('POKEAPI_MAX_RETRIES', 3))
+    # Backoff exponencial com jitter: base e teto da espera, em segundos
+    POKEAPI_BACKOFF_BASE = float(os.getenv('POKEAPI_BACKOFF_BASE', 0.25))
+    POKEAPI_BACKOFF_MAX = float(os.getenv('POKEAPI_BACKOFF_MAX', 4))
+    # Orçamento total (em segundos) de uma requisição, somando todas as tentativas
+    POKEAPI_REQUEST_BUDGET = float(os.getenv('POKEAPI_REQUEST_BUDGET', 15))
+    # Circuit breaker: abre após N falhas dentro da janela (segundos) e
+    # libera uma chamada de teste após o tempo de espera (segundos)
+    POKEAPI_BREAKER_FAILURE_THRESHOLD = int(os.getenv('POKEAPI_BREAKER_FAILURE_THRESHOLD', 5))
+    POKEAPI_BREAKER_WINDOW = float(os.getenv('POKEAPI_BREAKER_WINDOW', 30))
+    POKEAPI_BREAKER_RESET_TIMEOUT = float(os.getenv('POKEAPI_BREAKER_RESET_TIMEOUT', 30))
+    # Requisições simultâneas (e conexões abertas) com a PokeAPI na listagem assíncrona
+    # (servidor ASGI, ver asgi.py), somando todas as requisições do processo
+    POKEAPI_ASYNC_POOL_SIZE = int(os.getenv('POKEAPI_ASYNC_POOL_SIZE', 20))
+    # Servidor ASGI (asgi.py): threads por worker que executam as rotas síncronas
+    # (todas menos a listagem, que roda como corrotina no event loop)
+    ASGI_THREADS = int(os.getenv('ASGI_THREADS', 32))
+
+    # Cache local das respostas da PokeAPI (memória + disco)
+    # Limite da camada em memória (LRU), em bytes de JSON comprimido
+    POKEAPI_CACHE_MEMORY_BYTES = int(os.getenv('POKEAPI_CACHE_MEMORY_BYTES', 64 * 1024 * 1024))
+    # Arquivo SQLite da camada em disco (string vazia desativa o disco)
+    POKEAPI_CACHE_PATH = os.getenv('POKEAPI_CACHE_PATH', 'pokeapi_cache.sqlite3')
+    # TTLs (em segundos) por tipo de endpoint. Os dados de Pokémon raramente mudam.
+    POKEAPI_CACHE_TTL_DETAILS = int(os.getenv('POKEAPI_CACHE_TTL_DETAILS', 7 * 24 * 3600))
+    POKEAPI_CACHE_TTL_SPECIES = int(os.getenv('POKEAPI_CACHE_TTL_SPECIES', 7 * 24 * 3600))
+    POKEAPI_CACHE_TTL_LIST = int(os.getenv('POKEAPI_CACHE_TTL_LIST', 24 * 3600))
+
+    # Intervalo (em segundos) para atualizar o índice de busca por nome com novos Pokémon
+    POKEMON_NAME_INDEX_REFRESH_SECONDS = int(os.getenv('POKEMON_NAME_INDEX_REFRESH_SECONDS', 3600))
+    # Intervalo (em segundos) para recarregar do BD o índice de gerações
+    # (montado por `flask catalog sync-generations`, possivelmente em outro processo)
+    POKEMON_GENERATION_INDEX_REFRESH_SECONDS = int(os.getenv('POKEMON_GENERATION_INDEX_REFRESH_SECONDS', 3600))
+
+    # Cache das listas de favoritos/time por usuário (e das versões usadas nas ETags)
+    # Com USER_CACHE_REDIS_URL (ex.: redis://localhost:6379/0) o cache é compartilhado
+    # entre os workers; sem ela, cada processo usa um LRU em memória.
+    USER_CACHE_REDIS_URL = os.getenv('USER_CACHE_REDIS_URL', '')
+    # Workers do servidor (gunicorn e uvicorn usam WEB_CONCURRENCY como padrão de
+    # --workers). Com mais de um, a aplicação exige USER_CACHE_REDIS_URL.
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+    USER_CACHE_MEMORY_BYTES = int(os.getenv('USER_CACHE_MEMORY_BYTES', 16 * 1024 * 1024))
+    USER_CACHE_TTL = int(os.getenv('USER_CACHE_TTL', 300))
+
+    # Serializador JSON das respostas: 'auto' (orjson quando instalado), 'orjson' ou 'stdlib'
+    JSON_PROVIDER = os.getenv('JSON_PROVIDER', 'auto')
+
+    # Hash de senhas: método do werkzeug com o custo (ex.: 'scrypt:32768:8:1' ou
+    # 'pbkdf2:sha256:600000'). Hashes antigos são regravados no próximo login.
+    PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+    # Pool dedicado: hashes em paralelo, pedidos em espera e tempo máximo de espera (s)
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', min(4, os.cpu_count() or 1)))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 32))
+    PASSWORD_HASH_WAIT_TIMEOUT = float(os.getenv('PASSWORD_HASH_WAIT_TIMEOUT', 5))
+
+    # Revogação de tokens (logout): filtro de Bloom em memória na frente da tabela
+    # 'TokenRevogado'. Capacidade prevista, taxa de falsos positivos e intervalo (s)
+    # para incorporar as revogações feitas por outros processos.
+    TOKEN_BLOCKLIST_CAPACITY = int(os.getenv('TOKEN_BLOCKLIST_CAPACITY', 10000))
+    TOKEN_BLOCKLIST_ERROR_RATE = float(os.getenv('TOKEN_BLOCKLIST_ERROR_RATE', 0.001))
+    TOKEN_BLOCKLIST_REFRESH_SECONDS = float(os.getenv('TOKEN_BLOCKLIST_REFRESH_SECONDS', 5))
+
+    # Número máximo de operações aceitas por POST /api/v1/pokemon/batch
+    BATCH_MAX_OPERATIONS = int(os.getenv('BATCH_MAX_OPERATIONS', 100))
+
 
 class TestingConfig(Config):
     """Configurações específicas para execução de testes."""
     TESTING = True # Habilita o modo de teste
     # Usa um banco de dados SQLite em memória para testes rápidos e isolados
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Cache da PokeAPI apenas em memória: nada é gravado em disco entre os testes
+    POKEAPI_CACHE_PATH = ''
+    # Os testes rodam em um único processo: não há revogações de outros workers
+    WEB_CONCURRENCY = 1
+    TOKEN_BLOCKLIST_REFRESH_SECONDS = 3600
+    # Hash barato: os testes não medem o custo do hash
+    PASSWORD_HASH_METHOD = 'pbkdf2:sha256:1000'
     # Chave de teste isolada
     JWT_SECRET_KEY = 'test-secret-key-pokedex'
     SECRET_KEY = JWT_SECRET_KEY
\ No newline at end of file
@@ -0,0 +1,231 @@
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+from app.external.poke_api_client import PokeAPIClient
+
+try:
+    import httpx
+except ImportError: # Dependência opcional: necessária apenas no modo assíncrono
+    httpx = None
+
+
+class AsyncPokeAPIClient:
+    """
+    Variante assíncrona do PokeAPIClient, sobre httpx.AsyncClient: enquanto a
+    PokeAPI responde, nenhuma thread fica parada esperando.
+
+    Compartilha com o cliente síncrono o cache de respostas, o circuit breaker e
+    a configuração de novas tentativas, então os dois podem ser usados lado a lado.
+    Deve ser usado sempre a partir do mesmo event loop (ver EventLoopThread).
+    """
+
+    def __init__(self, sync_client: PokeAPIClient, max_concurrency: int = None, pool_size: int = None, transport=None):
+        """
+        Args:
+            sync_client: Cliente síncrono cujo cache, breaker e configurações são reaproveitados.
+            max_concurrency: Máximo de requisições simultâneas em um lote (padrão: o do cliente síncrono).
+            pool_size: Máximo de conexões abertas com a PokeAPI (todas as requisições do processo);
+                padrão: POKEAPI_ASYNC_POOL_SIZE da configuração do cliente síncrono.
+            transport: Transporte do httpx (permite trocar a rede nos testes).
+
+        Raises:
+            RuntimeError: Se o pacote `httpx` não estiver instalado.
+        """
+        if httpx is None:
+            raise RuntimeError("O modo assíncrono requer o pacote 'httpx' (pip install httpx).")
+        self.sync_client = sync_client
+        self.BASE_URL = sync_client.BASE_URL
+        self.cache = sync_client.cache
+        self.breaker = sync_client.breaker
+        self.max_concurrency = max_concurrency or sync_client.fetcher.max_workers
+        self.batch_timeout = sync_client.fetcher.batch_timeout
+        self.pool_size = pool_size or sync_client.settings['POKEAPI_ASYNC_POOL_SIZE']
+        self._transport = transport
+        self._http = None
+        self._slots = None
+        # Busca em andamento por endpoint (equivalente ao SingleFlight, sem threads)
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._counters = {'executed': 0, 'deduplicated': 0}
+
+    def _client(self) -> "httpx.AsyncClient":
+        """Cria o cliente HTTP (pool de conexões keep-alive) no loop atual, sob demanda."""
+        if self._http is None:
+            # Só entra no pool quem tem conexão livre: a fila interna do httpcore é
+            # percorrida inteira a cada resposta e fica cara com centenas de pedidos
+            self._slots = asyncio.Semaphore(self.pool_size)
+            self._http = httpx.AsyncClient(
+                timeout=self.sync_client.timeout,
+                limits=httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size),
+                transport=self._transport
+            )
+        return self._http
+
+    async def _get_with_retries(self, url: str) -> "httpx.Response":
+        """
+        GET com novas tentativas para falhas transitórias (mesma política do
+        cliente síncrono: `max_retries`, backoff com jitter e orçamento de tempo).
+
+        Raises:
+            httpx.TransportError: Se a última tentativa falhar na conexão.
+        """
+        client = self.sync_client
+        deadline = time.monotonic() + client.request_budget
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            error = None
+            try:
+                http = self._client()
+                async with self._slots:
+                    response = await http.get(url, timeout=max(0.1, min(client.timeout, remaining)))
+                if response.status_code not in client.RETRYABLE_STATUS:
+                    return response
+                delay = client._retry_delay(attempt, response.headers.get('Retry-After'))
+            except httpx.TransportError as e:
+                error = e
+                delay = client._retry_delay(attempt)
+
+            attempt += 1
+            if attempt > client.max_retries or time.monotonic() + delay >= deadline:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+
+    async def _cache_call(self, method, *args, **kwargs):
+        """
+        Chama o cache sem travar o event loop: com a camada em disco (leitura e
+        escrita no SQLite, mais zlib), a chamada roda em uma thread.
+        """
+        if self.cache.disk is None:
+            return method(*args, **kwargs)
+        return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def _cache_get(self, endpoint: str, record: bool = True) -> Optional[Any]:
+        """`cache.get`: um acerto na memória é lido aqui mesmo; só o disco vai para uma thread."""
+        if self.cache.disk is not None:
+            cached = self.cache.get(endpoint, record=record, use_disk=False)
+            if cached is not None:
+                return cached
+        return await self._cache_call(self.cache.get, endpoint, record=record)
+
+    async def _fetch_data(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """
+        Igual a `PokeAPIClient._fetch_data`: cache válido, dado antigo com atualização
+        em segundo plano ou busca na rede, agrupando buscas simultâneas ao mesmo endpoint.
+        """
+        cached = await self._cache_get(endpoint)
+        if cached is not None:
+            return cached
+
+        stale = await self._cache_call(self.cache.get_stale, endpoint)
+        if stale is not None:
+            self.sync_client._count('stale_served')
+            self.sync_client._schedule_refresh(endpoint)
+            return stale
+
+        task = self._in_flight.get(endpoint)
+        if task is None:
+            self._counters['executed'] += 1
+            task = asyncio.ensure_future(self._fetch_from_network(endpoint))
+            self._in_flight[endpoint] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(endpoint, None))
+        else:
+            self._counters['deduplicated'] += 1
+        # shield: se quem espera desistir (prazo do lote), a busca continua e preenche o cache
+        return await asyncio.shield(task)
+
+    async def _fetch_from_network(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Chamada HTTP com o circuit breaker na frente; respostas de sucesso vão para o cache."""
+        cached = await self._cache_get(endpoint, record=False) # O miss já foi contado em `_fetch_data`
+        if cached is not None:
+            return cached
+
+        if not self.breaker.allow_request():
+            return None
+
+        url = f"{self.BASE_URL}{endpoint}"
+        try:
+            response = await self._get_with_retries(url)
+            response.raise_for_status()
+            data = response.json()
+        except httpx.HTTPStatusError as e:
+            # 404 e afins: a PokeAPI respondeu normalmente, não conta como falha
+            if response.status_code in self.sync_client.RETRYABLE_STATUS:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            print(f"Erro HTTP ao acessar {url}: {e}")
+            return None
+        except httpx.HTTPError as e:
+            self.breaker.record_failure()
+            print(f"Erro de conexão ao acessar {url}: {e}")
+            return None
+        except ValueError as e:
+            # 200 com corpo que não é JSON (ex.: página de erro de um proxy): conta
+            # como falha, senão uma chamada de teste do disjuntor nunca seria concluída
+            self.breaker.record_failure()
+            print(f"Resposta inválida de {url}: {e}")
+            return None
+
+        self.breaker.record_success()
+        await self._cache_call(self.cache.set, endpoint, data, raw=response.content)
+        return data
+
+    async def get_pokemon_list(self, limit: int = 151, offset: int = 0) -> Optional[List[Dict[str, str]]]:
+        """Lista paginada de nomes e URLs de Pokémon (ver `PokeAPIClient.get_pokemon_list`)."""
+        data = await self._fetch_data(f"pokemon?limit={limit}&offset={offset}")
+        if data and 'results' in data:
+            return data['results']
+        return None
+
+    async def get_pokemon_details(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """Detalhes de um Pokémon pelo nome ou ID."""
+        return await self._fetch_data(f"pokemon/{identifier}")
+
+    async def get_many_pokemon_details(self, identifiers: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Busca os detalhes de vários Pokémon ao mesmo tempo (até `max_concurrency`).
+
+        Returns:
+            Uma lista na mesma ordem de `identifiers`. Pokémon que falharam
+            ou excederam o prazo do lote aparecem como None.
+        """
+        if not identifiers:
+            return []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(identifier):
+            async with semaphore:
+                try:
+                    return await self.get_pokemon_details(identifier)
+                except Exception as e:
+                    print(f"Falha ao processar '{identifier}': {e}")
+                    return None
+
+        tasks = [asyncio.ensure_future(fetch_one(identifier)) for identifier in identifiers]
+        done, pending = await asyncio.wait(tasks, timeout=self.batch_timeout)
+        results = []
+        for identifier, task in zip(identifiers, tasks):
+            if task in pending:
+                # Estourou o prazo do lote: descarta apenas este item
+                task.cancel()
+                print(f"Tempo esgotado ao processar '{identifier}'.")
+                results.append(None)
+            else:
+                results.append(task.result())
+        return results
+
+    def get_stats(self) -> Dict[str, int]:
+        """Buscas reais e deduplicadas, para monitoramento."""
+        stats = dict(self._counters)
+        stats['in_flight'] = len(self._in_flight)
+        return stats
+
+    async def aclose(self):
+        """Fecha as conexões abertas."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+            self._slots = None
@@ -0,0 +1,97 @@
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict
+
+
+class CircuitBreaker:
+    """
+    Disjuntor (circuit breaker) para chamadas a um serviço externo.
+
+    - Fechado: as chamadas passam normalmente.
+    - Aberto: após `failure_threshold` falhas dentro de `window_seconds`, as
+      chamadas são recusadas imediatamente (sem esperar timeouts).
+    - Meio-aberto: passado `reset_timeout`, uma única chamada de teste é
+      liberada; se ela funcionar o disjuntor fecha, se falhar volta a abrir.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, window_seconds: float = 30.0, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.window_seconds = window_seconds
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = deque() # instantes das falhas recentes
+        self._opened_at = None
+        self._trial_in_flight = False
+        self._counters = {'failures': 0, 'successes': 0, 'opened': 0, 'short_circuited': 0}
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def _open(self, now: float):
+        self._state = self.OPEN
+        self._opened_at = now
+        self._trial_in_flight = False
+        self._failures.clear()
+        self._counters['opened'] += 1
+
+    def allow_request(self) -> bool:
+        """Indica se uma chamada pode ser feita agora (e a registra como tentativa)."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            if self._state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_timeout:
+                    self._counters['short_circuited'] += 1
+                    return False
+                self._state = self.HALF_OPEN
+
+            # Meio-aberto: apenas uma chamada de teste por vez
+            if self._trial_in_flight:
+                self._counters['short_circuited'] += 1
+                return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self):
+        """Registra uma chamada bem-sucedida (fecha o disjuntor se estava em teste)."""
+        with self._lock:
+            self._counters['successes'] += 1
+            if self._state != self.CLOSED:
+                self._state = self.CLOSED
+                self._failures.clear()
+                self._trial_in_flight = False
+
+    def record_failure(self):
+        """Registra uma falha; abre o disjuntor ao atingir o limite na janela."""
+        with self._lock:
+            self._counters['failures'] += 1
+            now = self._clock()
+            if self._state == self.HALF_OPEN:
+                self._open(now)
+                return
+
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_seconds:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._open(now)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Estado atual e contadores, para monitoramento."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['state'] = self._state
+            stats['recent_failures'] = len(self._failures)
+        return stats
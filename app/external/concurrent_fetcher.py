@@ -0,0 +1,77 @@
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, List, Optional
+
+
+class ConcurrentFetcher:
+    """
+    Executa chamadas de I/O (HTTP) em paralelo com um limite de concorrência.
+    Mantém a ordem dos itens de entrada e nunca deixa a falha de um item
+    derrubar o lote inteiro: itens com erro ou fora do prazo retornam None.
+    """
+
+    def __init__(self, max_workers: int = 10, batch_timeout: float = 15.0):
+        """
+        Args:
+            max_workers: Número máximo de requisições simultâneas (em voo).
+            batch_timeout: Prazo máximo, em segundos, para concluir um lote.
+        """
+        self.max_workers = max_workers
+        self.batch_timeout = batch_timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Cria o pool de threads sob demanda (reaproveitado entre lotes)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='pokeapi-fetch'
+                )
+            return self._executor
+
+    def map(self, func: Callable[[Any], Any], items: Iterable[Any], timeout: float = None) -> List[Optional[Any]]:
+        """
+        Aplica `func` a cada item em paralelo.
+
+        Args:
+            func: Função chamada com um item por vez.
+            items: Itens a processar.
+            timeout: Prazo do lote (usa `batch_timeout` se não informado).
+
+        Returns:
+            Uma lista com um resultado por item, na mesma ordem da entrada.
+            Itens que falharam ou não terminaram dentro do prazo ficam como None.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        timeout = self.batch_timeout if timeout is None else timeout
+        executor = self._get_executor()
+        futures = [executor.submit(func, item) for item in items]
+        _, not_done = wait(futures, timeout=timeout)
+
+        results = []
+        for item, future in zip(items, futures):
+            if future in not_done:
+                # Estourou o prazo do lote: descarta apenas este item
+                future.cancel()
+                print(f"Tempo esgotado ao processar '{item}'.")
+                results.append(None)
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"Falha ao processar '{item}': {e}")
+                results.append(None)
+        return results
+
+    def shutdown(self):
+        """Encerra o pool de threads (usado em testes e no desligamento)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
@@ -0,0 +1,52 @@
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable
+
+
+class EventLoopThread:
+    """
+    Um event loop asyncio rodando em uma thread daemon, compartilhado pelas
+    threads de requisição do processo. Permite que código síncrono (rotas
+    Flask/WSGI) e código assíncrono usem os mesmos clientes assíncronos, cujas
+    conexões ficam presas ao loop em que foram criadas.
+    """
+
+    def __init__(self, name: str = 'async-loop'):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Cria o loop e a thread sob demanda."""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name=self.name, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    def submit(self, coro: Awaitable) -> Future:
+        """Agenda a corrotina no loop e retorna um Future (de concurrent.futures)."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+
+    def run(self, coro: Awaitable, timeout: float = None) -> Any:
+        """Executa a corrotina no loop e bloqueia a thread atual até o resultado."""
+        return self.submit(coro).result(timeout)
+
+    async def wrap(self, coro: Awaitable) -> Any:
+        """Aguarda, a partir de OUTRO event loop, uma corrotina executada neste loop."""
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def shutdown(self):
+        """Para o loop e espera a thread terminar (usado em testes e no desligamento)."""
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
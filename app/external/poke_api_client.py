@@ -1,6 +1,23 @@
 
-import requests
-from typing import Dict, Any, List
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, List, Mapping, Optional
+from flask import current_app, has_app_context
+from app.config import Config
+from app.external.circuit_breaker import CircuitBreaker
+from app.external.concurrent_fetcher import ConcurrentFetcher
+from app.external.response_cache import ResponseCache
+from app.external.single_flight import SingleFlight
+
+def _default_settings() -> Mapping[str, Any]:
+    """Configuração da aplicação atual; fora de um app context, os valores de `Config`."""
+    if has_app_context():
+        return current_app.config
+    return {key: getattr(Config, key) for key in dir(Config) if key.isupper()}
+
 
 class PokeAPIClient:
     """
@@ -9,25 +26,229 @@ class PokeAPIClient:
     """
     
     BASE_URL = "https://pokeapi.co/api/v2/"
+
+    # Limite alto o suficiente para trazer todos os Pokémon em uma única página
+    FULL_LIST_LIMIT = 100000
+
+    # Respostas que indicam falha transitória (vale a pena tentar de novo)
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
     
-    def __init__(self):
-        """Inicializa o cliente com a URL base."""
-        print("PokeAPIClient inicializado.") # Para debug inicial
+    def __init__(self, base_url: str = None, max_concurrency: int = None, batch_timeout: float = None, cache: ResponseCache = None,
+                 pool_size: int = None, max_retries: int = None, request_budget: float = None, breaker: CircuitBreaker = None,
+                 config: Mapping[str, Any] = None):
+        """
+        Inicializa o cliente com a URL base, o motor de buscas concorrentes, o cache
+        local e o pool de conexões HTTP (keep-alive).
+
+        Args:
+            base_url: URL base da API (útil para apontar para um servidor de teste).
+            max_concurrency: Máximo de requisições simultâneas em um lote.
+            batch_timeout: Prazo máximo (segundos) de um lote de requisições.
+            cache: Cache de respostas (por padrão, criado a partir de Config).
+            pool_size: Máximo de conexões mantidas abertas com a PokeAPI.
+            max_retries: Máximo de novas tentativas por requisição GET.
+            request_budget: Tempo total (segundos) de uma requisição, somando as tentativas.
+            breaker: Circuit breaker da PokeAPI (por padrão, criado a partir da configuração).
+            config: Chaves POKEAPI_* (normalmente `app.config`). Por padrão, a
+                configuração da aplicação atual ou, fora dela, a classe `Config`.
+        """
+        settings = self.settings = config if config is not None else _default_settings()
+        if base_url:
+            self.BASE_URL = base_url
+        self.fetcher = ConcurrentFetcher(
+            max_workers=max_concurrency or settings['POKEAPI_MAX_CONCURRENCY'],
+            batch_timeout=batch_timeout or settings['POKEAPI_BATCH_TIMEOUT']
+        )
+        self.cache = cache or ResponseCache.from_config(settings)
+        # Requisições simultâneas ao mesmo endpoint compartilham uma única busca
+        self.single_flight = SingleFlight()
+
+        # Proteção contra PokeAPI lenta/fora do ar: circuit breaker e
+        # "stale-while-revalidate" (serve o dado antigo e atualiza em segundo plano)
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=settings['POKEAPI_BREAKER_FAILURE_THRESHOLD'],
+            window_seconds=settings['POKEAPI_BREAKER_WINDOW'],
+            reset_timeout=settings['POKEAPI_BREAKER_RESET_TIMEOUT']
+        )
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='pokeapi-refresh')
+        self._refreshing = set()
+        self._counters = {'stale_served': 0, 'background_refreshes': 0}
+        self._counters_lock = threading.Lock()
+
+        self.timeout = settings['POKEAPI_TIMEOUT']
+        self.max_retries = settings['POKEAPI_MAX_RETRIES'] if max_retries is None else max_retries
+        self.request_budget = request_budget or settings['POKEAPI_REQUEST_BUDGET']
+        self.backoff_base = settings['POKEAPI_BACKOFF_BASE']
+        self.backoff_max = settings['POKEAPI_BACKOFF_MAX']
+
+        # Um único adaptador (e portanto um único pool de conexões) compartilhado
+        # por todas as threads; cada thread usa sua própria Session sobre ele,
+        # pois o estado da Session (cookies etc.) não é thread-safe.
+        # O adaptador (e o import do requests, caro na partida a frio) só é
+        # criado na primeira chamada HTTP.
+        self.pool_size = pool_size or settings['POKEAPI_POOL_SIZE']
+        self._adapter = None
+        self._adapter_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> "requests.Session":
+        """Retorna a Session da thread atual, ligada ao pool de conexões compartilhado."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            with self._adapter_lock:
+                if self._adapter is None:
+                    self._adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size, max_retries=0)
+            session = requests.Session()
+            session.mount('https://', self._adapter)
+            session.mount('http://', self._adapter)
+            self._local.session = session
+        return session
+
+    def _retry_delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        Calcula a espera antes da próxima tentativa: respeita o cabeçalho
+        Retry-After (segundos ou data HTTP) quando presente; senão usa backoff
+        exponencial com jitter completo.
+        """
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _get_with_retries(self, url: str) -> "requests.Response":
+        """
+        Executa um GET (idempotente) com novas tentativas para falhas transitórias.
+        Para de tentar ao atingir `max_retries` ou quando a próxima espera
+        estouraria o orçamento de tempo da requisição.
+
+        Raises:
+            requests.exceptions.RequestException: Se a última tentativa falhar na conexão.
+        """
+        import requests
+        deadline = time.monotonic() + self.request_budget
+        attempt = 0
+        while True:
+            remaining = deadline - time.monotonic()
+            error = None
+            try:
+                response = self._session().get(url, timeout=max(0.1, min(self.timeout, remaining)))
+                if response.status_code not in self.RETRYABLE_STATUS:
+                    return response
+                delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+                delay = self._retry_delay(attempt)
+
+            attempt += 1
+            if attempt > self.max_retries or time.monotonic() + delay >= deadline:
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(delay)
         
+    def _count(self, counter: str):
+        with self._counters_lock:
+            self._counters[counter] += 1
+
     def _fetch_data(self, endpoint: str) -> Dict[str, Any] or None: # type: ignore
-        """Método privado para realizar a chamada HTTP e tratar erros."""
+        """
+        Método privado para obter os dados de um endpoint.
+        1. Dado válido no cache: retorna sem ir à rede.
+        2. Dado expirado no cache: retorna o dado antigo na hora e agenda a
+           atualização em segundo plano (stale-while-revalidate).
+        3. Sem cache: busca na rede, agrupando requisições simultâneas ao mesmo
+           endpoint em uma única chamada HTTP (com o circuit breaker na frente).
+        """
+        cached = self.cache.get(endpoint)
+        if cached is not None:
+            return cached
+
+        stale = self.cache.get_stale(endpoint)
+        if stale is not None:
+            self._count('stale_served')
+            self._schedule_refresh(endpoint)
+            return stale
+
+        return self.single_flight.do(endpoint, lambda: self._fetch_from_network(endpoint))
+
+    def _schedule_refresh(self, endpoint: str):
+        """Atualiza um endpoint em segundo plano (no máximo uma atualização por endpoint)."""
+        with self._counters_lock:
+            if endpoint in self._refreshing:
+                return
+            self._refreshing.add(endpoint)
+
+        def refresh():
+            try:
+                self._count('background_refreshes')
+                self.single_flight.do(endpoint, lambda: self._fetch_from_network(endpoint))
+            finally:
+                with self._counters_lock:
+                    self._refreshing.discard(endpoint)
+
+        self._refresh_executor.submit(refresh)
+
+    def _fetch_from_network(self, endpoint: str) -> Dict[str, Any] or None: # type: ignore
+        """
+        Método privado para realizar a chamada HTTP e tratar erros.
+        Usa o pool de conexões compartilhado, com novas tentativas e backoff,
+        e armazena as respostas de sucesso no cache. Com o circuit breaker
+        aberto, retorna None imediatamente em vez de esperar timeouts.
+        """
+        # Outra busca pode ter preenchido o cache enquanto esta aguardava
+        cached = self.cache.get(endpoint, record=False) # O miss já foi contado em `_fetch_data`
+        if cached is not None:
+            return cached
+
+        if not self.breaker.allow_request():
+            return None
+
+        import requests
         url = f"{self.BASE_URL}{endpoint}"
         try:
-            response = requests.get(url, timeout=10) 
+            response = self._get_with_retries(url)
             response.raise_for_status() 
-            return response.json()
+            data = response.json()
         except requests.exceptions.HTTPError as e:
+            # 404 e afins: a PokeAPI respondeu normalmente, não conta como falha
+            if response.status_code in self.RETRYABLE_STATUS:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
             print(f"Erro HTTP ao acessar {url}: {e}")
             return None
+        except requests.exceptions.JSONDecodeError as e:
+            # 200 com corpo que não é JSON (ex.: página de erro de um proxy): falha
+            self.breaker.record_failure()
+            print(f"Resposta inválida de {url}: {e}")
+            return None
         except requests.exceptions.RequestException as e:
+            self.breaker.record_failure()
             print(f"Erro de conexão ao acessar {url}: {e}")
             return None
 
+        self.breaker.record_success()
+        self.cache.set(endpoint, data, raw=response.content)
+        return data
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Contadores do cache, da deduplicação, do circuit breaker e de dados antigos servidos."""
+        with self._counters_lock:
+            stale = dict(self._counters)
+        return {
+            'cache': self.cache.get_stats(),
+            'single_flight': self.single_flight.get_stats(),
+            'circuit_breaker': self.breaker.get_stats(),
+            'stale': stale
+        }
+
     def get_pokemon_list(self, limit: int = 151, offset: int = 0) -> List[Dict[str, str]] or None: # type: ignore
         """
         Busca uma lista paginada de nomes e URLs de Pokémon.
@@ -59,6 +280,45 @@ class PokeAPIClient:
         endpoint = f"pokemon/{identifier}"
         return self._fetch_data(endpoint)
 
+    def get_many_pokemon_details(self, identifiers: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Busca os detalhes de vários Pokémon em paralelo (concorrência limitada).
+
+        Args:
+            identifiers: Nomes ou IDs dos Pokémon.
+
+        Returns:
+            Uma lista na mesma ordem de `identifiers`. Pokémon que falharam
+            ou excederam o prazo do lote aparecem como None.
+        """
+        return self.fetcher.map(self.get_pokemon_details, identifiers)
+
+    @staticmethod
+    def extract_id_from_url(url: str) -> int:
+        """Extrai o ID numérico de uma URL da PokeAPI (ex.: '.../pokemon-species/25/' -> 25)."""
+        return int(url.rstrip('/').rsplit('/', 1)[-1])
+
+    def get_generation_list(self) -> List[Dict[str, str]] or None: # type: ignore
+        """
+        Busca a lista de gerações disponíveis.
+
+        Returns:
+            Uma lista de dicionários com 'name' e 'url', ou None em caso de falha.
+        """
+        data = self._fetch_data("generation?limit=100")
+
+        if data and 'results' in data:
+            return data['results']
+        return None
+
+    def get_generation(self, identifier: str) -> Dict[str, Any] or None: # type: ignore
+        """
+        Busca os dados de uma geração, incluindo as espécies introduzidas nela
+        (chave 'pokemon_species').
+        """
+        endpoint = f"generation/{identifier}"
+        return self._fetch_data(endpoint)
+
     def get_pokemon_species(self, identifier: str) -> Dict[str, Any] or None: # type: ignore
         """
         Busca dados de espécies de um Pokémon (útil para geração e descrições).
@@ -0,0 +1,255 @@
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+class MemoryLRUCache:
+    """
+    Cache em memória com política LRU, limitado pelo tamanho (em bytes)
+    das respostas armazenadas.
+    Os objetos devolvidos são compartilhados: devem ser tratados como somente leitura.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        # chave -> (dados, tamanho em bytes, expira_em)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Retorna (dados, expira_em) e marca a entrada como usada recentemente."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0], entry[2]
+
+    def set(self, key: str, data: Any, size: int, expires_at: float):
+        """Armazena uma entrada, removendo as menos usadas até caber no limite."""
+        if size > self.max_bytes:
+            return # Maior que o cache inteiro: não vale a pena guardar
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (data, size, expires_at)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteBlobStore:
+    """
+    Armazenamento em disco das respostas da PokeAPI (o JSON já comprimido com
+    zlib pelo ResponseCache) em um arquivo SQLite local. A conexão é aberta
+    apenas no primeiro uso.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Retorna (JSON comprimido, expira_em) ou None."""
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT payload, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def set(self, key: str, payload: bytes, expires_at: float):
+        """Grava (ou substitui) uma entrada já comprimida."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, payload, expires_at) VALUES (?, ?, ?)",
+                (key, payload, expires_at)
+            )
+            conn.commit()
+
+    def purge_expired(self, now: float = None) -> int:
+        """Remove do disco as entradas expiradas. Retorna quantas foram removidas."""
+        with self._lock:
+            conn = self._connection()
+            cursor = conn.execute("DELETE FROM cache_entries WHERE expires_at < ?", (now or time.time(),))
+            conn.commit()
+            return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ResponseCache:
+    """
+    Cache de duas camadas para as respostas da PokeAPI:
+    1. LRU em memória, limitado em bytes (acerto sem I/O);
+    2. SQLite em disco, que sobrevive a reinícios do processo.
+    Cada tipo de endpoint tem seu próprio TTL.
+
+    As duas camadas guardam o JSON comprimido (zlib), nunca o dicionário
+    decodificado: os detalhes de um Pokémon ocupam dezenas de KB como objetos
+    Python e o que a listagem usa já vira um `PokemonRecord` compacto. Cada
+    acerto devolve um dicionário novo, decodificado na hora.
+    """
+
+    # Ordem importa: 'pokemon-species/' precisa ser testado antes de 'pokemon/'
+    ENDPOINT_PREFIXES = ('pokemon-species/', 'pokemon/', 'pokemon?')
+
+    def __init__(self, max_memory_bytes: int, disk_path: str = None, ttls: Dict[str, float] = None, default_ttl: float = 3600):
+        """
+        Args:
+            max_memory_bytes: Limite da camada em memória.
+            disk_path: Arquivo SQLite da camada em disco (None desativa o disco).
+            ttls: TTL em segundos por prefixo de endpoint (ver ENDPOINT_PREFIXES).
+            default_ttl: TTL usado para endpoints sem prefixo configurado.
+        """
+        self.memory = MemoryLRUCache(max_memory_bytes)
+        self.disk = SQLiteBlobStore(disk_path) if disk_path else None
+        self.ttls = ttls or {}
+        self.default_ttl = default_ttl
+        self._counters = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "ResponseCache":
+        """Cria o cache a partir das chaves POKEAPI_CACHE_* da configuração (ex.: `app.config`)."""
+        return cls(
+            max_memory_bytes=config['POKEAPI_CACHE_MEMORY_BYTES'],
+            disk_path=config['POKEAPI_CACHE_PATH'] or None,
+            ttls={
+                'pokemon-species/': config['POKEAPI_CACHE_TTL_SPECIES'],
+                'pokemon/': config['POKEAPI_CACHE_TTL_DETAILS'],
+                'pokemon?': config['POKEAPI_CACHE_TTL_LIST'],
+            },
+            default_ttl=config['POKEAPI_CACHE_TTL_LIST']
+        )
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Retorna o TTL configurado para o endpoint."""
+        for prefix in self.ENDPOINT_PREFIXES:
+            if endpoint.startswith(prefix):
+                return self.ttls.get(prefix, self.default_ttl)
+        return self.default_ttl
+
+    def _count(self, counter: str):
+        with self._lock:
+            self._counters[counter] += 1
+
+    def get(self, endpoint: str, record: bool = True, use_disk: bool = True) -> Optional[Any]:
+        """
+        Retorna os dados ainda válidos do endpoint, ou None (miss).
+        Com `record=False` os contadores não mudam: é a nova checagem de quem já
+        contou o miss (ex.: a busca que vai à rede, ver `_fetch_from_network`).
+        Com `use_disk=False` só a memória é lida (sem I/O) e o miss não é contado:
+        quem chama consulta as duas camadas em seguida, fora do event loop.
+        """
+        now = time.time()
+
+        entry = self.memory.get(endpoint)
+        if entry is not None and entry[1] > now:
+            if record:
+                self._count('memory_hits')
+            return self._decode(entry[0])
+
+        if not use_disk:
+            return None
+
+        if self.disk is not None:
+            stored = self.disk.get(endpoint)
+            if stored is not None and stored[1] > now:
+                payload, expires_at = stored
+                # Promove para a memória para os próximos acessos
+                self.memory.set(endpoint, payload, len(payload), expires_at)
+                if record:
+                    self._count('disk_hits')
+                return self._decode(payload)
+
+        if record:
+            self._count('misses')
+        return None
+
+    @staticmethod
+    def _decode(payload: bytes) -> Any:
+        return json.loads(zlib.decompress(payload))
+
+    def get_stale(self, endpoint: str) -> Optional[Any]:
+        """
+        Retorna os dados do endpoint mesmo que o TTL já tenha expirado, ou None.
+        Usado para servir dados antigos enquanto a PokeAPI está lenta ou fora do ar.
+        """
+        entry = self.memory.get(endpoint)
+        if entry is not None:
+            return self._decode(entry[0])
+
+        if self.disk is not None:
+            stored = self.disk.get(endpoint)
+            if stored is not None:
+                payload, expires_at = stored
+                self.memory.set(endpoint, payload, len(payload), expires_at)
+                return self._decode(payload)
+        return None
+
+    def set(self, endpoint: str, data: Any, raw: bytes = None):
+        """
+        Armazena a resposta de um endpoint nas duas camadas.
+
+        Args:
+            endpoint: Endpoint relativo à URL base (ex.: 'pokemon/25').
+            data: JSON já decodificado (não é guardado; apenas serializado se `raw` faltar).
+            raw: Corpo original da resposta (evita serializar novamente).
+        """
+        if raw is None:
+            raw = json.dumps(data).encode()
+        payload = zlib.compress(raw)
+        expires_at = time.time() + self.ttl_for(endpoint)
+        self.memory.set(endpoint, payload, len(payload), expires_at)
+        if self.disk is not None:
+            self.disk.set(endpoint, payload, expires_at)
+
+    def purge_expired(self) -> int:
+        """
+        Remove do disco as respostas com o TTL vencido (a camada em memória já é
+        limitada pelo LRU). Executado por `flask catalog sync`: com o catálogo
+        local gravado, as respostas antigas não servem mais nem como fallback.
+        Retorna quantas entradas foram removidas.
+        """
+        return self.disk.purge_expired() if self.disk is not None else 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """Contadores de acertos, falhas e remoções, para monitoramento."""
+        with self._lock:
+            stats = dict(self._counters)
+        stats['hits'] = stats['memory_hits'] + stats['disk_hits']
+        stats['evictions'] = self.memory.evictions
+        stats['memory_entries'] = len(self.memory)
+        stats['memory_bytes'] = self.memory.current_bytes
+        return stats
@@ -0,0 +1,72 @@
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Call:
+    """Uma chamada em andamento e o resultado que será entregue a todos que esperam."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes para a mesma chave em uma única execução
+    (padrão "single-flight"). A primeira thread executa a função; as demais
+    esperam e recebem o mesmo resultado — ou a mesma exceção.
+    Evita o "efeito manada" contra a PokeAPI quando vários usuários pedem
+    o mesmo Pokémon ao mesmo tempo.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._counters = {'executed': 0, 'deduplicated': 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Executa `fn` uma única vez para todas as chamadas simultâneas com a mesma `key`.
+
+        Raises:
+            Exception: A exceção lançada por `fn`, repassada a todas as threads em espera.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self._counters['executed'] += 1
+            else:
+                self._counters['deduplicated'] += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            # Remove a chave antes de liberar quem espera: chamadas futuras
+            # (depois desta terminar) executam novamente.
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Contadores de execuções reais e de chamadas deduplicadas, para monitoramento."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['in_flight'] = len(self._calls)
+        return stats
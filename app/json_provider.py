@@ -0,0 +1,74 @@
+
+from typing import Any, Dict, Iterable
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError: # Dependência opcional: sem ela usamos o json da biblioteca padrão
+    orjson = None
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """Provider padrão do Flask (módulo json), com a serialização direta para bytes."""
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        """Serializa em JSON compacto (UTF-8)."""
+        return self.dumps(obj, separators=(',', ':')).encode()
+
+
+class OrjsonJSONProvider(StdlibJSONProvider):
+    """
+    Provider baseado no orjson, com o mesmo comportamento do padrão do Flask:
+    chaves ordenadas, datas no formato HTTP e o mesmo fallback (`default`)
+    para Decimal, UUID, dataclasses etc.
+    """
+
+    def _options(self) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return options
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=self.default, option=self._options())
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Em modo debug a resposta é indentada: deixa a cargo do provider padrão
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj) + b'\n', mimetype=self.mimetype)
+
+
+def create_json_provider(app) -> StdlibJSONProvider:
+    """
+    Cria o provider de JSON a partir de JSON_PROVIDER: 'auto' (orjson quando
+    instalado, senão a biblioteca padrão), 'orjson' ou 'stdlib'.
+    """
+    choice = app.config['JSON_PROVIDER']
+    if choice not in ('auto', 'orjson', 'stdlib'):
+        raise RuntimeError(f"JSON_PROVIDER inválido: {choice!r} (use 'auto', 'orjson' ou 'stdlib').")
+    if choice == 'orjson' and orjson is None:
+        raise RuntimeError("JSON_PROVIDER=orjson, mas o pacote 'orjson' não está instalado.")
+
+    if choice != 'stdlib' and orjson is not None:
+        return OrjsonJSONProvider(app)
+    return StdlibJSONProvider(app)
+
+
+def fragments_response(app, envelope: Dict[str, Any], field: str, fragments: Iterable[bytes]):
+    """
+    Monta uma resposta JSON cujo campo `field` é uma lista de objetos já
+    serializados (`fragments`), sem decodificá-los nem serializá-los de novo.
+    Os demais campos (`envelope`) passam pelo provider da aplicação.
+    """
+    head = b'{"' + field.encode() + b'":[' + b','.join(fragments) + b']'
+    rest = app.json.dumps_bytes(envelope)[1:] # Sem o '{' inicial
+    body = head + (b',' + rest if rest != b'}' else rest)
+    return app.response_class(body + b'\n', mimetype=app.json.mimetype)
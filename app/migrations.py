@@ -0,0 +1,92 @@
+
+from datetime import datetime
+from sqlalchemy import bindparam, inspect, text
+from sqlalchemy.schema import CreateIndex
+from app import db
+
+# Colunas adicionadas a tabelas que já existiam: (tabela, coluna)
+ADDED_COLUMNS = (
+    ('PokemonUsuario', 'DtInclusao'),
+)
+
+# Dados que precisam ser preenchidos em bancos existentes (idempotentes).
+# O parâmetro :agora recebe o instante da migração.
+DATA_MIGRATIONS = (
+    # Registros anteriores à coluna DtInclusao
+    text("""
+    UPDATE "PokemonUsuario" SET "DtInclusao" = :agora WHERE "DtInclusao" IS NULL
+    """).bindparams(bindparam('agora', type_=db.DateTime)),
+    # Registros criados antes da tabela de associação: o único tipo conhecido é o primário
+    text("""
+    INSERT INTO "PokemonUsuarioTipo" ("IDPokemonUsuario", "IDTipoPokemon", "Ordem")
+    SELECT p."IDPokemonUsuario", p."IDTipoPokemon", 1
+    FROM "PokemonUsuario" p
+    WHERE NOT EXISTS (
+        SELECT 1 FROM "PokemonUsuarioTipo" t WHERE t."IDPokemonUsuario" = p."IDPokemonUsuario"
+    )
+    """),
+)
+
+
+def migrate() -> list:
+    """
+    Cria as tabelas que faltam e atualiza o esquema (ver `upgrade_schema`).
+    Passo explícito de implantação (`flask --app run db upgrade`): o `create_app`
+    não toca no esquema, para que cada processo novo suba sem DDL.
+    Deve ser chamado dentro do contexto da aplicação.
+
+    Returns:
+        Os nomes dos índices verificados.
+    """
+    # Todos os modelos precisam estar registrados para o create_all
+    from app.models import (  # noqa: F401
+        catalogo_pokemon_model, equipe_batalha_contador_model, geracao_pokemon_model, pokemon_usuario_model,
+        pokemon_usuario_tipo_model, tipo_pokemon_model, token_revogado_model, user_model
+    )
+    db.create_all()
+    return upgrade_schema()
+
+
+def upgrade_schema() -> list:
+    """
+    Atualiza o esquema de um banco já existente.
+
+    `db.create_all()` só cria tabelas que ainda não existem: índices adicionados
+    depois a uma tabela antiga nunca seriam criados. Aqui cada índice declarado
+    nos modelos é criado se estiver faltando (CREATE INDEX IF NOT EXISTS), e as
+    colunas novas de tabelas antigas são adicionadas (ver ADDED_COLUMNS).
+    Em seguida preenche os dados novos (ver DATA_MIGRATIONS).
+    Deve ser chamado dentro do contexto da aplicação, depois de `create_all`.
+
+    Returns:
+        Os nomes dos índices verificados.
+    """
+    checked = []
+    with db.engine.begin() as conn:
+        _add_missing_columns(conn)
+
+        # IF NOT EXISTS em vez de reflexão: a reflexão ignora índices de expressão
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                conn.execute(CreateIndex(index, if_not_exists=True))
+                checked.append(index.name)
+
+        for statement in DATA_MIGRATIONS:
+            conn.execute(statement, {'agora': datetime.utcnow()})
+    return checked
+
+
+def _add_missing_columns(conn):
+    """
+    Adiciona (ALTER TABLE ... ADD COLUMN) as colunas listadas em ADDED_COLUMNS que
+    ainda não existem. Elas entram sem NOT NULL (exigência do ALTER TABLE do SQLite
+    sem valor padrão constante) e são preenchidas em DATA_MIGRATIONS.
+    """
+    inspector = inspect(conn)
+    for table_name, column_name in ADDED_COLUMNS:
+        existing = {column['name'] for column in inspector.get_columns(table_name)}
+        if column_name in existing:
+            continue
+        column = db.metadata.tables[table_name].columns[column_name]
+        column_type = column.type.compile(dialect=conn.dialect)
+        conn.execute(text(f'ALTER TABLE "{table_name}" ADD COLUMN "{column_name}" {column_type}'))
@@ -0,0 +1,44 @@
+
+from app import db
+
+class CatalogoPokemonModel(db.Model):
+    """
+    Define o modelo de dados para a tabela 'CatalogoPokemon'.
+    Cópia local e normalizada do catálogo da PokeAPI, usada para servir a
+    listagem sem depender da rede a cada requisição.
+    """
+    __tablename__ = 'CatalogoPokemon'
+
+    # Mapeamento: nome do atributo base na PokeAPI -> coluna do catálogo
+    STAT_COLUMNS = {
+        'hp': 'hp',
+        'attack': 'ataque',
+        'defense': 'defesa',
+        'special-attack': 'ataque_especial',
+        'special-defense': 'defesa_especial',
+        'speed': 'velocidade',
+    }
+
+    # IDPokemon INT PrimaryKey (o mesmo ID da PokeAPI)
+    id_pokemon = db.Column('IDPokemon', db.Integer, primary_key=True, autoincrement=False)
+
+    # Nome VARCHAR (slug da PokeAPI, ex.: 'bulbasaur')
+    nome = db.Column('Nome', db.String(100), nullable=False, unique=True)
+
+    # Tipos do Pokémon (no máximo dois)
+    tipo_primario = db.Column('TipoPrimario', db.String(20), nullable=False)
+    tipo_secundario = db.Column('TipoSecundario', db.String(20), nullable=True)
+
+    # ImagemUrI VARCHAR (arte oficial; algumas formas não possuem)
+    imagem_uri = db.Column('ImagemUrI', db.String(255), nullable=True)
+
+    # Atributos base
+    hp = db.Column('HP', db.Integer, nullable=False, default=0)
+    ataque = db.Column('Ataque', db.Integer, nullable=False, default=0)
+    defesa = db.Column('Defesa', db.Integer, nullable=False, default=0)
+    ataque_especial = db.Column('AtaqueEspecial', db.Integer, nullable=False, default=0)
+    defesa_especial = db.Column('DefesaEspecial', db.Integer, nullable=False, default=0)
+    velocidade = db.Column('Velocidade', db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<CatalogoPokemonModel ID: {self.id_pokemon}, Nome: {self.nome}>"
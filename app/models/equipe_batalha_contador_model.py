@@ -0,0 +1,23 @@
+from app import db
+
+class EquipeBatalhaContadorModel(db.Model):
+    """
+    Define o modelo de dados para a tabela 'EquipeBatalhaContador'.
+    Uma linha por usuário com o tamanho atual da Equipe de Batalha. O limite de 6
+    é garantido por um UPDATE condicional nesta linha ('... WHERE Quantidade < 6'),
+    atômico em qualquer banco, sem lock global.
+    """
+    __tablename__ = 'EquipeBatalhaContador'
+
+    # IDUsuario INT PrimaryKey (e chave estrangeira para 'Usuario')
+    id_usuario = db.Column('IDUsuario', db.Integer, db.ForeignKey('Usuario.IDUsuario'), primary_key=True, autoincrement=False)
+
+    # Quantidade INT (Pokémon com GrupoBatalha = True)
+    quantidade = db.Column('Quantidade', db.Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        db.CheckConstraint('Quantidade >= 0', name='_equipe_batalha_quantidade_ck'),
+    )
+
+    def __repr__(self):
+        return f"<EquipeBatalhaContadorModel Usuário: {self.id_usuario}, Quantidade: {self.quantidade}>"
@@ -0,0 +1,22 @@
+
+from app import db
+
+class GeracaoPokemonModel(db.Model):
+    """
+    Define o modelo de dados para a tabela 'GeracaoPokemon'.
+    Índice pré-calculado de quais Pokémon pertencem a cada geração, montado
+    uma única vez a partir dos endpoints de geração da PokeAPI.
+    """
+    __tablename__ = 'GeracaoPokemon'
+
+    # IDGeracao INT (ID da geração na PokeAPI)
+    id_geracao = db.Column('IDGeracao', db.Integer, primary_key=True, autoincrement=False)
+
+    # IDPokemon INT (ID da espécie / forma padrão do Pokémon)
+    id_pokemon = db.Column('IDPokemon', db.Integer, primary_key=True, autoincrement=False)
+
+    # Nome VARCHAR (slug do Pokémon, o mesmo usado na listagem)
+    nome = db.Column('Nome', db.String(100), nullable=False)
+
+    def __repr__(self):
+        return f"<GeracaoPokemonModel Geração: {self.id_geracao}, Pokémon: {self.nome}>"
@@ -1,5 +1,6 @@
 
 from app import db
+from datetime import datetime
 
 class PokemonUsuarioModel(db.Model):
     """
@@ -33,9 +34,27 @@ class PokemonUsuarioModel(db.Model):
     # Indica se o Pokémon está na lista de Favoritos 
     favorito = db.Column('Favorito', db.Boolean, default=False, nullable=False)
 
+    # Data em que o registro foi criado (ordenação "adicionados recentemente")
+    dt_inclusao = db.Column('DtInclusao', db.DateTime, default=datetime.utcnow, nullable=False)
+
+    # Todos os tipos do Pokémon (associação), removidos junto com o registro
+    tipos = db.relationship('PokemonUsuarioTipoModel', cascade='all, delete-orphan',
+                            order_by='PokemonUsuarioTipoModel.ordem', lazy='select')
+
     # Restrição de Unicidade: Um usuário só pode ter um registro para um Pokémon específico
+    # Índices compostos para as leituras de time/favoritos e a contagem do time,
+    # que filtram por (IDUsuario, GrupoBatalha) e (IDUsuario, Favorito).
+    # (Índices parciais 'WHERE GrupoBatalha = 1' não servem aqui: o SQLite não os
+    # usa quando o valor chega como parâmetro, que é como o SQLAlchemy envia.)
     __table_args__ = (
         db.UniqueConstraint('IDUsuario', 'Codigo', name='_usuario_pokemon_uc'),
+        db.Index('ix_pokemon_usuario_grupo_batalha', 'IDUsuario', 'GrupoBatalha'),
+        db.Index('ix_pokemon_usuario_favorito', 'IDUsuario', 'Favorito'),
+        # Paginação por cursor (keyset) dos favoritos, já na ordem pedida.
+        # O desempate é o IDPokemonUsuario (rowid), incluído em todo índice do SQLite.
+        db.Index('ix_pokemon_usuario_favorito_nome', 'IDUsuario', 'Favorito', 'Nome'),
+        db.Index('ix_pokemon_usuario_favorito_inclusao', 'IDUsuario', 'Favorito', 'DtInclusao'),
+        db.Index('ix_pokemon_usuario_favorito_codigo', 'IDUsuario', 'Favorito', db.cast(db.text('"Codigo"'), db.Integer)),
     )
 
     def __repr__(self):
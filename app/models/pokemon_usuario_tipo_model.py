@@ -0,0 +1,26 @@
+from app import db
+
+class PokemonUsuarioTipoModel(db.Model):
+    """
+    Define o modelo de dados para a tabela 'PokemonUsuarioTipo'.
+    Associação N..N entre os Pokémon do usuário e todos os seus tipos
+    (PokemonUsuario.IDTipoPokemon guarda apenas o primeiro).
+    """
+    __tablename__ = 'PokemonUsuarioTipo'
+
+    # IDPokemonUsuario INT (chave estrangeira para 'PokemonUsuario')
+    id_pokemon_usuario = db.Column('IDPokemonUsuario', db.Integer, db.ForeignKey('PokemonUsuario.IDPokemonUsuario', ondelete='CASCADE'), primary_key=True)
+
+    # IDTipoPokemon INT (chave estrangeira para 'TipoPokemon')
+    id_tipo_pokemon = db.Column('IDTipoPokemon', db.Integer, db.ForeignKey('TipoPokemon.IDTipoPokemon'), primary_key=True)
+
+    # Ordem INT (1 = tipo primário, 2 = secundário)
+    ordem = db.Column('Ordem', db.Integer, nullable=False, default=1)
+
+    # Filtro por tipo: parte do tipo para chegar aos registros
+    __table_args__ = (
+        db.Index('ix_pokemon_usuario_tipo_tipo', 'IDTipoPokemon', 'IDPokemonUsuario'),
+    )
+
+    def __repr__(self):
+        return f"<PokemonUsuarioTipoModel Registro: {self.id_pokemon_usuario}, Tipo: {self.id_tipo_pokemon}>"
@@ -0,0 +1,27 @@
+from app import db
+from datetime import datetime
+
+class TokenRevogadoModel(db.Model):
+    """
+    Define o modelo de dados para a tabela 'TokenRevogado'.
+    Tokens JWT revogados (logout) até a data em que expirariam; depois disso a
+    própria assinatura do token já o recusa e a linha pode ser removida.
+    """
+    __tablename__ = 'TokenRevogado'
+
+    # IDTokenRevogado INT PrimaryKey (crescente: usado para buscar só as revogações novas)
+    id_token_revogado = db.Column('IDTokenRevogado', db.Integer, primary_key=True)
+
+    # JTI VARCHAR (identificador único do token, claim 'jti')
+    jti = db.Column('JTI', db.String(64), nullable=False, unique=True)
+
+    # IDUsuario INT ForeignKey (dono do token)
+    id_usuario = db.Column('IDUsuario', db.Integer, db.ForeignKey('Usuario.IDUsuario'), nullable=False)
+
+    # ExpiraEm DATETIME (claim 'exp' do token, em UTC)
+    expira_em = db.Column('ExpiraEm', db.DateTime, nullable=False, index=True)
+
+    dt_inclusao = db.Column('DtInclusao', db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<TokenRevogadoModel JTI: {self.jti}, Usuário: {self.id_usuario}>"
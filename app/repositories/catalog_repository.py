@@ -0,0 +1,85 @@
+
+from app import db
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+from app.models.geracao_pokemon_model import GeracaoPokemonModel
+from typing import Dict, List, Set, Tuple
+
+class CatalogRepository:
+    """
+    Repositório do catálogo local de Pokémon (snapshot da PokeAPI).
+    Responsabilidade: Comunicação direta com a tabela 'CatalogoPokemon'.
+    """
+
+    @staticmethod
+    def get_by_names(names: List[str]) -> List[CatalogoPokemonModel]:
+        """Busca, em uma única consulta SQL, os registros do catálogo com os nomes informados."""
+        if not names:
+            return []
+        return CatalogoPokemonModel.query.filter(CatalogoPokemonModel.nome.in_(names)).all()
+
+    @staticmethod
+    def get_all_names() -> List[str]:
+        """Retorna todos os nomes do catálogo, ordenados pelo ID."""
+        rows = db.session.query(CatalogoPokemonModel.nome).order_by(CatalogoPokemonModel.id_pokemon).all()
+        return [row[0] for row in rows]
+
+    @staticmethod
+    def find_by_code(pokemon_code: str) -> CatalogoPokemonModel or None: # type: ignore
+        """Busca um Pokémon do catálogo pelo código (ID numérico ou nome/slug)."""
+        if pokemon_code.isdigit():
+            return db.session.get(CatalogoPokemonModel, int(pokemon_code))
+        return CatalogoPokemonModel.query.filter_by(nome=pokemon_code.lower()).first()
+
+    @staticmethod
+    def find_by_codes(pokemon_codes: List[str]) -> Dict[str, CatalogoPokemonModel]:
+        """
+        Busca vários Pokémon do catálogo (por ID numérico ou nome) em uma única consulta.
+        Retorna um dicionário código -> registro.
+        """
+        ids = [int(code) for code in pokemon_codes if code.isdigit()]
+        names = [code.lower() for code in pokemon_codes if not code.isdigit()]
+        if not ids and not names:
+            return {}
+        rows = CatalogoPokemonModel.query.filter(
+            db.or_(CatalogoPokemonModel.id_pokemon.in_(ids), CatalogoPokemonModel.nome.in_(names))
+        ).all()
+
+        found = {}
+        for row in rows:
+            found[str(row.id_pokemon)] = row
+            found[row.nome] = row
+        return {code: found[code.lower()] for code in pokemon_codes if code.lower() in found}
+
+    @staticmethod
+    def get_existing_names() -> Set[str]:
+        """Retorna os nomes já presentes no catálogo (checkpoint da sincronização)."""
+        return {row[0] for row in db.session.query(CatalogoPokemonModel.nome).all()}
+
+    @staticmethod
+    def save_all(entries: List[CatalogoPokemonModel]) -> int:
+        """Prepara um lote de registros do catálogo (confirmado pela unidade de trabalho)."""
+        db.session.add_all(entries)
+        return len(entries)
+
+    @staticmethod
+    def get_names_by_id() -> Dict[int, str]:
+        """Mapeia ID -> nome para todo o catálogo."""
+        rows = db.session.query(CatalogoPokemonModel.id_pokemon, CatalogoPokemonModel.nome).all()
+        return {row[0]: row[1] for row in rows}
+
+    # Funções para o índice de gerações
+
+    @staticmethod
+    def get_generation_members() -> List[Tuple[int, str]]:
+        """Retorna os pares (geração, nome), ordenados pela geração e pelo ID do Pokémon."""
+        rows = db.session.query(GeracaoPokemonModel.id_geracao, GeracaoPokemonModel.nome).order_by(
+            GeracaoPokemonModel.id_geracao, GeracaoPokemonModel.id_pokemon
+        ).all()
+        return [(row[0], row[1]) for row in rows]
+
+    @staticmethod
+    def replace_generation_members(members: List[GeracaoPokemonModel]) -> int:
+        """Substitui todo o índice de gerações (confirmado pela unidade de trabalho)."""
+        GeracaoPokemonModel.query.delete()
+        db.session.add_all(members)
+        return len(members)
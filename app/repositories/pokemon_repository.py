@@ -1,9 +1,24 @@
 
-import requests
+from flask import current_app
+from sqlalchemy import Integer, cast, func, select, tuple_, update
 from app import db
+from app.external.poke_api_client import PokeAPIClient
 from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.equipe_batalha_contador_model import EquipeBatalhaContadorModel
+from app.repositories.sql_helpers import insert_or_ignore
 from app.models.tipo_pokemon_model import TipoPokemonModel
-from typing import List
+from app.models.pokemon_usuario_tipo_model import PokemonUsuarioTipoModel
+from app.repositories.tipo_pokemon_cache import TipoPokemonCache
+from app.repositories.unit_of_work import on_commit
+from typing import Any, Dict, List, Tuple
+
+# Colunas de ordenação aceitas na paginação dos favoritos (ver os índices do modelo)
+FAVORITE_SORT_COLUMNS = {
+    'added': PokemonUsuarioModel.dt_inclusao,
+    'name': PokemonUsuarioModel.nome,
+    'id': cast(PokemonUsuarioModel.codigo, Integer),
+}
+
 
 class PokemonRepository:
     """
@@ -12,6 +27,14 @@ class PokemonRepository:
     Responsabilidade: Comunicação direta com o banco de dados.
     """
 
+    def __init__(self, api_client: PokeAPIClient = None):
+        """
+        Args:
+            api_client: Cliente da PokeAPI compartilhado (com cache) usado para
+                buscar os dados de Pokémon que ainda não estão no BD.
+        """
+        self.api_client = api_client or PokeAPIClient()
+
     @staticmethod
     def get_pokemon_by_user_and_code(user_id: int, pokemon_code: str) -> PokemonUsuarioModel or None: # type: ignore
         """Busca um registro de Pokémon de um usuário específico pelo seu código/ID."""
@@ -20,6 +43,20 @@ class PokemonRepository:
             codigo=pokemon_code
         ).first()
 
+    @staticmethod
+    def get_user_states_by_codes(user_id: int, pokemon_codes: List[str]) -> Dict[str, PokemonUsuarioModel]:
+        """
+        Busca, em uma única consulta, os registros do usuário para um conjunto de códigos.
+        Retorna um dicionário código -> registro (códigos sem registro ficam de fora).
+        """
+        if not pokemon_codes:
+            return {}
+        rows = PokemonUsuarioModel.query.filter(
+            PokemonUsuarioModel.id_usuario == user_id,
+            PokemonUsuarioModel.codigo.in_(pokemon_codes)
+        ).all()
+        return {row.codigo: row for row in rows}
+
     @staticmethod
     def get_user_battle_team_count(user_id: int) -> int:
         """Conta quantos Pokémon um usuário tem no Grupo de Batalha (GrupoBatalha = True)."""
@@ -28,31 +65,121 @@ class PokemonRepository:
             grupo_batalha=True
         ).count()
 
+    # Funções do contador da Equipe de Batalha
+
+    @staticmethod
+    def _create_battle_team_counter(user_id: int) -> bool:
+        """
+        Cria a linha do contador com a contagem atual do time (usuários que já
+        tinham time antes do contador existir). Retorna False se ela já existia.
+        """
+        current_count = select(func.count()).select_from(PokemonUsuarioModel).where(
+            PokemonUsuarioModel.id_usuario == user_id,
+            PokemonUsuarioModel.grupo_batalha == True
+        ).scalar_subquery()
+        return insert_or_ignore(EquipeBatalhaContadorModel, {'id_usuario': user_id, 'quantidade': current_count})
+
+    @staticmethod
+    def get_battle_team_counter(user_id: int) -> int:
+        """Tamanho atual do time, lido da linha do contador (criada se preciso)."""
+        query = select(EquipeBatalhaContadorModel.quantidade).where(EquipeBatalhaContadorModel.id_usuario == user_id)
+        quantidade = db.session.execute(query).scalar()
+        if quantidade is None:
+            PokemonRepository._create_battle_team_counter(user_id)
+            quantidade = db.session.execute(query).scalar()
+        return quantidade
+
+    @staticmethod
+    def adjust_battle_team_counter(user_id: int, delta: int, limit: int) -> bool:
+        """
+        Soma `delta` ao contador do time com um único UPDATE condicional, que só
+        afeta a linha se o resultado ficar entre 0 e `limit`. O teste e a escrita são
+        atômicos no banco: duas requisições simultâneas nunca passam do limite.
+
+        Deve ser chamado antes de alterar os registros de PokemonUsuario (a contagem
+        inicial do contador, se ele ainda não existir, usa o estado atual do time).
+
+        Returns:
+            True se o contador foi atualizado; False se o limite seria violado.
+        """
+        if delta == 0:
+            return True
+        counter = EquipeBatalhaContadorModel
+        stmt = update(counter).where(
+            counter.id_usuario == user_id,
+            counter.quantidade + delta <= limit,
+            counter.quantidade + delta >= 0
+        ).values(quantidade=counter.quantidade + delta).execution_options(synchronize_session=False)
+
+        if db.session.execute(stmt).rowcount == 1:
+            return True
+        # Nenhuma linha afetada: limite atingido ou o contador ainda não existe
+        if PokemonRepository._create_battle_team_counter(user_id):
+            return db.session.execute(stmt).rowcount == 1
+        return False
+
     @staticmethod
     def save(pokemon_usuario: PokemonUsuarioModel) -> PokemonUsuarioModel:
-        """Salva ou atualiza um registro de PokemonUsuario no banco de dados."""
+        """
+        Salva ou atualiza um registro de PokemonUsuario no banco de dados.
+        A alteração é confirmada pela unidade de trabalho (ver `unit_of_work`).
+        """
         db.session.add(pokemon_usuario)
-        db.session.commit()
         return pokemon_usuario
 
     @staticmethod
     def delete(pokemon_usuario: PokemonUsuarioModel):
-        """Remove um registro de PokemonUsuario do banco de dados."""
+        """
+        Remove um registro de PokemonUsuario do banco de dados.
+        A remoção é confirmada pela unidade de trabalho (ver `unit_of_work`).
+        """
         db.session.delete(pokemon_usuario)
-        db.session.commit()
 
     # Funções para Tipos de Pokémon 
 
     @staticmethod
-    def find_or_create_type(description: str) -> TipoPokemonModel:
-        """Busca um tipo de Pokémon pela descrição ou o cria se não existir."""
-        tipo = TipoPokemonModel.query.filter_by(descricao=description).first()
-        if not tipo:
-            # Cria um novo tipo se não for encontrado
-            tipo = TipoPokemonModel(descricao=description)
-            db.session.add(tipo)
-            db.session.commit()
-        return tipo
+    def load_type_cache() -> TipoPokemonCache:
+        """
+        Carrega todos os tipos do BD na tabela em memória da aplicação atual.
+        Chamado no primeiro uso (ver `get_or_create_type_id`).
+        """
+        cache = TipoPokemonCache()
+        cache.load(db.session.query(TipoPokemonModel.descricao, TipoPokemonModel.id_tipo_pokemon).all())
+        current_app.extensions['tipo_pokemon_cache'] = cache
+        return cache
+
+    @staticmethod
+    def get_or_create_type_id(description: str) -> int:
+        """
+        Retorna o ID do tipo pela tabela em memória; só consulta o BD para um tipo novo.
+        A criação é um upsert (INSERT ... ON CONFLICT DO NOTHING seguido do SELECT),
+        seguro quando duas requisições criam o mesmo tipo ao mesmo tempo. O novo ID
+        só entra na tabela em memória depois do commit.
+        """
+        cache = current_app.extensions.get('tipo_pokemon_cache') or PokemonRepository.load_type_cache()
+        type_id = cache.get(description)
+        if type_id is not None:
+            return type_id
+
+        insert_or_ignore(TipoPokemonModel, {'descricao': description})
+        type_id = db.session.execute(
+            select(TipoPokemonModel.id_tipo_pokemon).where(TipoPokemonModel.descricao == description)
+        ).scalar_one()
+        on_commit(lambda: cache.add(description, type_id))
+        return type_id
+
+    @staticmethod
+    def assign_types(pokemon_usuario: PokemonUsuarioModel, descriptions: List[str]):
+        """
+        Associa todos os tipos ao registro (tabela 'PokemonUsuarioTipo');
+        o primeiro também vai para a coluna IDTipoPokemon.
+        """
+        type_ids = list(dict.fromkeys(PokemonRepository.get_or_create_type_id(d) for d in descriptions))
+        pokemon_usuario.id_tipo_pokemon = type_ids[0]
+        pokemon_usuario.tipos = [
+            PokemonUsuarioTipoModel(id_tipo_pokemon=type_id, ordem=position)
+            for position, type_id in enumerate(type_ids, start=1)
+        ]
 
     @staticmethod
     def get_user_favorite_pokemons(user_id: int) -> List[PokemonUsuarioModel]:
@@ -62,6 +189,57 @@ class PokemonRepository:
             favorito=True
         ).all()
 
+    @staticmethod
+    def get_user_favorites_page(user_id: int, limit: int, sort: str = 'added', descending: bool = False,
+                                after: Tuple[Any, int] = None, type_description: str = None,
+                                name_prefix: str = None) -> List[PokemonUsuarioModel]:
+        """
+        Busca uma página dos favoritos do usuário com paginação por cursor (keyset).
+
+        A página seguinte parte da chave (valor da ordenação, IDPokemonUsuario) do
+        último item da anterior, em vez de um OFFSET: o custo não cresce com a
+        profundidade da página. Cada ordenação tem um índice próprio em
+        (IDUsuario, Favorito, <coluna>), que já entrega as linhas na ordem.
+
+        Args:
+            limit: Itens por página. São retornados até `limit + 1` registros;
+                o extra indica que existe uma próxima página.
+            sort: 'added' (data de inclusão), 'name' ou 'id' (código do Pokémon).
+            descending: Ordem decrescente.
+            after: Chave (valor, IDPokemonUsuario) do último item da página anterior.
+            type_description: Filtra pelo tipo (primário ou secundário), ex.: 'Fire'.
+            name_prefix: Filtra pelo início do nome (sem diferenciar maiúsculas).
+        """
+        sort_column = FAVORITE_SORT_COLUMNS[sort]
+        tiebreaker = PokemonUsuarioModel.id_pokemon_usuario
+        query = PokemonUsuarioModel.query.filter(
+            PokemonUsuarioModel.id_usuario == user_id,
+            PokemonUsuarioModel.favorito == True
+        )
+
+        if type_description:
+            cache = current_app.extensions.get('tipo_pokemon_cache') or PokemonRepository.load_type_cache()
+            type_id = cache.get(type_description)
+            if type_id is None:
+                return []
+            query = query.join(
+                PokemonUsuarioTipoModel,
+                PokemonUsuarioTipoModel.id_pokemon_usuario == PokemonUsuarioModel.id_pokemon_usuario
+            ).filter(PokemonUsuarioTipoModel.id_tipo_pokemon == type_id)
+
+        if name_prefix:
+            query = query.filter(PokemonUsuarioModel.nome.istartswith(name_prefix, autoescape=True))
+
+        if after is not None:
+            key = tuple_(sort_column, tiebreaker)
+            query = query.filter(key < tuple_(*after) if descending else key > tuple_(*after))
+
+        if descending:
+            query = query.order_by(sort_column.desc(), tiebreaker.desc())
+        else:
+            query = query.order_by(sort_column, tiebreaker)
+        return query.limit(limit + 1).all()
+
     @staticmethod
     def get_user_battle_team(user_id: int) -> List[PokemonUsuarioModel]:
         """Busca a equipe de batalha do usuário."""
@@ -70,44 +248,34 @@ class PokemonRepository:
             grupo_batalha=True
         ).all()
     
-    @staticmethod
-    def get_pokemon_details_from_api(pokemon_code: str) -> dict:
-        """Busca os detalhes do Pokémon na PokeAPI usando seu código (slug)."""
-        
-        # 1. Tente buscar na PokeAPI
-        url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_code}"
-        
-        try:
-            response = requests.get(url, timeout=5)
-            response.raise_for_status() # Lança erro para 4xx/5xx
-            data = response.json()
-            
-            # 2. Mapeie os dados para o formato esperado pela sua função save
-            return {
-                "nome": data['name'].capitalize(),
-                "imagem_uri": data['sprites']['other']['official-artwork']['front_default'],
-                "tipos": [t['type']['name'].capitalize() for t in data['types']],
-            }
-            
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 404:
-                raise ValueError(f"Pokémon '{pokemon_code}' não encontrado na PokeAPI.")
-            raise Exception(f"Erro ao buscar na PokeAPI: {e}")
-        except Exception as e:
-            raise Exception(f"Falha na comunicação com a PokeAPI: {e}")
-        
+    def get_pokemon_details_from_api(self, pokemon_code: str) -> dict:
+        """
+        Busca os detalhes do Pokémon na PokeAPI usando seu código (slug).
+        A chamada passa pelo PokeAPIClient, reaproveitando o cache local.
+        """
+        data = self.api_client.get_pokemon_details(pokemon_code)
+
+        if not data:
+            raise ValueError(f"Pokémon '{pokemon_code}' não encontrado na PokeAPI.")
+
+        # Mapeie os dados para o formato esperado pela sua função save
+        return {
+            "nome": data['name'].capitalize(),
+            "imagem_uri": data['sprites']['other']['official-artwork']['front_default'],
+            "tipos": [t['type']['name'].capitalize() for t in data['types']],
+        }
 
     @staticmethod
     def clear_user_battle_team(user_id: int) -> int:
         """
         Define 'grupo_batalha' como False para todos os Pokémon de um usuário.
-        Retorna a contagem de linhas atualizadas.
+        Retorna a contagem de linhas atualizadas (confirmadas pela unidade de trabalho).
         """
         rows_updated = PokemonUsuarioModel.query.filter_by(
             id_usuario=user_id,
             grupo_batalha=True
         ).update({PokemonUsuarioModel.grupo_batalha: False})
-        
-        # IMPORTANTE: Confirma a transação
-        db.session.commit()
+        EquipeBatalhaContadorModel.query.filter_by(id_usuario=user_id).update(
+            {EquipeBatalhaContadorModel.quantidade: 0}
+        )
         return rows_updated
\ No newline at end of file
@@ -0,0 +1,63 @@
+
+from typing import List
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from app import db
+
+
+def _dialect_insert():
+    """O `insert` do dialeto atual quando ele suporta ON CONFLICT DO NOTHING, senão None."""
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+def insert_or_ignore(model, values: dict) -> bool:
+    """
+    Insere uma linha ignorando conflito de chave/unicidade (outra requisição pode
+    ter inserido a mesma linha ao mesmo tempo).
+
+    Usa `INSERT ... ON CONFLICT DO NOTHING` no SQLite e no PostgreSQL; nos demais
+    bancos tenta o INSERT dentro de um SAVEPOINT e descarta o IntegrityError.
+
+    Returns:
+        True se a linha foi inserida, False se já existia.
+    """
+    dialect_insert = _dialect_insert()
+    if dialect_insert is None:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(model).values(**values))
+            return True
+        except IntegrityError:
+            return False
+
+    result = db.session.execute(dialect_insert(model).values(**values).on_conflict_do_nothing())
+    return result.rowcount == 1
+
+
+def insert_many_or_ignore(model, rows: List[dict]) -> int:
+    """
+    Insere várias linhas em um único `executemany`, ignorando as que conflitarem
+    com chaves/unicidades existentes (ver `insert_or_ignore`).
+    Os valores padrão das colunas (ex.: datas) são aplicados pelo SQLAlchemy.
+
+    Returns:
+        Quantas linhas foram inseridas.
+    """
+    if not rows:
+        return 0
+    dialect_insert = _dialect_insert()
+    if dialect_insert is None:
+        return sum(insert_or_ignore(model, row) for row in rows)
+
+    # INSERT do Core (nomes das colunas no BD): o executemany informa as linhas inseridas
+    columns = model.__mapper__.columns
+    rows = [{columns[key].name: value for key, value in row.items()} for row in rows]
+    result = db.session.execute(dialect_insert(model.__table__).on_conflict_do_nothing(), rows)
+    return result.rowcount
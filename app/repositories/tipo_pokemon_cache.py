@@ -0,0 +1,31 @@
+
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+
+class TipoPokemonCache:
+    """
+    Tabela em memória descrição -> IDTipoPokemon. Existem poucos tipos (~18) e
+    eles nunca mudam de ID: depois de carregada, a tabela evita o SELECT em
+    'TipoPokemon' a cada novo favorito/membro do time.
+    Só recebe IDs de tipos já confirmados no banco (ver `on_commit`).
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def load(self, pairs: Iterable[Tuple[str, int]]):
+        """Carrega os pares (descrição, ID) lidos do banco."""
+        with self._lock:
+            self._ids.update(pairs)
+
+    def get(self, description: str) -> Optional[int]:
+        return self._ids.get(description)
+
+    def add(self, description: str, type_id: int):
+        with self._lock:
+            self._ids[description] = type_id
+
+    def __len__(self):
+        return len(self._ids)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from app import db
+from app.models.token_revogado_model import TokenRevogadoModel
+from app.repositories.sql_helpers import insert_or_ignore
+from typing import List, Tuple
+
+class TokenRepository:
+    """
+    Repositório dos tokens JWT revogados.
+    Responsabilidade: Comunicação direta com a tabela 'TokenRevogado'.
+    """
+
+    @staticmethod
+    def revoke(jti: str, user_id: int, expires_at: datetime) -> bool:
+        """Registra a revogação (idempotente). Confirmado pela unidade de trabalho."""
+        return insert_or_ignore(TokenRevogadoModel, {'jti': jti, 'id_usuario': user_id, 'expira_em': expires_at})
+
+    @staticmethod
+    def is_revoked(jti: str, now: datetime) -> bool:
+        """Consulta exata (pela chave única) se o token está revogado e ainda não expirou."""
+        return db.session.query(TokenRevogadoModel.id_token_revogado).filter(
+            TokenRevogadoModel.jti == jti, TokenRevogadoModel.expira_em > now
+        ).first() is not None
+
+    @staticmethod
+    def get_active_since(last_id: int, now: datetime) -> List[Tuple[int, str]]:
+        """Revogações ainda válidas com ID maior que `last_id`, como pares (id, jti)."""
+        return db.session.query(TokenRevogadoModel.id_token_revogado, TokenRevogadoModel.jti).filter(
+            TokenRevogadoModel.id_token_revogado > last_id, TokenRevogadoModel.expira_em > now
+        ).order_by(TokenRevogadoModel.id_token_revogado).all()
+
+    @staticmethod
+    def count_active(now: datetime) -> int:
+        """Quantidade de revogações ainda válidas."""
+        return db.session.query(TokenRevogadoModel.id_token_revogado).filter(TokenRevogadoModel.expira_em > now).count()
+
+    @staticmethod
+    def purge_expired(now: datetime) -> int:
+        """Remove as revogações de tokens já expirados. Confirmado pela unidade de trabalho."""
+        return db.session.query(TokenRevogadoModel).filter(
+            TokenRevogadoModel.expira_em <= now
+        ).delete(synchronize_session=False)
@@ -0,0 +1,78 @@
+
+from contextlib import contextmanager
+from app import db
+
+# Marca, na sessão, que já existe uma unidade de trabalho aberta
+_ACTIVE_KEY = 'unit_of_work_active'
+# Funções a executar somente depois de um commit bem-sucedido
+_CALLBACKS_KEY = 'unit_of_work_on_commit'
+
+
+def on_commit(callback):
+    """
+    Agenda `callback` para depois do commit da unidade de trabalho atual
+    (descartado se ela for desfeita). Usado para atualizar caches em memória
+    somente com dados que de fato foram gravados.
+    Fora de uma unidade de trabalho, executa imediatamente.
+    """
+    session = db.session()
+    if session.info.get(_ACTIVE_KEY):
+        session.info.setdefault(_CALLBACKS_KEY, []).append(callback)
+    else:
+        callback()
+
+
+@contextmanager
+def unit_of_work(immediate: bool = False):
+    """
+    Unidade de trabalho: os repositórios apenas preparam as alterações e aqui
+    acontece um único commit (ou rollback, se algo falhar) para toda a operação.
+
+    Unidades aninhadas são absorvidas pela mais externa, que é a única a confirmar.
+
+    Args:
+        immediate: No SQLite, abre a transação com BEGIN IMMEDIATE, reservando a
+            escrita já na primeira leitura. Usado quando uma leitura decide uma
+            escrita (ex.: contagem do time antes do insert), para que duas
+            requisições simultâneas não leiam o mesmo valor.
+    """
+    session = db.session() # sessão real (db.session é um proxy por contexto)
+    if session.info.get(_ACTIVE_KEY):
+        yield session
+        return
+
+    if session.in_transaction() and not (session.new or session.dirty or session.deleted):
+        # Encerra a transação apenas de leitura aberta antes (sem nada a confirmar),
+        # para que a unidade comece com uma transação própria.
+        session.rollback()
+    if immediate and not session.in_transaction():
+        session.connection(execution_options={'sqlite_begin': 'IMMEDIATE'})
+
+    session.info[_ACTIVE_KEY] = True
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.info.pop(_ACTIVE_KEY, None)
+        callbacks = session.info.pop(_CALLBACKS_KEY, [])
+
+    for callback in callbacks:
+        callback()
+
+
+def release_connection():
+    """
+    Encerra a transação apenas de leitura da sessão atual e devolve a conexão
+    ao pool (a sessão continua utilizável e abre outra na próxima consulta).
+    Usado antes de esperas longas fora do BD (ex.: a PokeAPI em uma view
+    assíncrona), para que requisições em espera não prendam conexões.
+    Não faz nada se houver alterações pendentes ou uma unidade de trabalho aberta.
+    """
+    session = db.session()
+    if session.info.get(_ACTIVE_KEY) or session.new or session.dirty or session.deleted:
+        return
+    if session.in_transaction():
+        session.rollback()
@@ -1,6 +1,8 @@
 
 from app import db
 from app.models.user_model import UsuarioModel
+from app.repositories.sql_helpers import insert_many_or_ignore
+from typing import Dict, Iterable, List, Set, Tuple
 
 class UserRepository:
     """
@@ -10,9 +12,8 @@ class UserRepository:
 
     @staticmethod
     def save(user: UsuarioModel) -> UsuarioModel:
-        """Salva um novo objeto UsuarioModel no banco de dados."""
+        """Salva um novo objeto UsuarioModel no banco de dados (confirmado pela unidade de trabalho)."""
         db.session.add(user)
-        db.session.commit()
         return user
 
     @staticmethod
@@ -25,4 +26,34 @@ class UserRepository:
         """Busca um usuário pelo campo de email (VARCHAR)[cite: 65]."""
         return UsuarioModel.query.filter_by(email=email).first()
 
-   
\ No newline at end of file
+   
+    @staticmethod
+    def find_taken(login: str, email: str) -> Tuple[bool, bool]:
+        """
+        Verifica, em uma única consulta, se o login e/ou o email já estão em uso.
+        Retorna (login em uso, email em uso).
+        """
+        rows = db.session.query(UsuarioModel.login, UsuarioModel.email).filter(
+            db.or_(UsuarioModel.login == login, UsuarioModel.email == email)
+        ).limit(2).all()
+        return any(row.login == login for row in rows), any(row.email == email for row in rows)
+
+    @staticmethod
+    def find_existing(logins: Iterable[str], emails: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+        """Dentre os logins e emails informados, retorna (logins, emails) já cadastrados, em uma consulta."""
+        logins, emails = list(logins), list(emails)
+        if not logins and not emails:
+            return set(), set()
+        rows = db.session.query(UsuarioModel.login, UsuarioModel.email).filter(
+            db.or_(UsuarioModel.login.in_(logins), UsuarioModel.email.in_(emails))
+        ).all()
+        return {row.login for row in rows}, {row.email for row in rows}
+
+    @staticmethod
+    def insert_many(users: List[Dict[str, str]]) -> int:
+        """
+        Insere vários usuários (dicionários com nome, login, email e senha já em hash)
+        em um único INSERT em lote, ignorando logins/emails que já existirem.
+        Retorna quantos foram inseridos (confirmado pela unidade de trabalho).
+        """
+        return insert_many_or_ignore(UsuarioModel, users)
@@ -0,0 +1,46 @@
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom: responde "com certeza não está" ou "talvez esteja",
+    usando poucos bits por item. Não há remoção; para descartar itens o
+    filtro é recriado.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Quantidade de itens prevista.
+            error_rate: Taxa de falsos positivos desejada com `capacity` itens.
+        """
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        # Tamanho ótimo: m = -n ln(p) / (ln 2)^2 bits e k = (m / n) ln 2 funções de hash
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Hashing duplo (Kirsch–Mitzenmacher): k posições a partir de dois hashes de 64 bits
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def is_full(self) -> bool:
+        """Indica se já passou da capacidade (a taxa de falsos positivos começa a subir)."""
+        return self.count > self.capacity
@@ -0,0 +1,136 @@
+
+import threading
+import time
+from typing import Any, Dict, Optional
+from app.external.response_cache import MemoryLRUCache
+
+
+class InMemoryCacheBackend:
+    """
+    Backend de cache local ao processo: LRU limitado em bytes para os valores
+    e um dicionário à parte para os contadores (que nunca são removidos pelo LRU).
+    Cada worker do gunicorn tem o seu, então só é coerente com um único processo.
+    """
+
+    def __init__(self, max_bytes: int):
+        self._entries = MemoryLRUCache(max_bytes)
+        self._counters: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._entries.set(key, value, len(value), time.time() + ttl)
+
+    def get_counter(self, key: str) -> int:
+        return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, 0) + 1
+            self._counters[key] = value
+            return value
+
+    def add(self, key: str, value: str) -> str:
+        """Grava `value` apenas se a chave ainda não existir; retorna o valor vigente."""
+        with self._lock:
+            return self._counters.setdefault(key, value)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'bytes': self._entries.current_bytes,
+            'evictions': self._entries.evictions,
+        }
+
+
+class RedisCacheBackend:
+    """
+    Backend de cache compartilhado entre processos, sobre qualquer servidor
+    compatível com o protocolo Redis (Redis, Valkey, KeyDB...).
+    Todos os workers enxergam as mesmas versões e as mesmas listas.
+
+    Os contadores são gravados sem TTL: configure o servidor com uma política
+    que só remova chaves com TTL (ex.: `volatile-lru`), como as listas.
+    """
+
+    def __init__(self, client, prefix: str = 'pokedex:'):
+        """
+        Args:
+            client: Cliente no formato do `redis-py` (get/set/incr).
+            prefix: Prefixo das chaves, para compartilhar o servidor com outras aplicações.
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(self.prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self.client.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    def get_counter(self, key: str) -> int:
+        value = self.client.get(self.prefix + key)
+        return int(value) if value is not None else 0
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def add(self, key: str, value: str) -> str:
+        """Grava `value` apenas se a chave ainda não existir; retorna o valor vigente."""
+        current = self.client.get(self.prefix + key)
+        if current is None:
+            self.client.set(self.prefix + key, value, nx=True)
+            current = self.client.get(self.prefix + key) or value
+        return current.decode() if isinstance(current, bytes) else current
+
+    def get_stats(self) -> Dict[str, int]:
+        return {}
+
+
+def create_cache_backend(config):
+    """
+    Cria o backend a partir da configuração: Redis quando USER_CACHE_REDIS_URL
+    estiver definida (requer o pacote `redis`), senão o cache em memória.
+    """
+    redis_url = config.get('USER_CACHE_REDIS_URL')
+    if not redis_url:
+        return InMemoryCacheBackend(config['USER_CACHE_MEMORY_BYTES'])
+
+    try:
+        import redis
+    except ImportError as e:
+        raise RuntimeError("USER_CACHE_REDIS_URL está definida, mas o pacote 'redis' não está instalado.") from e
+    return RedisCacheBackend(redis.Redis.from_url(redis_url))
+
+
+
+def check_worker_setup(config, workers: int = None):
+    """
+    Recusa subir com o cache em memória e mais de um worker: cada processo teria
+    suas próprias listas e versões de ETag e continuaria servindo dados alterados
+    por outro worker.
+
+    A aplicação só enxerga os workers por WEB_CONCURRENCY (que o gunicorn e o
+    uvicorn usam como padrão de --workers). O gunicorn.conf.py também checa o
+    número real do gunicorn (`-w N`); no uvicorn, use WEB_CONCURRENCY em vez de --workers.
+
+    Args:
+        config: Configuração da aplicação (USER_CACHE_REDIS_URL e WEB_CONCURRENCY).
+        workers: Número de workers informado pelo servidor (padrão: WEB_CONCURRENCY).
+
+    Raises:
+        RuntimeError: Se houver mais de um worker sem USER_CACHE_REDIS_URL.
+    """
+    if workers is None:
+        workers = config.get('WEB_CONCURRENCY', 1)
+    if workers > 1 and not config.get('USER_CACHE_REDIS_URL'):
+        raise RuntimeError(
+            f"{workers} workers, mas o cache de usuários está em memória (por processo). "
+            "Defina USER_CACHE_REDIS_URL para compartilhá-lo entre os workers ou use um único worker. "
+            "Informe os workers por WEB_CONCURRENCY (o uvicorn --workers não é visível para a aplicação)."
+        )
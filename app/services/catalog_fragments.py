@@ -0,0 +1,57 @@
+
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class PokemonFragment:
+    """
+    Um Pokémon da listagem já serializado em JSON, sem o status do usuário.
+    O objeto fica "aberto" (sem o '}' final) para receber os campos
+    `is_favorite`/`in_battle_team` por concatenação de bytes.
+    """
+
+    __slots__ = ('codigo', 'prefix')
+
+    # (is_favorite, in_battle_team) -> fim do objeto
+    _SUFFIXES = {
+        (favorite, team): b',"in_battle_team":' + (b'true' if team else b'false')
+                          + b',"is_favorite":' + (b'true' if favorite else b'false') + b'}'
+        for favorite in (False, True) for team in (False, True)
+    }
+
+    def __init__(self, codigo: str, prefix: bytes):
+        self.codigo = codigo
+        self.prefix = prefix
+
+    def render(self, is_favorite: bool, in_battle_team: bool) -> bytes:
+        """Fecha o objeto com o status do usuário."""
+        return self.prefix + self._SUFFIXES[(bool(is_favorite), bool(in_battle_team))]
+
+
+class CatalogFragmentCache:
+    """
+    Fragmentos JSON dos Pokémon da listagem, por nome. Os dados do catálogo
+    (nome, tipos, imagem, stats) não mudam, então cada Pokémon é serializado
+    uma única vez e as páginas seguintes são montadas com os bytes prontos.
+    """
+
+    def __init__(self, dumps_bytes: Callable[[Any], bytes]):
+        """
+        Args:
+            dumps_bytes: Serializador (o `dumps_bytes` do provider de JSON da aplicação).
+        """
+        self._dumps_bytes = dumps_bytes
+        self._fragments: Dict[str, PokemonFragment] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Optional[PokemonFragment]:
+        return self._fragments.get(name)
+
+    def add(self, name: str, pokemon_data: Dict[str, Any]) -> PokemonFragment:
+        """Serializa os dados de um Pokémon (formato de `PokemonRecord.to_dict`) e guarda."""
+        fragment = PokemonFragment(pokemon_data['codigo'], self._dumps_bytes(pokemon_data)[:-1])
+        with self._lock:
+            return self._fragments.setdefault(name, fragment)
+
+    def __len__(self):
+        return len(self._fragments)
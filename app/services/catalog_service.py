@@ -0,0 +1,136 @@
+
+from flask import current_app
+from app.external.concurrent_fetcher import ConcurrentFetcher
+from app.external.poke_api_client import PokeAPIClient
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+from app.models.geracao_pokemon_model import GeracaoPokemonModel
+from app.repositories.catalog_repository import CatalogRepository
+from app.repositories.unit_of_work import on_commit, unit_of_work
+from typing import Any, Callable, Dict
+
+
+class CatalogService:
+    """
+    Camada de Serviço para o catálogo local de Pokémon.
+    Faz a ingestão completa da PokeAPI para a tabela 'CatalogoPokemon'
+    e monta o índice de gerações ('GeracaoPokemon').
+    """
+
+    def __init__(self, api_client: PokeAPIClient = None):
+        """Inicializa o serviço com o cliente da API e o repositório do catálogo."""
+        self.api_client = api_client or PokeAPIClient()
+        self.catalog_repo = CatalogRepository()
+
+    def _build_catalog_entry(self, raw_data: Dict[str, Any]) -> CatalogoPokemonModel:
+        """Normaliza o JSON de detalhes da PokeAPI em um registro do catálogo."""
+        tipos = [t['type']['name'].capitalize() for t in raw_data.get('types', [])]
+        entry = CatalogoPokemonModel(
+            id_pokemon=raw_data['id'],
+            nome=raw_data['name'],
+            tipo_primario=tipos[0] if tipos else 'Unknown',
+            tipo_secundario=tipos[1] if len(tipos) > 1 else None,
+            imagem_uri=raw_data['sprites']['other']['official-artwork']['front_default'],
+        )
+        for s in raw_data.get('stats', []):
+            column = CatalogoPokemonModel.STAT_COLUMNS.get(s['stat']['name'])
+            if column:
+                setattr(entry, column, s['base_stat'])
+        return entry
+
+    def sync_catalog(self, workers: int = 8, batch_size: int = 100, progress: Callable[[int, int], None] = None) -> Dict[str, int]:
+        """
+        Baixa o catálogo completo da PokeAPI e grava no BD local.
+
+        A sincronização é retomável: os Pokémon já gravados são pulados, e cada
+        lote é confirmado (commit) ao terminar, servindo de checkpoint.
+
+        Args:
+            workers: Número de requisições de detalhes em paralelo.
+            batch_size: Quantidade de Pokémon por lote/commit.
+            progress: Callback opcional chamado com (processados, total).
+
+        Returns:
+            Um resumo com 'total', 'inserted', 'skipped' e 'failed'.
+
+        Raises:
+            ValueError: Se não for possível obter a lista de Pokémon.
+        """
+        pokemon_list = self.api_client.get_pokemon_list(limit=PokeAPIClient.FULL_LIST_LIMIT, offset=0)
+        if not pokemon_list:
+            raise ValueError("Não foi possível obter a lista de Pokémon da PokeAPI.")
+
+        existing = self.catalog_repo.get_existing_names()
+        pending = [item['name'] for item in pokemon_list if item['name'] not in existing]
+        summary = {'total': len(pokemon_list), 'inserted': 0, 'skipped': len(pokemon_list) - len(pending), 'failed': 0}
+
+        fetcher = ConcurrentFetcher(max_workers=workers, batch_timeout=max(60.0, batch_size * 2.0))
+        try:
+            for start in range(0, len(pending), batch_size):
+                batch = pending[start:start + batch_size]
+                details_list = fetcher.map(self.api_client.get_pokemon_details, batch)
+
+                entries = []
+                for details in details_list:
+                    if details:
+                        entries.append(self._build_catalog_entry(details))
+                    else:
+                        summary['failed'] += 1
+
+                # Checkpoint: cada lote é confirmado separadamente
+                with unit_of_work():
+                    summary['inserted'] += self.catalog_repo.save_all(entries)
+                if progress:
+                    progress(summary['skipped'] + start + len(batch), summary['total'])
+        finally:
+            fetcher.shutdown()
+
+        return summary
+
+    def _get_pokemon_names_by_id(self) -> Dict[int, str]:
+        """Mapeia ID -> nome, pelo catálogo local ou pela lista da PokeAPI."""
+        names_by_id = self.catalog_repo.get_names_by_id()
+        if names_by_id:
+            return names_by_id
+        pokemon_list = self.api_client.get_pokemon_list(limit=PokeAPIClient.FULL_LIST_LIMIT, offset=0) or []
+        return {PokeAPIClient.extract_id_from_url(item['url']): item['name'] for item in pokemon_list}
+
+    def sync_generations(self) -> Dict[int, int]:
+        """
+        Monta o índice de gerações a partir dos endpoints 'generation/' da PokeAPI
+        (uma chamada por geração, em paralelo) e grava no BD local.
+
+        Returns:
+            Um dicionário {id_geracao: quantidade de Pokémon}.
+
+        Raises:
+            ValueError: Se alguma geração não puder ser obtida (o índice
+                parcial daria resultados errados, então nada é gravado).
+        """
+        generations = self.api_client.get_generation_list()
+        if not generations:
+            raise ValueError("Não foi possível obter a lista de gerações da PokeAPI.")
+
+        generation_ids = [PokeAPIClient.extract_id_from_url(g['url']) for g in generations]
+        details_list = self.api_client.fetcher.map(self.api_client.get_generation, generation_ids)
+        names_by_id = self._get_pokemon_names_by_id()
+
+        members = []
+        summary = {}
+        for generation_id, details in zip(generation_ids, details_list):
+            if not details:
+                raise ValueError(f"Não foi possível obter a geração {generation_id} da PokeAPI.")
+            for species in details.get('pokemon_species', []):
+                # A forma padrão de cada espécie tem o mesmo ID da espécie
+                pokemon_id = PokeAPIClient.extract_id_from_url(species['url'])
+                members.append(GeracaoPokemonModel(
+                    id_geracao=generation_id,
+                    id_pokemon=pokemon_id,
+                    nome=names_by_id.get(pokemon_id, species['name'])
+                ))
+            summary[generation_id] = len(details.get('pokemon_species', []))
+
+        with unit_of_work():
+            self.catalog_repo.replace_generation_members(members)
+            # O índice em memória desta aplicação é remontado na próxima consulta
+            on_commit(lambda: current_app.extensions.pop('pokemon_generation_index', None))
+        return summary
@@ -0,0 +1,44 @@
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+
+class GenerationIndexUnavailableError(RuntimeError):
+    """O índice de gerações nunca foi sincronizado: o filtro por geração fica indisponível (503)."""
+
+
+class GenerationIndex:
+    """
+    Índice em memória geração -> nomes dos Pokémon, na ordem do catálogo.
+    Carregado a partir da tabela 'GeracaoPokemon' (montada por
+    `flask catalog sync-generations`), permite filtrar por geração em O(k)
+    sem chamadas à PokeAPI durante a requisição.
+    """
+
+    def __init__(self):
+        self._members: Dict[int, List[str]] = {}
+        self.built_at = None
+
+    def __len__(self):
+        return len(self._members)
+
+    def load(self, members: Iterable[Tuple[int, str]]):
+        """
+        Carrega (ou recarrega) o índice.
+
+        Args:
+            members: Pares (id_geracao, nome), já ordenados pelo ID do Pokémon.
+        """
+        grouped = defaultdict(list)
+        for generation_id, name in members:
+            grouped[generation_id].append(name)
+        self._members = dict(grouped)
+        self.built_at = time.time()
+
+    def is_stale(self, max_age: float) -> bool:
+        """Indica se o índice nunca foi carregado ou passou da idade máxima."""
+        return self.built_at is None or time.time() - self.built_at > max_age
+
+    def names_for(self, generation_id: int) -> List[str]:
+        """Nomes dos Pokémon da geração (lista vazia se a geração não existir)."""
+        return self._members.get(generation_id, [])
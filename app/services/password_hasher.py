@@ -0,0 +1,107 @@
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """Fila de hashing cheia: a requisição deve ser recusada (503) em vez de esperar."""
+
+
+def normalize_hash_method(method: str) -> str:
+    """
+    Completa um método do werkzeug com os parâmetros padrão, no formato gravado
+    no início do hash (ex.: 'scrypt' -> 'scrypt:32768:8:1').
+
+    Raises:
+        ValueError: Se o método ou os parâmetros forem inválidos.
+    """
+    name, *args = method.split(':')
+    if name == 'scrypt':
+        if not args:
+            args = ['32768', '8', '1']
+        if len(args) != 3:
+            raise ValueError("'scrypt' recebe 3 parâmetros (n:r:p).")
+        return 'scrypt:' + ':'.join(str(int(a)) for a in args)
+    if name == 'pbkdf2':
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' recebe 2 parâmetros (hash:iterações).")
+        hash_name = args[0] if args else 'sha256'
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return f'pbkdf2:{hash_name}:{iterations}'
+    raise ValueError(f"Método de hash inválido: {method!r}.")
+
+
+class PasswordHasher:
+    """
+    Gera e verifica hashes de senha em um pool de threads dedicado e limitado.
+
+    O scrypt/pbkdf2 do hashlib libera o GIL, então no máximo `max_workers`
+    núcleos ficam ocupados com hashing; o restante atende as outras rotas.
+    Quando há mais de `max_workers + max_pending` pedidos, os excedentes esperam
+    até `wait_timeout` segundos e então recebem PasswordHasherBusyError.
+    """
+
+    def __init__(self, method: str, max_workers: int = 2, max_pending: int = 32, wait_timeout: float = 5.0):
+        """
+        Args:
+            method: Método do werkzeug para novos hashes (ex.: 'scrypt:32768:8:1', 'pbkdf2:sha256:600000').
+            max_workers: Hashes calculados em paralelo.
+            max_pending: Pedidos aguardando na fila além dos que estão em execução.
+            wait_timeout: Espera máxima (segundos) por uma vaga na fila.
+        """
+        self.method = normalize_hash_method(method)
+        self.max_workers = max_workers
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_workers + max_pending)
+        self._executor = None
+        self._counters = {'hashed': 0, 'verified': 0, 'rejected': 0}
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Cria o pool de threads sob demanda."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='password-hash')
+            return self._executor
+
+    def _run(self, counter: str, func: Callable[..., Any], *args) -> Any:
+        if not self._slots.acquire(timeout=self.wait_timeout):
+            with self._lock:
+                self._counters['rejected'] += 1
+            raise PasswordHasherBusyError("Muitas autenticações simultâneas. Tente novamente em instantes.")
+        try:
+            result = self._get_executor().submit(func, *args).result()
+        finally:
+            self._slots.release()
+        with self._lock:
+            self._counters[counter] += 1
+        return result
+
+    def hash(self, password: str) -> str:
+        """Gera o hash da senha com o método configurado."""
+        return self._run('hashed', generate_password_hash, password, self.method)
+
+    def verify(self, password_hash: str, password: str) -> bool:
+        """Verifica a senha contra um hash gravado (com os parâmetros gravados nele)."""
+        return self._run('verified', check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Indica se o hash foi gerado com um método/custo diferente do configurado."""
+        return password_hash.split('$', 1)[0] != self.method
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Método atual e contadores, para monitoramento."""
+        with self._lock:
+            stats = dict(self._counters)
+        stats['method'] = self.method
+        stats['max_workers'] = self.max_workers
+        return stats
+
+    def shutdown(self):
+        """Encerra o pool de threads (usado em testes e no desligamento)."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
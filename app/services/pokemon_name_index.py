@@ -0,0 +1,84 @@
+
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set
+
+
+class PokemonNameIndex:
+    """
+    Índice de busca em memória sobre os nomes de todos os Pokémon.
+    A busca por trecho usa um índice de trigramas (cada trecho de 3 letras ->
+    Pokémon que o contêm).
+    Os resultados sempre voltam na ordem do catálogo (a mesma da PokeAPI),
+    para que a paginação seja estável.
+    """
+
+    NGRAM = 3
+
+    def __init__(self):
+        self._names: List[str] = []                 # nomes na ordem do catálogo
+        self._position: Dict[str, int] = {}         # nome -> posição no catálogo
+        self._trigrams: Dict[str, Set[int]] = defaultdict(set)
+        self._lock = threading.RLock()
+        self.built_at = None
+
+    def __len__(self):
+        return len(self._names)
+
+    def _ngrams(self, text: str) -> Set[str]:
+        return {text[i:i + self.NGRAM] for i in range(len(text) - self.NGRAM + 1)}
+
+    def add(self, names: Iterable[str]) -> int:
+        """
+        Adiciona nomes ao final do catálogo (atualização incremental).
+        Nomes já indexados são ignorados.
+
+        Returns:
+            Quantos nomes novos foram indexados.
+        """
+        added = 0
+        with self._lock:
+            for name in names:
+                name = name.lower()
+                if name in self._position:
+                    continue
+                position = len(self._names)
+                self._names.append(name)
+                self._position[name] = position
+                for gram in self._ngrams(name):
+                    self._trigrams[gram].add(position)
+                added += 1
+            self.built_at = time.time()
+        return added
+
+    def is_stale(self, max_age: float) -> bool:
+        """Indica se o índice nunca foi montado ou passou da idade máxima."""
+        return self.built_at is None or time.time() - self.built_at > max_age
+
+    def all(self) -> List[str]:
+        """Todos os nomes, na ordem do catálogo."""
+        with self._lock:
+            return list(self._names)
+
+    def search(self, query: str) -> List[str]:
+        """
+        Nomes que contêm `query` (case-insensitive), na ordem do catálogo.
+        Consultas com 3+ letras usam o índice de trigramas; as mais curtas
+        percorrem a lista (que tem apenas ~1300 nomes).
+        """
+        query = query.lower()
+        with self._lock:
+            if len(query) < self.NGRAM:
+                return [name for name in self._names if query in name]
+
+            # Interseção das listas de trigramas, começando pela menor
+            postings = sorted((self._trigrams.get(g, set()) for g in self._ngrams(query)), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+
+            # Trigramas em comum não garantem a substring: confirma cada candidato
+            return [self._names[p] for p in sorted(candidates) if query in self._names[p]]
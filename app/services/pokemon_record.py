@@ -0,0 +1,119 @@
+
+import struct
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+
+# Ordem fixa dos atributos base dentro de `PokemonRecord.stats`
+STAT_NAMES: Tuple[str, ...] = tuple(CatalogoPokemonModel.STAT_COLUMNS)
+_STATS = struct.Struct(f'<{len(STAT_NAMES)}H') # Inteiros de 16 bits sem sinal, empacotados
+
+
+class TypeTable:
+    """
+    Tabela de tipos de Pokémon: cada nome ('Fire', 'Grass'...) vira um inteiro
+    pequeno, guardado uma única vez. Os registros referenciam os tipos pelo id.
+    """
+
+    def __init__(self):
+        self._names: List[str] = []
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def intern(self, name: str) -> int:
+        """Retorna o id do tipo, registrando-o na primeira ocorrência."""
+        type_id = self._ids.get(name)
+        if type_id is None:
+            with self._lock:
+                type_id = self._ids.get(name)
+                if type_id is None:
+                    type_id = len(self._names)
+                    self._names.append(sys.intern(name))
+                    self._ids[name] = type_id
+        return type_id
+
+    def name(self, type_id: int) -> str:
+        return self._names[type_id]
+
+    def __len__(self):
+        return len(self._names)
+
+
+# Os tipos são poucos (~20) e iguais para todas as aplicações do processo
+POKEMON_TYPES = TypeTable()
+
+
+class PokemonRecord:
+    """
+    Registro compacto e imutável de um Pokémon da listagem: tipos como ids
+    da `POKEMON_TYPES` e stats empacotados em bytes, na ordem de `STAT_NAMES`.
+    Substitui os dicionários montados a cada requisição e permite descartar
+    o JSON bruto da PokeAPI logo após a conversão.
+    """
+
+    __slots__ = ('id_pokemon', 'nome', 'imagem_uri', 'tipos', 'stats')
+
+    def __init__(self, id_pokemon: int, nome: str, imagem_uri: Optional[str], tipos: Tuple[int, ...], stats: bytes):
+        set_attribute = super().__setattr__
+        set_attribute('id_pokemon', id_pokemon)
+        set_attribute('nome', sys.intern(nome))
+        set_attribute('imagem_uri', imagem_uri)
+        set_attribute('tipos', tipos)
+        set_attribute('stats', stats)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} é imutável.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} é imutável.")
+
+    @classmethod
+    def from_details(cls, raw_data: Dict[str, Any]) -> Optional["PokemonRecord"]:
+        """
+        Converte a resposta de detalhes da PokeAPI. Apenas os atributos base de
+        `STAT_NAMES` são mantidos (os ausentes valem 0, como no catálogo).
+        """
+        if not raw_data:
+            return None
+        base_stats = {s['stat']['name']: s['base_stat'] for s in raw_data.get('stats', [])}
+        return cls(
+            id_pokemon=raw_data['id'],
+            nome=raw_data['name'],
+            imagem_uri=raw_data['sprites']['other']['official-artwork']['front_default'],
+            tipos=tuple(POKEMON_TYPES.intern(t['type']['name'].capitalize()) for t in raw_data.get('types', [])),
+            stats=_STATS.pack(*(base_stats.get(name, 0) for name in STAT_NAMES)),
+        )
+
+    @classmethod
+    def from_catalog_entry(cls, entry: CatalogoPokemonModel) -> "PokemonRecord":
+        """Converte um registro do catálogo local."""
+        return cls(
+            id_pokemon=entry.id_pokemon,
+            nome=entry.nome,
+            imagem_uri=entry.imagem_uri,
+            tipos=tuple(POKEMON_TYPES.intern(t) for t in (entry.tipo_primario, entry.tipo_secundario) if t),
+            stats=_STATS.pack(*(getattr(entry, column) or 0 for column in CatalogoPokemonModel.STAT_COLUMNS.values())),
+        )
+
+    @property
+    def codigo(self) -> str:
+        return str(self.id_pokemon)
+
+    @property
+    def type_names(self) -> List[str]:
+        return [POKEMON_TYPES.name(type_id) for type_id in self.tipos]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Dados da listagem (sem o status do usuário), no formato da resposta da API."""
+        return {
+            'id_pokemon': self.id_pokemon,
+            'nome': self.nome.capitalize(),
+            'codigo': self.codigo,
+            'tipos': self.type_names,
+            'imagem_uri': self.imagem_uri,
+            'stats': dict(zip(STAT_NAMES, _STATS.unpack(self.stats)))
+        }
+
+    def __repr__(self):
+        return f"<PokemonRecord ID: {self.id_pokemon}, Nome: {self.nome}>"
@@ -1,89 +1,556 @@
 
-
+import asyncio
+import base64
+import json
+import threading
+from datetime import datetime
+from functools import wraps
+from flask import current_app
 from app.external.poke_api_client import PokeAPIClient
 from app.repositories.pokemon_repository import PokemonRepository 
+from app.repositories.catalog_repository import CatalogRepository
 from app.repositories.user_repository import UserRepository 
+from app.repositories.unit_of_work import unit_of_work, release_connection
 from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+from app.services.pokemon_name_index import PokemonNameIndex
+from app.services.generation_index import GenerationIndex, GenerationIndexUnavailableError
+from app.services.user_state_versions import UserStateVersions
+from app.services.user_list_cache import UserListCache
+from app.services.cache_backends import create_cache_backend
+from app.services.catalog_fragments import CatalogFragmentCache
+from app.services.pokemon_record import PokemonRecord
 from typing import Dict, Any, List
 
 
+def _bumps_user_state(method):
+    """
+    Decorador para os métodos que alteram favoritos/time: ao final (com ou sem
+    erro) incrementa a versão do estado do usuário, invalidando as ETags dele.
+    """
+    @wraps(method)
+    def wrapper(self, user_id, *args, **kwargs):
+        try:
+            return method(self, user_id, *args, **kwargs)
+        finally:
+            self._get_state_versions().bump(user_id)
+    return wrapper
+
+
 class PokemonService:
     """
     Camada de Serviço para a lógica de negócios de Pokémon.
     Transforma dados brutos da PokeAPI e gerencia o estado do usuário no BD.
     """
+
+    # Tamanho máximo da Equipe de Batalha
+    BATTLE_TEAM_LIMIT = 6
+
+    # Paginação dos favoritos: ordenações aceitas e tamanho máximo da página
+    FAVORITE_SORTS = ('added', 'name', 'id')
+    FAVORITES_MAX_PAGE_SIZE = 100
     
     def __init__(self):
-        """Inicializa o serviço com o cliente da API e o repositório."""
-        self.api_client = PokeAPIClient()
+        """Inicializa o serviço com o cliente da API (configurado pelo app.config) e o repositório."""
+        self.api_client = PokeAPIClient(config=current_app.config)
 
         # Inicializa o repositório (dependência de persistência)
-        self.pokemon_repo = PokemonRepository() 
+        # Compartilha o mesmo cliente (e o mesmo cache) com o serviço
+        self.pokemon_repo = PokemonRepository(self.api_client)
+
+        # Catálogo local (snapshot da PokeAPI), quando já sincronizado
+        self.catalog_repo = CatalogRepository()
+
+        # Listagem assíncrona (servidor ASGI): event loop e cliente httpx, criados sob demanda
+        self._async_runtime = None
+        self._async_runtime_lock = threading.Lock()
+
+    def _get_user_cache(self) -> Dict[str, Any]:
+        """
+        Retorna as versões de estado e o cache de listas da aplicação atual,
+        que compartilham o mesmo backend (memória ou Redis, conforme a configuração).
+        """
+        user_cache = current_app.extensions.get('pokemon_user_cache')
+        if user_cache is None:
+            backend = create_cache_backend(current_app.config)
+            user_cache = current_app.extensions.setdefault('pokemon_user_cache', {
+                'versions': UserStateVersions(backend),
+                'lists': UserListCache(backend, ttl=current_app.config['USER_CACHE_TTL']),
+            })
+        return user_cache
+
+    def _get_state_versions(self) -> UserStateVersions:
+        return self._get_user_cache()['versions']
+
+    def get_user_state_token(self, user_id: int) -> str:
+        """Versão atual dos favoritos/time do usuário, para compor ETags."""
+        return self._get_state_versions().token(user_id)
+
+    def get_user_cache_stats(self) -> Dict[str, int]:
+        """Estatísticas do cache de listas por usuário, para monitoramento."""
+        return self._get_user_cache()['lists'].get_stats()
+
+    def get_listing_token(self) -> str:
+        """
+        Versão do índice de nomes da aplicação atual, para compor a ETag da
+        listagem. Apenas lê o que está em memória (sem BD e sem PokeAPI).
+        """
+        index = current_app.extensions.get('pokemon_name_index')
+        if index is None:
+            return 'sem-indice'
+        return f"{index.built_at}:{len(index)}"
     
 
-    def _extract_data_from_details(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _attach_user_states(self, user_id: int, pokemons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Extrai e formata os dados essenciais de um Pokémon a partir da resposta da PokeAPI.
-        Isso garante que nossa aplicação só use os dados de que realmente precisa.
+        Anexa aos Pokémon o status de favorito/time do usuário.
+        Usa uma única consulta para a página inteira (evita o N+1) e faz o merge em memória.
+        """
+        user_states = self.pokemon_repo.get_user_states_by_codes(
+            user_id=user_id,
+            pokemon_codes=[p['codigo'] for p in pokemons]
+        )
+
+        for pokemon_data in pokemons:
+            user_pokemon_state = user_states.get(pokemon_data['codigo'])
+            pokemon_data['is_favorite'] = user_pokemon_state.favorito if user_pokemon_state else False
+            pokemon_data['in_battle_team'] = user_pokemon_state.grupo_batalha if user_pokemon_state else False
+        return pokemons
+
+    def _catalog_entry_to_pokemon_data(self, entry: CatalogoPokemonModel) -> Dict[str, Any]:
+        """Converte um registro do catálogo nos dados usados para criar o registro do usuário."""
+        return {
+            "nome": entry.nome.capitalize(),
+            "imagem_uri": entry.imagem_uri,
+            "tipos": [t for t in (entry.tipo_primario, entry.tipo_secundario) if t],
+        }
+
+    def _get_pokemon_data(self, pokemon_code: str) -> Dict[str, Any]:
+        """
+        Obtém nome, imagem e tipos de um Pokémon para criar o registro do usuário.
+        Usa o catálogo local quando disponível e só recorre à PokeAPI se necessário.
+        """
+        entry = self.catalog_repo.find_by_code(pokemon_code)
+        if entry:
+            return self._catalog_entry_to_pokemon_data(entry)
+        return self.pokemon_repo.get_pokemon_details_from_api(pokemon_code)
+
+    def _load_all_pokemon_names(self) -> List[str]:
+        """Lista todos os nomes de Pokémon, do catálogo local ou da PokeAPI (com cache)."""
+        names = self.catalog_repo.get_all_names()
+        if names:
+            return names
+        pokemon_list = self.api_client.get_pokemon_list(limit=PokeAPIClient.FULL_LIST_LIMIT, offset=0)
+        return [item['name'] for item in pokemon_list or []]
+
+    def _get_name_index(self) -> PokemonNameIndex:
+        """
+        Retorna o índice de nomes da aplicação atual. Ele é montado na primeira
+        chamada e recebe os Pokémon novos quando passa do intervalo de atualização.
+        """
+        index = current_app.extensions.setdefault('pokemon_name_index', PokemonNameIndex())
+        if index.is_stale(current_app.config['POKEMON_NAME_INDEX_REFRESH_SECONDS']):
+            names = self._load_all_pokemon_names()
+            if names:
+                index.add(names)
+        return index
+
+    def _get_generation_index(self) -> GenerationIndex:
+        """
+        Retorna o índice de gerações da aplicação atual, carregado apenas do BD
+        local (nunca da PokeAPI durante a requisição). É recarregado ao passar do
+        intervalo de atualização, para incorporar sincronizações feitas por
+        outros processos; enquanto estiver vazio, é relido a cada chamada.
+
+        Raises:
+            GenerationIndexUnavailableError: Se o índice nunca foi sincronizado.
+        """
+        index = current_app.extensions.setdefault('pokemon_generation_index', GenerationIndex())
+        if not index or index.is_stale(current_app.config['POKEMON_GENERATION_INDEX_REFRESH_SECONDS']):
+            index.load(self.catalog_repo.get_generation_members())
+        if not index:
+            raise GenerationIndexUnavailableError(
+                "O filtro por geração ainda não está disponível: o índice de gerações não foi sincronizado."
+            )
+        return index
+
+    def _get_pokemon_records(self) -> Dict[str, PokemonRecord]:
+        """Catálogo em memória da aplicação atual (nome -> `PokemonRecord`), preenchido sob demanda."""
+        return current_app.extensions.setdefault('pokemon_records', {})
+
+    def _get_async_runtime(self) -> tuple:
+        """
+        Event loop compartilhado e cliente assíncrono da PokeAPI (criados sob demanda).
+        O cliente reaproveita o cache e o circuit breaker do cliente síncrono.
+
+        Raises:
+            RuntimeError: Se o pacote `httpx` não estiver instalado.
+        """
+        if self._async_runtime is None:
+            # httpx só é importado quando o modo assíncrono é usado
+            from app.external.async_poke_api_client import AsyncPokeAPIClient
+            from app.external.event_loop_thread import EventLoopThread
+            with self._async_runtime_lock:
+                if self._async_runtime is None:
+                    client = AsyncPokeAPIClient(self.api_client)
+                    self._async_runtime = (EventLoopThread(name='pokeapi-async'), client)
+        return self._async_runtime
+
+    def _load_known_records(self, names: List[str]) -> tuple:
+        """
+        Registros já disponíveis sem ir à PokeAPI: catálogo em memória e catálogo
+        local (uma consulta SQL). Retorna (registros encontrados, nomes faltantes).
+        """
+        records = self._get_pokemon_records()
+        found = {name: records[name] for name in names if name in records}
+
+        missing = [name for name in names if name not in found]
+        if missing:
+            for entry in self.catalog_repo.get_by_names(missing):
+                found[entry.nome] = PokemonRecord.from_catalog_entry(entry)
+            missing = [name for name in missing if name not in found]
+        return found, missing
+
+    def _store_page_records(self, names: List[str], found: Dict[str, PokemonRecord], missing: List[str], raw_details: List[Any]) -> Dict[str, PokemonRecord]:
+        """Converte o JSON bruto da PokeAPI (descartado aqui mesmo) e guarda os registros novos na memória."""
+        for name, raw_data in zip(missing, raw_details):
+            record = PokemonRecord.from_details(raw_data)
+            if record:
+                found[name] = record
+
+        records = self._get_pokemon_records()
+        records.update((name, found[name]) for name in names if name not in records and name in found)
+        return found
+
+    def _load_page_records(self, names: List[str]) -> Dict[str, PokemonRecord]:
+        """
+        Obtém os registros de uma lista de nomes: do catálogo em memória, depois do
+        catálogo local (uma consulta SQL) e, para o que faltar, da PokeAPI em paralelo.
+        Pokémon que falharem ficam de fora do resultado.
+        """
+        found, missing = self._load_known_records(names)
+        if not missing:
+            return found
+        raw_details = self.api_client.get_many_pokemon_details(missing)
+        return self._store_page_records(names, found, missing, raw_details)
+
+    async def _load_page_records_async(self, names: List[str]) -> Dict[str, PokemonRecord]:
+        """
+        Versão assíncrona de `_load_page_records`: aguarda a PokeAPI sem bloquear o
+        event loop de quem chama. A conexão com o BD volta ao pool durante a espera,
+        senão cada listagem pendente no mesmo loop prenderia uma.
+        """
+        found, missing = self._load_known_records(names)
+        if not missing:
+            return found
+        release_connection()
+        loop, client = self._get_async_runtime()
+        raw_details = await loop.wrap(client.get_many_pokemon_details(missing))
+        return self._store_page_records(names, found, missing, raw_details)
+
+    def _render_page(self, user_id: int, names: List[str], records: Dict[str, PokemonRecord]) -> List[Dict[str, Any]]:
+        """Monta a página na ordem dos nomes, com o status do usuário."""
+        return self._attach_user_states(user_id, [records[n].to_dict() for n in names if n in records])
+
+    def _hydrate_page(self, user_id: int, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Monta os dados completos de uma página de nomes (ver `_load_page_records`).
+        A ordem dos nomes é preservada e Pokémon que falharem são ignorados.
+        """
+        return self._render_page(user_id, names, self._load_page_records(names))
+
+    async def _hydrate_page_async(self, user_id: int, names: List[str]) -> List[Dict[str, Any]]:
+        """Versão assíncrona de `_hydrate_page`."""
+        return self._render_page(user_id, names, await self._load_page_records_async(names))
+
+    def _get_catalog_fragments(self) -> CatalogFragmentCache:
+        """Cache de fragmentos JSON da aplicação atual, com o serializador do provider dela."""
+        fragments = current_app.extensions.get('catalog_json_fragments')
+        if fragments is None:
+            fragments = current_app.extensions.setdefault(
+                'catalog_json_fragments', CatalogFragmentCache(current_app.json.dumps_bytes)
+            )
+        return fragments
+
+    def _missing_fragments(self, names: List[str]) -> List[str]:
+        """Nomes da página que ainda não estão no cache de fragmentos."""
+        fragments = self._get_catalog_fragments()
+        return [name for name in names if fragments.get(name) is None]
+
+    def _render_fragments(self, user_id: int, names: List[str], records: Dict[str, PokemonRecord]) -> List[bytes]:
+        """
+        Serializa os registros novos no cache de fragmentos e monta a página,
+        anexando o status do usuário por concatenação.
+        """
+        fragments = self._get_catalog_fragments()
+        for name, record in records.items():
+            fragments.add(name, record.to_dict())
+
+        page = [fragment for fragment in map(fragments.get, names) if fragment is not None]
+        user_states = self.pokemon_repo.get_user_states_by_codes(
+            user_id=user_id,
+            pokemon_codes=[fragment.codigo for fragment in page]
+        )
+
+        rendered = []
+        for fragment in page:
+            state = user_states.get(fragment.codigo)
+            rendered.append(fragment.render(state.favorito, state.grupo_batalha) if state else fragment.render(False, False))
+        return rendered
+
+    def _hydrate_page_fragments(self, user_id: int, names: List[str]) -> List[bytes]:
+        """
+        Igual a `_hydrate_page`, mas devolve cada Pokémon já serializado em JSON.
+        Só os Pokémon fora do cache de fragmentos são carregados e serializados.
+        """
+        missing = self._missing_fragments(names)
+        return self._render_fragments(user_id, names, self._load_page_records(missing) if missing else {})
+
+    async def _hydrate_page_fragments_async(self, user_id: int, names: List[str]) -> List[bytes]:
+        """Versão assíncrona de `_hydrate_page_fragments`."""
+        missing = self._missing_fragments(names)
+        return self._render_fragments(user_id, names, await self._load_page_records_async(missing) if missing else {})
+
+    def _select_listing_names(self, limit: int, offset: int, name_filter: str, generation_id: int) -> tuple:
+        """
+        Aplica os filtros por nome e geração sobre o catálogo inteiro (índices em
+        memória) e pagina. Retorna (nomes da página, total filtrado, próximo offset).
+        """
+        limit = max(limit, 0)
+        offset = max(offset, 0)
+        index = self._get_name_index()
+
+        if generation_id:
+            # O(k): parte apenas dos k Pokémon da geração
+            matches = self._get_generation_index().names_for(generation_id)
+            if name_filter:
+                name_matches = set(index.search(name_filter))
+                matches = [name for name in matches if name in name_matches]
+        else:
+            matches = index.search(name_filter) if name_filter else index.all()
+        page_names = matches[offset:offset + limit]
+        next_offset = offset + limit if offset + limit < len(matches) else None
+        return page_names, len(matches), next_offset
+
+    async def _select_listing_names_async(self, limit: int, offset: int, name_filter: str, generation_id: int) -> tuple:
+        """
+        `_select_listing_names` em uma thread: montar ou atualizar o índice de nomes
+        pode ir à PokeAPI (catálogo não sincronizado) e não deve travar o event loop.
+        `asyncio.to_thread` copia o contexto, então a thread enxerga a aplicação atual.
+        """
+        return await asyncio.to_thread(self._select_listing_names, limit, offset, name_filter, generation_id)
+
+    def _listing_page(self, data: List[Any], page_names: List[str], total: int, next_offset: int) -> Dict[str, Any]:
+        """
+        Monta o resultado de uma página da listagem. 'complete' é False quando
+        algum Pokémon da página falhou na PokeAPI e ficou de fora: essa página não
+        deve ser cacheada (ETag), para que volte completa quando a PokeAPI se recuperar.
         """
-        if not raw_data:
-            return None
-      
-        id_pokemon = raw_data.get('id')
-        
         return {
-            'id_pokemon': id_pokemon,
-            'nome': raw_data.get('name').capitalize(),
-            'codigo': str(id_pokemon),
-            'tipos': [t['type']['name'].capitalize() for t in raw_data.get('types', [])],
-            'imagem_uri': raw_data['sprites']['other']['official-artwork']['front_default'],
-            # Mapeamento para a listagem (exemplo: HP, Ataque, etc.)
-            'stats': {s['stat']['name']: s['base_stat'] for s in raw_data.get('stats', [])}
+            'data': data,
+            'total': total,
+            'next_offset': next_offset,
+            'complete': len(data) == len(page_names)
         }
 
+    def get_pokemon_listing_page(self, user_id: int, limit: int = 20, offset: int = 0, name_filter: str = None, generation_id: int = None) -> Dict[str, Any]:
+        """
+        Busca uma página de Pokémon, anexa o status do usuário e aplica filtros.
+
+        Os filtros por nome e geração são aplicados sobre o catálogo inteiro
+        (índices em memória) ANTES da paginação, portanto `total` e
+        `next_offset` refletem o resultado filtrado.
+
+        Returns:
+            Um dicionário com 'data' (a página), 'total' (resultados do filtro),
+            'next_offset' (None quando não há próxima página) e 'complete'
+            (False se algum Pokémon da página falhou na PokeAPI).
+        """
+        page_names, total, next_offset = self._select_listing_names(limit, offset, name_filter, generation_id)
+        data = self._hydrate_page(user_id, page_names)
+        return self._listing_page(data, page_names, total, next_offset)
+
+    def get_pokemon_listing_fragments(self, user_id: int, limit: int = 20, offset: int = 0, name_filter: str = None, generation_id: int = None) -> Dict[str, Any]:
+        """
+        Igual a `get_pokemon_listing_page`, mas 'data' é uma lista de Pokémon já
+        serializados em JSON (bytes), montados a partir do cache de fragmentos.
+        """
+        page_names, total, next_offset = self._select_listing_names(limit, offset, name_filter, generation_id)
+        data = self._hydrate_page_fragments(user_id, page_names)
+        return self._listing_page(data, page_names, total, next_offset)
+
+    async def get_pokemon_listing_page_async(self, user_id: int, limit: int = 20, offset: int = 0, name_filter: str = None, generation_id: int = None) -> Dict[str, Any]:
+        """
+        Versão assíncrona de `get_pokemon_listing_page`, para chamadores com event loop
+        (ex.: a listagem servida pelo asgi.py). As buscas na PokeAPI são aguardadas
+        sem ocupar threads; as consultas ao BD (locais e rápidas) continuam síncronas.
+        """
+        page_names, total, next_offset = await self._select_listing_names_async(limit, offset, name_filter, generation_id)
+        data = await self._hydrate_page_async(user_id, page_names)
+        return self._listing_page(data, page_names, total, next_offset)
+
+    async def get_pokemon_listing_fragments_async(self, user_id: int, limit: int = 20, offset: int = 0, name_filter: str = None, generation_id: int = None) -> Dict[str, Any]:
+        """Versão assíncrona de `get_pokemon_listing_fragments`."""
+        page_names, total, next_offset = await self._select_listing_names_async(limit, offset, name_filter, generation_id)
+        data = await self._hydrate_page_fragments_async(user_id, page_names)
+        return self._listing_page(data, page_names, total, next_offset)
+
     def get_pokemons_for_listing(self, user_id: int, limit: int = 20, offset: int = 0, name_filter: str = None, generation_id: int = None) -> List[Dict[str, Any]]:
         """
-        Busca a lista da PokeAPI, anexa o status do usuário e aplica filtros.
+        Busca a lista de Pokémon, anexa o status do usuário e aplica filtros.
+        Atalho para `get_pokemon_listing_page` que retorna apenas os itens.
         """
-        pokemon_list_raw = self.api_client.get_pokemon_list(limit=limit, offset=offset)
-        
-        if not pokemon_list_raw:
-            return []
-            
-        pokemons_processed = []
-        
-        for item in pokemon_list_raw:
-            pokemon_name = item['name']
-            
-            # Filtro por nome (Requisito Básico)
-            # Se o filtro de nome for fornecido e o nome do Pokémon não contiver o filtro (case-insensitive), pula para o próximo.
-            if name_filter and name_filter.lower() not in pokemon_name.lower():
+        return self.get_pokemon_listing_page(user_id, limit, offset, name_filter, generation_id)['data']
+
+    # Lógica de operações em lote (sincronização offline do Front-End)
+    def _load_batch_pokemon_data(self, operations: List[Dict[str, Any]], codes: List[str], records: Dict[str, PokemonUsuarioModel]) -> Dict[str, Dict[str, Any]]:
+        """
+        Reúne os dados (nome, imagem, tipos) dos Pokémon que o lote precisa criar:
+        primeiro os enviados pelo cliente, depois o catálogo local (uma consulta) e,
+        para o que faltar, a PokeAPI em paralelo.
+        """
+        data_by_code = {}
+        needed = []
+        for op, code in zip(operations, codes):
+            if code in records or not op['value']:
                 continue
-            
-            details = self.api_client.get_pokemon_details(pokemon_name)
-            
-            if details:
-                pokemon_data = self._extract_data_from_details(details)
-                
-                if pokemon_data:
-                    # ... (lógica de verificação de estado do usuário)
-                    user_pokemon_state = self.pokemon_repo.get_pokemon_by_user_and_code(
-                        user_id=user_id, 
-                        pokemon_code=pokemon_data['codigo']
+            if isinstance(op.get('pokemon_data'), dict) and code not in data_by_code:
+                data_by_code[code] = op['pokemon_data']
+            elif code not in needed:
+                needed.append(code)
+
+        needed = [code for code in needed if code not in data_by_code]
+        for code, entry in self.catalog_repo.find_by_codes(needed).items():
+            data_by_code[code] = self._catalog_entry_to_pokemon_data(entry)
+
+        missing = [code for code in needed if code not in data_by_code]
+        fetched = self.api_client.fetcher.map(self.pokemon_repo.get_pokemon_details_from_api, missing)
+        for code, pokemon_data in zip(missing, fetched):
+            if pokemon_data:
+                data_by_code[code] = pokemon_data
+        return data_by_code
+
+    @_bumps_user_state
+    def apply_batch_operations(self, user_id: int, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Aplica em lote operações idempotentes de favorito/time, em uma única transação.
+
+        Args:
+            user_id: ID do usuário.
+            operations: Lista de operações com 'pokemon_code', 'field'
+                ('favorite' ou 'team'), 'value' (True = marcar, False = desmarcar)
+                e, opcionalmente, 'pokemon_data' (nome, imagem_uri, tipos).
+
+        Returns:
+            Um resultado por operação, na mesma ordem, com 'status'
+            ('applied', 'unchanged' ou 'error') e o estado final do Pokémon.
+        """
+        codes = [str(op['pokemon_code']).lower() for op in operations]
+        unique_codes = list(dict.fromkeys(codes))
+
+        # Os dados dos Pokémon novos são buscados antes da transação de escrita
+        # (a PokeAPI pode demorar e a transação reserva a escrita do BD)
+        existing = self.pokemon_repo.get_user_states_by_codes(user_id, unique_codes)
+        pokemon_data_by_code = self._load_batch_pokemon_data(operations, codes, existing)
+
+        with unit_of_work(immediate=True):
+            return self._apply_batch_in_transaction(user_id, operations, codes, unique_codes, pokemon_data_by_code)
+
+    def _apply_batch_in_transaction(self, user_id: int, operations: List[Dict[str, Any]], codes: List[str],
+                                    unique_codes: List[str], pokemon_data_by_code: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Aplica o lote dentro da unidade de trabalho aberta por `apply_batch_operations`."""
+        # Relidos dentro da transação: o estado não muda até o commit
+        records = self.pokemon_repo.get_user_states_by_codes(user_id, unique_codes)
+
+        # O limite do time é validado uma única vez: a contagem é lida do
+        # contador e depois acompanhada em memória ao longo do lote.
+        initial_team_count = team_count = self.pokemon_repo.get_battle_team_counter(user_id)
+
+        created = {} # código -> dados usados para criar o registro
+        touched = set()
+        results = []
+
+        for op, code in zip(operations, codes):
+            field = op['field']
+            value = bool(op['value'])
+            attr = 'favorito' if field == 'favorite' else 'grupo_batalha'
+            record = records.get(code)
+            result = {'pokemon_code': code, 'field': field}
+
+            if (getattr(record, attr) if record else False) == value:
+                result['status'] = 'unchanged'
+            elif field == 'team' and value and team_count >= self.BATTLE_TEAM_LIMIT:
+                result['status'] = 'error'
+                result['msg'] = "A Equipe de Batalha já está completa (máximo de 6 Pokémon)."
+            elif record is None and code not in pokemon_data_by_code:
+                result['status'] = 'error'
+                result['msg'] = f"Não foi possível obter os dados do Pokémon '{code}'."
+            else:
+                if record is None:
+                    pokemon_data = pokemon_data_by_code[code]
+                    record = PokemonUsuarioModel(
+                        id_usuario=user_id,
+                        codigo=code,
+                        nome=pokemon_data['nome'],
+                        imagem_uri=pokemon_data['imagem_uri'],
+                        favorito=False,
+                        grupo_batalha=False
                     )
-                    
-                    pokemon_data['is_favorite'] = user_pokemon_state.favorito if user_pokemon_state else False
-                    pokemon_data['in_battle_team'] = user_pokemon_state.grupo_batalha if user_pokemon_state else False
-                    
-                    pokemons_processed.append(pokemon_data)
-                    
-        return pokemons_processed
+                    records[code] = record
+                    created[code] = pokemon_data
+                setattr(record, attr, value)
+                if field == 'team':
+                    team_count += 1 if value else -1
+                touched.add(code)
+                result['status'] = 'applied'
+
+            result['is_favorite'] = record.favorito if record else False
+            result['in_battle_team'] = record.grupo_batalha if record else False
+            results.append(result)
+
+        # Aplica a variação do time no contador (UPDATE condicional) antes dos registros
+        if not self.pokemon_repo.adjust_battle_team_counter(user_id, team_count - initial_team_count, self.BATTLE_TEAM_LIMIT):
+            raise ValueError("A Equipe de Batalha foi alterada por outra requisição. Tente novamente.")
+
+        for code in touched:
+            record = records[code]
+            if record.favorito or record.grupo_batalha:
+                if code in created:
+                    self.pokemon_repo.assign_types(record, created[code]['tipos'])
+                self.pokemon_repo.save(record)
+            elif code not in created:
+                # Nem favorito nem no time: remove o registro, como nos toggles
+                self.pokemon_repo.delete(record)
+
+        return results
+
+    def _prefetch_pokemon_data(self, user_id: int, pokemon_code: str, pokemon_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Busca, antes da transação de escrita, os dados de um Pokémon que o usuário
+        ainda não tem registrado (catálogo ou PokeAPI). A PokeAPI pode demorar e a
+        transação (BEGIN IMMEDIATE) reserva a escrita do BD enquanto estiver aberta.
+        Retorna None se o registro já existir ou se a busca falhar.
+        """
+        if pokemon_data or self.pokemon_repo.get_pokemon_by_user_and_code(user_id, pokemon_code):
+            return pokemon_data
+        try:
+            return self._get_pokemon_data(pokemon_code)
+        except Exception:
+            return None
 
     # Lógica de Marcar/Desmarcar favorito
+    @_bumps_user_state
     def toggle_favorite(self, user_id: int, pokemon_code: str, pokemon_data: Dict[str, Any]=None) -> bool:
         """
-        Adiciona ou remove um Pokémon da lista de favoritos do usuário.
+        Adiciona ou remove um Pokémon da lista de favoritos do usuário,
+        em uma única transação (um commit).
         """
+        pokemon_data = self._prefetch_pokemon_data(user_id, pokemon_code, pokemon_data)
+        with unit_of_work(immediate=True):
+            return self._toggle_favorite(user_id, pokemon_code, pokemon_data)
+
+    def _toggle_favorite(self, user_id: int, pokemon_code: str, pokemon_data: Dict[str, Any]=None) -> bool:
+        """Aplica o toggle de favorito dentro da unidade de trabalho aberta por `toggle_favorite`."""
         user_pokemon = self.pokemon_repo.get_pokemon_by_user_and_code(user_id, pokemon_code)
 
         if user_pokemon:
@@ -101,46 +568,45 @@ class PokemonService:
         else:
             # Se não existe, cria o registro e marca como favorito
             if not pokemon_data:
-                try:
-                    # IMPLEMENTAR ESTA CHAMADA NO SEU REPOSITÓRIO
-                    pokemon_data = self.pokemon_repo.get_pokemon_details_from_api(pokemon_code)
-                except Exception:
-                    # Se a busca na PokeAPI ou no cache falhar
-                    raise ValueError(f"Não foi possível obter os dados do Pokémon '{pokemon_code}' para criação.")
-
-            # Garante que o TipoPokemon exista e pega seu ID (Foreign Key)
-            first_type = pokemon_data['tipos'][0] # Pega o primeiro tipo para o TipoPokemon FK
-            tipo_pokemon_model = self.pokemon_repo.find_or_create_type(first_type)
+                # A busca (feita antes da transação) na PokeAPI ou no cache falhou
+                raise ValueError(f"Não foi possível obter os dados do Pokémon '{pokemon_code}' para criação.")
 
             # Cria o novo objeto no BD
             new_user_pokemon = PokemonUsuarioModel(
                 id_usuario=user_id,
-                id_tipo_pokemon=tipo_pokemon_model.id_tipo_pokemon,
                 codigo=pokemon_code,
                 nome=pokemon_data['nome'],
                 imagem_uri=pokemon_data['imagem_uri'],
                 favorito=True,
                 grupo_batalha=False
             )
+            # Garante que os TipoPokemon existam e associa todos ao registro
+            self.pokemon_repo.assign_types(new_user_pokemon, pokemon_data['tipos'])
             self.pokemon_repo.save(new_user_pokemon)
             return True 
 
-    from typing import Dict, Any
-
-
-
+    @_bumps_user_state
     def toggle_battle_team(self, user_id: int, pokemon_code: str, pokemon_data: Dict[str, Any]=None) -> bool:
         """
         Adiciona ou remove um Pokémon da Equipe de Batalha do usuário,
         garantindo o limite máximo de 6 Pokémon.
+        O limite é garantido por um UPDATE condicional no contador do time,
+        atômico no banco: requisições simultâneas nunca ultrapassam o limite.
         """
+        pokemon_data = self._prefetch_pokemon_data(user_id, pokemon_code, pokemon_data)
+        with unit_of_work(immediate=True):
+            return self._toggle_battle_team(user_id, pokemon_code, pokemon_data)
+
+    def _toggle_battle_team(self, user_id: int, pokemon_code: str, pokemon_data: Dict[str, Any]=None) -> bool:
+        """Aplica o toggle do time dentro da unidade de trabalho aberta por `toggle_battle_team`."""
         user_pokemon = self.pokemon_repo.get_pokemon_by_user_and_code(user_id, pokemon_code)
 
         if user_pokemon:
             # Caso 1: O Pokémon já está registrado para o usuário (Lógica OK)
 
             if user_pokemon.grupo_batalha:
-                # Se já está no time, vamos removê-lo
+                # Se já está no time, vamos removê-lo (e liberar a vaga no contador)
+                self.pokemon_repo.adjust_battle_team_counter(user_id, -1, self.BATTLE_TEAM_LIMIT)
                 user_pokemon.grupo_batalha = False
                 action = False
                 
@@ -151,9 +617,8 @@ class PokemonService:
             else:
                 # Se NÃO está no time, vamos adicioná-lo
                 
-                # VERIFICAÇÃO DO LIMITE DE 6 
-                current_count = self.pokemon_repo.get_user_battle_team_count(user_id)
-                if current_count >= 6:
+                # VERIFICAÇÃO DO LIMITE DE 6: reserva a vaga com um UPDATE condicional
+                if not self.pokemon_repo.adjust_battle_team_counter(user_id, 1, self.BATTLE_TEAM_LIMIT):
                     raise ValueError("A Equipe de Batalha já está completa (máximo de 6 Pokémon).")
                 
                 # Adiciona ao time
@@ -167,32 +632,25 @@ class PokemonService:
             # Caso 2: O Pokémon NÃO está registrado para o usuário (precisa ser criado)
             
             # VERIFICAÇÃO DO LIMITE DE 6 (Aplica-se à criação também)
-            current_count = self.pokemon_repo.get_user_battle_team_count(user_id)
-            if current_count >= 6:
+            # A vaga reservada é devolvida pelo rollback se a criação falhar
+            if not self.pokemon_repo.adjust_battle_team_counter(user_id, 1, self.BATTLE_TEAM_LIMIT):
                 raise ValueError("A Equipe de Batalha já está completa (máximo de 6 Pokémon).")
             
-            # === CORREÇÃO: Buscando dados do Pokémon se o Front-End não enviou ===
+            # Dados do Pokémon: enviados pelo Front-End ou buscados antes da transação
             if not pokemon_data:
-                try:
-                    # Chama a função do Repositório para buscar na PokeAPI
-                    pokemon_data = self.pokemon_repo.get_pokemon_details_from_api(pokemon_code)
-                except Exception:
-                    # Se falhar ao buscar na API, levanta o erro 400
-                    raise ValueError(f"Não foi possível obter os dados do Pokémon '{pokemon_code}' para adicionar ao time.")
-
-            # Cria o TipoPokemon e o registro de PokemonUsuario, marcando GrupoBatalha=True
-            first_type = pokemon_data['tipos'][0]
-            tipo_pokemon_model = self.pokemon_repo.find_or_create_type(first_type)
+                # Se falhou ao buscar no catálogo/API, levanta o erro 400
+                raise ValueError(f"Não foi possível obter os dados do Pokémon '{pokemon_code}' para adicionar ao time.")
 
+            # Cria o registro de PokemonUsuario (com seus tipos), marcando GrupoBatalha=True
             new_user_pokemon = PokemonUsuarioModel(
                 id_usuario=user_id,
-                id_tipo_pokemon=tipo_pokemon_model.id_tipo_pokemon,
                 codigo=pokemon_code,
                 nome=pokemon_data['nome'],
                 imagem_uri=pokemon_data['imagem_uri'],
                 favorito=False, # Não é automaticamente favorito, apenas faz parte do time
                 grupo_batalha=True
             )
+            self.pokemon_repo.assign_types(new_user_pokemon, pokemon_data['tipos'])
             self.pokemon_repo.save(new_user_pokemon)
             return True # Foi adicionado
     
@@ -215,16 +673,104 @@ class PokemonService:
             })
         return formatted_list
 
+    def _get_cached_user_data(self, user_id: int, kind: str, build):
+        """
+        Retorna o valor (já pronto para JSON) do cache ou, em caso de falha, monta e grava.
+        A versão é lida ANTES do BD: se houver uma alteração no meio, o valor
+        montado fica sob a versão antiga e nunca é servido.
+        """
+        user_cache = self._get_user_cache()
+        version = user_cache['versions'].get(user_id)
+        cached = user_cache['lists'].get(user_id, kind, version)
+        if cached is not None:
+            return cached
+
+        value = build(user_id)
+        user_cache['lists'].set(user_id, kind, version, value)
+        return value
+
+    def _get_cached_user_list(self, user_id: int, kind: str, load) -> List[Dict[str, Any]]:
+        """Lista formatada de registros do usuário, pelo cache (ver `_get_cached_user_data`)."""
+        return self._get_cached_user_data(user_id, kind, lambda uid: self._format_user_pokemon_list(load(uid)))
+
     def get_user_favorite_list(self, user_id: int) -> List[Dict[str, Any]]:
         """
-        Busca a lista de Pokémon favoritos do usuário no BD e formata.
+        Busca a lista de Pokémon favoritos do usuário (cache ou BD) e formata.
+        """
+        return self._get_cached_user_list(user_id, 'favorites', self.pokemon_repo.get_user_favorite_pokemons)
+
+    @staticmethod
+    def _favorite_sort_value(record: PokemonUsuarioModel, sort: str):
+        """Valor da coluna de ordenação de um registro, como gravado no cursor."""
+        if sort == 'added':
+            return record.dt_inclusao.isoformat()
+        if sort == 'id':
+            return int(record.codigo) if record.codigo.isdigit() else 0
+        return record.nome
+
+    @staticmethod
+    def _encode_favorites_cursor(sort: str, order: str, value, record_id: int) -> str:
+        """Cursor opaco: a chave do último item e a ordenação em que ela vale."""
+        payload = json.dumps({'s': sort, 'o': order, 'v': value, 'k': record_id}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def _decode_favorites_cursor(cursor: str, sort: str, order: str) -> tuple:
+        """
+        Decodifica o cursor em (valor, IDPokemonUsuario).
+
+        Raises:
+            ValueError: Se o cursor for inválido ou de outra ordenação.
+        """
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+            if payload['s'] != sort or payload['o'] != order:
+                raise ValueError("Cursor de outra ordenação.")
+            value = datetime.fromisoformat(payload['v']) if sort == 'added' else payload['v']
+            return value, int(payload['k'])
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Cursor inválido para esta ordenação.")
+
+    def get_user_favorites_page(self, user_id: int, limit: int = 50, cursor: str = None, sort: str = 'added',
+                                order: str = 'asc', type_filter: str = None, name_prefix: str = None) -> Dict[str, Any]:
         """
-        favorite_pokemons = self.pokemon_repo.get_user_favorite_pokemons(user_id)
-        return self._format_user_pokemon_list(favorite_pokemons)
+        Busca uma página dos favoritos do usuário, com ordenação, filtros e paginação
+        por cursor, tudo resolvido no SQL (ver `PokemonRepository.get_user_favorites_page`).
+
+        Returns:
+            {'data': [...], 'next_cursor': <cursor da próxima página ou None>}
+
+        Raises:
+            ValueError: Para ordenação, ordem, limite ou cursor inválidos.
+        """
+        if sort not in self.FAVORITE_SORTS:
+            raise ValueError(f"Ordenação inválida. Use: {', '.join(self.FAVORITE_SORTS)}.")
+        if order not in ('asc', 'desc'):
+            raise ValueError("Ordem inválida. Use: asc ou desc.")
+        if not 1 <= limit <= self.FAVORITES_MAX_PAGE_SIZE:
+            raise ValueError(f"O limite deve estar entre 1 e {self.FAVORITES_MAX_PAGE_SIZE}.")
+        after = self._decode_favorites_cursor(cursor, sort, order) if cursor else None
+        type_description = type_filter.capitalize() if type_filter else None
+
+        def build(uid):
+            records = self.pokemon_repo.get_user_favorites_page(
+                uid, limit, sort=sort, descending=(order == 'desc'), after=after,
+                type_description=type_description, name_prefix=name_prefix
+            )
+            page, has_more = records[:limit], len(records) > limit
+            next_cursor = None
+            if has_more:
+                last = page[-1]
+                next_cursor = self._encode_favorites_cursor(
+                    sort, order, self._favorite_sort_value(last, sort), last.id_pokemon_usuario
+                )
+            return {'data': self._format_user_pokemon_list(page), 'next_cursor': next_cursor}
+
+        kind = 'favorites-page:' + json.dumps([limit, cursor, sort, order, type_description, name_prefix])
+        return self._get_cached_user_data(user_id, kind, build)
 
     def get_user_battle_team_list(self, user_id: int) -> List[Dict[str, Any]]:
         """
-        Busca a Equipe de Batalha do usuário no BD e formata.
+        Busca a Equipe de Batalha do usuário (cache ou BD) e formata.
         """
-        battle_team = self.pokemon_repo.get_user_battle_team(user_id)
-        return self._format_user_pokemon_list(battle_team)
\ No newline at end of file
+        return self._get_cached_user_list(user_id, 'team', self.pokemon_repo.get_user_battle_team)
\ No newline at end of file
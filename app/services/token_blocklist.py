@@ -0,0 +1,141 @@
+
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict
+from app.repositories.token_repository import TokenRepository
+from app.repositories.unit_of_work import on_commit, unit_of_work
+from app.services.bloom_filter import BloomFilter
+
+
+class TokenBlocklist:
+    """
+    Lista de tokens JWT revogados, consultada em toda requisição autenticada.
+
+    Um filtro de Bloom em memória fica na frente da tabela 'TokenRevogado':
+    - token fora do filtro (o caso comum): não revogado, sem nenhum I/O;
+    - token no filtro: consulta exata no BD (revogado ou falso positivo).
+
+    As revogações feitas por outros processos entram no filtro a cada
+    `refresh_seconds` (uma consulta pelas linhas novas). Quando o filtro passa
+    da capacidade, ele é recriado apenas com as revogações ainda válidas e as
+    expiradas ficam de fora (e são removidas do BD por `purge_expired`, via
+    `flask --app run users purge-tokens`). O filtro é montado na primeira checagem.
+    """
+
+    def __init__(self, capacity: int = 10000, error_rate: float = 0.001, refresh_seconds: float = 5.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            capacity: Revogações ativas previstas (o filtro cresce se passar disso).
+            error_rate: Taxa de falsos positivos (cada um custa uma consulta ao BD).
+            refresh_seconds: Intervalo para incorporar revogações de outros processos.
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._bloom = None
+        self._last_id = 0
+        self._next_refresh = 0.0
+        # Revogações feitas neste processo e já no filtro, que a próxima
+        # atualização (pelas linhas novas do BD) não precisa adicionar de novo
+        self._local_jtis = set()
+        self._counters = {'checks': 0, 'bloom_negatives': 0, 'db_checks': 0, 'revoked_hits': 0,
+                          'refreshes': 0, 'rebuilds': 0}
+        self._lock = threading.Lock()
+        # Lock próprio dos contadores: a checagem não espera uma atualização do filtro
+        self._counters_lock = threading.Lock()
+
+    def _count(self, *names: str):
+        """Incrementa os contadores de monitoramento (várias threads checam tokens)."""
+        with self._counters_lock:
+            for name in names:
+                self._counters[name] += 1
+
+    def purge_expired(self) -> int:
+        """Remove do BD as revogações expiradas. Retorna quantas foram removidas."""
+        with unit_of_work():
+            return TokenRepository.purge_expired(datetime.utcnow())
+
+    def load(self):
+        """Remove do BD as revogações expiradas e remonta o filtro imediatamente."""
+        self.purge_expired()
+        self._refresh_if_due(rebuild=True)
+
+    def _rebuild(self, now: datetime):
+        """
+        Troca o filtro por um novo (maior, se preciso) com as revogações ainda válidas.
+        O filtro é montado e preenchido em uma variável local e só então publicado,
+        com uma única atribuição: uma checagem concorrente (que não pega o lock) vê o
+        filtro antigo ou o novo já completo, nunca um vazio. Chamado com o lock.
+        """
+        capacity = max(self.capacity, TokenRepository.count_active(now) * 2)
+        bloom = BloomFilter(capacity, self.error_rate)
+        last_id = 0
+        for row_id, jti in TokenRepository.get_active_since(0, now):
+            bloom.add(jti)
+            last_id = max(last_id, row_id)
+
+        self._bloom = bloom
+        self._last_id = last_id
+        # O filtro novo já veio do BD, inclusive com as revogações locais
+        self._local_jtis.clear()
+        self._count('rebuilds')
+
+    def _refresh_if_due(self, rebuild: bool = False):
+        """
+        Incorpora ao filtro as revogações gravadas desde a última atualização
+        (adicionar ao filtro publicado é seguro: ele só ganha bits). Recria o
+        filtro na primeira vez, quando ele enche ou com `rebuild=True`.
+        """
+        if not rebuild and self._clock() < self._next_refresh:
+            return
+        with self._lock:
+            if not rebuild and self._clock() < self._next_refresh:
+                return
+            now = datetime.utcnow()
+            if rebuild or self._bloom is None or self._bloom.is_full():
+                self._rebuild(now)
+            else:
+                for row_id, jti in TokenRepository.get_active_since(self._last_id, now):
+                    if jti in self._local_jtis:
+                        self._local_jtis.discard(jti)
+                    else:
+                        self._bloom.add(jti)
+                    self._last_id = max(self._last_id, row_id)
+            self._count('refreshes')
+            self._next_refresh = self._clock() + self.refresh_seconds
+
+    def is_revoked(self, jti: str) -> bool:
+        """Indica se o token foi revogado (sem I/O quando o filtro responde "não")."""
+        self._refresh_if_due()
+        if jti not in self._bloom:
+            self._count('checks', 'bloom_negatives')
+            return False
+
+        revoked = TokenRepository.is_revoked(jti, datetime.utcnow())
+        self._count('checks', 'db_checks', *(('revoked_hits',) if revoked else ()))
+        return revoked
+
+    def revoke(self, jti: str, user_id: int, expires_at: datetime):
+        """Revoga um token até `expires_at` (UTC). Vale imediatamente neste processo."""
+        self._refresh_if_due()
+        with unit_of_work():
+            TokenRepository.revoke(jti, user_id, expires_at)
+            on_commit(lambda: self._add_local(jti))
+
+    def _add_local(self, jti: str):
+        """Adiciona ao filtro uma revogação confirmada neste processo (uma única vez)."""
+        with self._lock:
+            if jti not in self._bloom:
+                self._bloom.add(jti)
+                self._local_jtis.add(jti)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Contadores de consultas (filtro x BD) e tamanho do filtro, para monitoramento."""
+        with self._counters_lock:
+            stats = dict(self._counters)
+        stats['bloom_items'] = self._bloom.count if self._bloom else 0
+        stats['bloom_capacity'] = self._bloom.capacity if self._bloom else self.capacity
+        return stats
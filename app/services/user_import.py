@@ -0,0 +1,69 @@
+
+import csv
+import json
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+REQUIRED_FIELDS = ('nome', 'login', 'email', 'senha')
+# Tamanhos máximos, iguais aos das colunas da tabela 'Usuario'
+MAX_LENGTHS = {'nome': 100, 'login': 50, 'email': 100}
+
+
+def detect_format(path: str) -> str:
+    """
+    Deduz o formato pela extensão do arquivo ('.csv' ou '.jsonl'/'.ndjson').
+
+    Raises:
+        ValueError: Se a extensão não for reconhecida.
+    """
+    lowered = path.lower()
+    if lowered.endswith('.csv'):
+        return 'csv'
+    if lowered.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    raise ValueError(f"Formato não reconhecido para '{path}'. Use {', '.join(SUPPORTED_FORMATS)}.")
+
+
+def read_user_rows(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]]]]:
+    """
+    Lê o arquivo de usuários linha a linha, sem carregá-lo inteiro na memória.
+
+    Yields:
+        (número da linha, registro). Linhas JSONL malformadas geram registro None.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+    elif fmt == 'jsonl':
+        for line_number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                row = None
+            yield line_number, row if isinstance(row, dict) else None
+    else:
+        raise ValueError(f"Formato inválido: {fmt!r}. Use {', '.join(SUPPORTED_FORMATS)}.")
+
+
+def validate_user_row(row: Optional[Dict[str, Any]]) -> Tuple[Optional[Dict[str, str]], Optional[str]]:
+    """
+    Normaliza um registro importado (campos obrigatórios, espaços e tamanhos).
+
+    Returns:
+        (usuário normalizado, None) ou (None, motivo da rejeição).
+    """
+    if row is None:
+        return None, "linha malformada"
+    user = {}
+    for field in REQUIRED_FIELDS:
+        value = row.get(field)
+        if not isinstance(value, str) or not value.strip():
+            return None, f"campo '{field}' ausente"
+        # A senha é usada como veio; os demais campos são aparados
+        user[field] = value if field == 'senha' else value.strip()
+        if len(user[field]) > MAX_LENGTHS.get(field, len(user[field])):
+            return None, f"campo '{field}' maior que {MAX_LENGTHS[field]} caracteres"
+    return user, None
@@ -0,0 +1,43 @@
+
+import json
+import threading
+from typing import Any, Dict, Optional
+
+
+class UserListCache:
+    """
+    Cache das listas já formatadas de cada usuário (favoritos e time).
+
+    As chaves incluem a versão do estado do usuário (ver UserStateVersions):
+    uma alteração incrementa a versão e as entradas antigas simplesmente deixam
+    de ser lidas (e saem pelo LRU/TTL). Assim uma leitura concorrente que grave
+    uma lista antiga depois da alteração nunca é servida.
+    """
+
+    def __init__(self, backend, ttl: float = 300):
+        self.backend = backend
+        self.ttl = ttl
+        self._counters = {'hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(user_id: int, kind: str, version: int) -> str:
+        return f"lists:{int(user_id)}:{kind}:{version}"
+
+    def get(self, user_id: int, kind: str, version: int) -> Optional[Any]:
+        """Retorna a lista (ou página) em cache para esta versão do estado, ou None."""
+        raw = self.backend.get(self._key(user_id, kind, version))
+        with self._lock:
+            self._counters['hits' if raw is not None else 'misses'] += 1
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, user_id: int, kind: str, version: int, data: Any):
+        """Grava a lista formatada ou a página (serializada, para servir qualquer backend)."""
+        self.backend.set(self._key(user_id, kind, version), json.dumps(data).encode(), self.ttl)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Acertos e falhas deste processo, mais os dados do backend."""
+        with self._lock:
+            stats = dict(self._counters)
+        stats.update(self.backend.get_stats())
+        return stats
@@ -1,9 +1,17 @@
 
-from werkzeug.security import generate_password_hash, check_password_hash
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from itertools import islice, repeat
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+from werkzeug.security import generate_password_hash
 from app.repositories.user_repository import UserRepository
+from app.repositories.unit_of_work import unit_of_work
 from app.models.user_model import UsuarioModel
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusyError, normalize_hash_method
+from app.services.user_import import validate_user_row
 from flask_jwt_extended import create_access_token
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 class UserService:
     """
@@ -14,6 +22,10 @@ class UserService:
     def __init__(self):
         """Inicializa o serviço com o Repositório de Usuários."""
         self.repository = UserRepository
+
+    def _get_password_hasher(self) -> PasswordHasher:
+        """Hasher da aplicação atual (pool de threads dedicado, criado em create_app)."""
+        return current_app.extensions['password_hasher']
         
     def register_user(self, data: Dict[str, str]) -> UsuarioModel:
         """
@@ -27,16 +39,18 @@ class UserService:
             
         Raises:
             ValueError: Se o login ou email já estiverem em uso.
+            PasswordHasherBusyError: Se a fila de hashing estiver cheia.
         """
-        # Validação de Unicidade
-        if self.repository.find_by_login(data['login']):
+        # Validação de Unicidade (login e email em uma única consulta)
+        login_taken, email_taken = self.repository.find_taken(data['login'], data['email'])
+        if login_taken:
             raise ValueError("O login fornecido já está em uso.")
-        if self.repository.find_by_email(data['email']):
+        if email_taken:
             raise ValueError("O email fornecido já está em uso.")
             
         # Hashing da Senha (Segurança)
-        # O generate_password_hash aplica um algoritmo seguro de hash 
-        hashed_password = generate_password_hash(data['senha'])
+        # O algoritmo e o custo vêm de PASSWORD_HASH_METHOD (pool de threads dedicado)
+        hashed_password = self._get_password_hasher().hash(data['senha'])
         
         # Criação do Objeto
         new_user = UsuarioModel(
@@ -47,7 +61,12 @@ class UserService:
         )
         
         # Persistência (Usa a camada de Repositório)
-        return self.repository.save(new_user)
+        try:
+            with unit_of_work():
+                return self.repository.save(new_user)
+        except IntegrityError as e:
+            # Outro cadastro com o mesmo login/email foi confirmado depois da verificação
+            raise ValueError("O login ou email fornecido já está em uso.") from e
 
     def login_user(self, login: str, senha: str) -> str:
         """
@@ -62,11 +81,16 @@ class UserService:
             
         Raises:
             ValueError: Se as credenciais estiverem inválidas.
+            PasswordHasherBusyError: Se a fila de hashing estiver cheia.
         """
         user = self.repository.find_by_login(login)
+        hasher = self._get_password_hasher()
         
         # Verifica se o usuário existe e se a senha está correta
-        if user and check_password_hash(user.senha, senha):
+        if user and hasher.verify(user.senha, senha):
+            if hasher.needs_rehash(user.senha):
+                self._rehash_password(user, senha)
+
             # Converter o ID do usuário para string 
             user_identity = str(user.id_usuario)
 
@@ -74,4 +98,115 @@ class UserService:
             access_token = create_access_token(identity=user_identity)
             return access_token
         
-        raise ValueError("Login ou senha inválidos.")
\ No newline at end of file
+        raise ValueError("Login ou senha inválidos.")
+
+    def logout(self, jwt_payload: Dict[str, Any]):
+        """
+        Revoga o token da requisição até a data em que ele expiraria.
+
+        Args:
+            jwt_payload: Claims do token atual (get_jwt()).
+        """
+        expires_at = datetime.fromtimestamp(jwt_payload['exp'], timezone.utc).replace(tzinfo=None)
+        current_app.extensions['token_blocklist'].revoke(jwt_payload['jti'], int(jwt_payload['sub']), expires_at)
+
+    def _rehash_password(self, user: UsuarioModel, senha: str):
+        """
+        Regrava o hash com o método/custo atual (a senha só está disponível no login).
+        É uma melhoria oportunista: se o pool estiver cheio, fica para o próximo login.
+        """
+        try:
+            user.senha = self._get_password_hasher().hash(senha)
+        except PasswordHasherBusyError:
+            return
+        with unit_of_work():
+            self.repository.save(user)
+
+    def import_users(self, rows: Iterable[Tuple[int, Optional[Dict[str, Any]]]], batch_size: int = 1000,
+                     workers: int = 1, hash_method: str = None,
+                     progress: Callable[[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+        """
+        Importa usuários em massa (migração do sistema legado).
+
+        Os registros são consumidos em fluxo (ver `read_user_rows`) e gravados em
+        lotes: cada lote faz uma consulta de duplicados, calcula os hashes em um
+        pool de processos e é confirmado em uma única transação (checkpoint).
+        Logins/emails já cadastrados (ou repetidos no arquivo) são pulados.
+
+        Args:
+            rows: Pares (número da linha, registro com nome, login, email e senha).
+            batch_size: Usuários por lote/commit.
+            workers: Processos para o hash das senhas (1 = no próprio processo).
+            hash_method: Método/custo do hash (padrão: PASSWORD_HASH_METHOD). Um custo
+                menor agiliza a migração; o hash é regravado no primeiro login.
+            progress: Callback opcional chamado com o resumo parcial após cada lote.
+
+        Returns:
+            Um resumo com 'total', 'inserted', 'skipped', 'invalid' e 'errors'
+            (até 100 pares (linha, motivo) das linhas rejeitadas).
+
+        Raises:
+            ValueError: Se o método de hash for inválido.
+        """
+        method = normalize_hash_method(hash_method or current_app.config['PASSWORD_HASH_METHOD'])
+        summary = {'total': 0, 'inserted': 0, 'skipped': 0, 'invalid': 0, 'errors': []}
+        seen_logins, seen_emails = set(), set()
+
+        pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+        # Cada processo recebe os hashes em blocos (menos idas e voltas entre processos)
+        chunksize = max(1, batch_size // (max(workers, 1) * 4))
+        try:
+            rows = iter(rows)
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                self._import_batch(batch, method, pool, chunksize, seen_logins, seen_emails, summary)
+                if progress:
+                    progress(summary)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return summary
+
+    def _import_batch(self, batch: List[Tuple[int, Optional[Dict[str, Any]]]], method: str,
+                      pool: Optional[ProcessPoolExecutor], chunksize: int, seen_logins: Set[str], seen_emails: Set[str],
+                      summary: Dict[str, Any]):
+        """Valida, remove duplicados, calcula os hashes e grava um lote (uma transação)."""
+        summary['total'] += len(batch)
+        users = []
+        for line_number, row in batch:
+            user, error = validate_user_row(row)
+            if error:
+                summary['invalid'] += 1
+                if len(summary['errors']) < 100:
+                    summary['errors'].append((line_number, error))
+            else:
+                users.append(user)
+
+        existing_logins, existing_emails = self.repository.find_existing(
+            (u['login'] for u in users), (u['email'] for u in users)
+        )
+        pending = []
+        for user in users:
+            if user['login'] in existing_logins or user['login'] in seen_logins \
+                    or user['email'] in existing_emails or user['email'] in seen_emails:
+                summary['skipped'] += 1
+                continue
+            seen_logins.add(user['login'])
+            seen_emails.add(user['email'])
+            pending.append(user)
+
+        passwords = [user['senha'] for user in pending]
+        if pool is not None:
+            hashes = pool.map(generate_password_hash, passwords, repeat(method), chunksize=chunksize)
+        else:
+            hashes = map(generate_password_hash, passwords, repeat(method))
+        for user, password_hash in zip(pending, hashes):
+            user['senha'] = password_hash
+
+        with unit_of_work():
+            inserted = self.repository.insert_many(pending)
+        summary['inserted'] += inserted
+        # Cadastros concorrentes com o mesmo login/email são ignorados pelo INSERT
+        summary['skipped'] += len(pending) - inserted
@@ -0,0 +1,37 @@
+
+import uuid
+
+
+class UserStateVersions:
+    """
+    Versão do estado (favoritos/time) de cada usuário, guardada no backend de cache.
+    Incrementada a cada alteração, permite gerar ETags e chaves de cache sem consultar o BD.
+
+    O `nonce` identifica o conteúdo do backend: se ele for reiniciado ou esvaziado
+    (ex.: novo processo com o backend em memória), as versões voltam a zero, mas o
+    nonce muda junto — uma ETag antiga jamais gera um 304 indevido.
+    """
+
+    NONCE_KEY = 'state:nonce'
+
+    def __init__(self, backend):
+        self.backend = backend
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"state:version:{int(user_id)}"
+
+    def get(self, user_id: int) -> int:
+        """Versão atual do estado do usuário (0 se nunca foi alterado)."""
+        return self.backend.get_counter(self._key(user_id))
+
+    def bump(self, user_id: int) -> int:
+        """Registra uma alteração no estado do usuário e retorna a nova versão."""
+        return self.backend.incr(self._key(user_id))
+
+    def nonce(self) -> str:
+        return self.backend.add(self.NONCE_KEY, uuid.uuid4().hex)
+
+    def token(self, user_id: int) -> str:
+        """Identificador opaco da versão atual, usado na composição das ETags."""
+        return f"{self.nonce()}:{self.get(user_id)}"
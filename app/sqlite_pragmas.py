@@ -0,0 +1,62 @@
+
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: Dict[str, Any]):
+    """Executa `PRAGMA nome = valor` para cada item, na conexão DBAPI recém-aberta."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+    finally:
+        cursor.close()
+
+
+def register_sqlite_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> bool:
+    """
+    Aplica as PRAGMAs a toda conexão que o engine abrir (evento 'connect').
+    Não faz nada para outros bancos ou se não houver PRAGMAs configuradas.
+
+    Returns:
+        True se o listener foi registrado.
+    """
+    if not pragmas or engine.dialect.name != 'sqlite':
+        return False
+
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    return True
+
+
+def register_sqlite_transactions(engine: Engine) -> bool:
+    """
+    Passa o controle das transações do driver `sqlite3` para o SQLAlchemy.
+
+    Por padrão o driver só abre a transação antes do primeiro INSERT/UPDATE/DELETE,
+    então as leituras anteriores ficam fora dela. Aqui toda transação começa com
+    BEGIN (ou BEGIN IMMEDIATE, com a opção de execução `sqlite_begin`; ver
+    `unit_of_work`), incluindo as leituras.
+
+    O SQLite em memória fica de fora: ele usa uma única conexão compartilhada
+    por todas as sessões, que não comporta transações explícitas simultâneas.
+
+    Returns:
+        True se os listeners foram registrados.
+    """
+    if engine.dialect.name != 'sqlite' or engine.url.database in (None, '', ':memory:'):
+        return False
+
+    @event.listens_for(engine, 'connect')
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def _begin(conn):
+        mode = conn.get_execution_options().get('sqlite_begin', 'DEFERRED')
+        conn.exec_driver_sql(f"BEGIN {mode}")
+
+    return True
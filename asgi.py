@@ -0,0 +1,18 @@
+"""
+Ponto de entrada ASGI da aplicação (alternativa ao run.py / WSGI).
+
+Uso:
+    WEB_CONCURRENCY=4 uvicorn asgi:app
+
+Informe os workers por WEB_CONCURRENCY, e não por --workers: só assim a
+aplicação sabe quantos são (ver check_worker_setup).
+
+Requer `httpx` (pip install httpx) e um servidor ASGI (ex.: uvicorn). A
+listagem de Pokémon roda como corrotina no event loop do servidor: enquanto
+espera a PokeAPI, não ocupa thread. As demais rotas rodam em um pool de
+threads (ASGI_THREADS). Ver app/asgi_app.py.
+"""
+from app.asgi_app import create_asgi_app
+from run import app as flask_app
+
+app = create_asgi_app(flask_app)
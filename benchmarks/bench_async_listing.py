@@ -0,0 +1,139 @@
+"""
+Teste de carga da listagem em um único worker, contra um servidor local que
+imita a PokeAPI com latência artificial (sem rede externa).
+
+Cada requisição pede uma página diferente, sem cache, então precisa buscar
+todos os seus Pokémon na PokeAPI. Compara:
+- WSGI: uma thread por requisição, e as buscas ocupam o pool de threads do
+  cliente (POKEAPI_MAX_CONCURRENCY);
+- ASGI (asgi.py): as listagens rodam como corrotinas no event loop do servidor
+  e esperam a PokeAPI juntas, sem ocupar threads.
+
+O servidor falso roda no mesmo processo e disputa a CPU com a aplicação; com
+a PokeAPI real a diferença a favor do modo assíncrono tende a ser maior.
+
+Uso (a partir da raiz do projeto; requer httpx):
+    python -m benchmarks.bench_async_listing
+"""
+import asyncio
+import contextvars
+import os
+import statistics
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from flask_jwt_extended import create_access_token
+
+from app import create_app
+from app.asgi_app import create_asgi_app
+from app.config import TestingConfig
+from app.migrations import migrate
+from app.external.poke_api_client import PokeAPIClient
+from app.external.response_cache import ResponseCache
+from tests.stub_pokeapi import start_stub_pokeapi
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _reset_caches(app):
+    """Descarta os registros e fragmentos em memória: cada rodada volta à PokeAPI."""
+    app.extensions.pop('pokemon_records', None)
+    app.extensions.pop('catalog_json_fragments', None)
+
+
+def _report(label: str, concurrency: int, latencies, elapsed: float):
+    p95 = sorted(latencies)[int(len(latencies) * 0.95) - 1]
+    print(f"{label:26} {concurrency:4} simultâneas | {len(latencies) / elapsed:7.1f} req/s | "
+          f"mediana {statistics.median(latencies) * 1000:7.1f} ms | p95 {p95 * 1000:7.1f} ms")
+
+
+def _run_threads(app, headers, concurrency: int, rounds: int, page_size: int):
+    """Requisições HTTP (cliente de teste) em `concurrency` threads, como um servidor com threads."""
+    def request(offset):
+        start = time.perf_counter()
+        response = app.test_client().get(f'/api/v1/pokemon/?limit={page_size}&offset={offset}', headers=headers)
+        assert response.status_code == 200 and len(response.get_json()['data']) == page_size
+        return time.perf_counter() - start
+
+    latencies = []
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for r in range(rounds):
+            _reset_caches(app)
+            offsets = [(r * concurrency + i) * page_size for i in range(concurrency)]
+            latencies.extend(executor.map(request, offsets))
+    return latencies, time.perf_counter() - start
+
+
+def _run_asgi(app, asgi_app, headers, concurrency: int, rounds: int, page_size: int):
+    """Requisições HTTP simultâneas à aplicação ASGI, como tasks em um único event loop."""
+    async def request(client, offset):
+        start = time.perf_counter()
+        response = await client.get(f'/api/v1/pokemon/?limit={page_size}&offset={offset}', headers=headers)
+        assert response.status_code == 200 and len(response.json()['data']) == page_size
+        return time.perf_counter() - start
+
+    async def run_round(r):
+        offsets = [(r * concurrency + i) * page_size for i in range(concurrency)]
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            return await asyncio.gather(*(request(client, offset) for offset in offsets))
+
+    latencies = []
+    start = time.perf_counter()
+    for r in range(rounds):
+        _reset_caches(app)
+        # Contexto vazio: sem o app context do benchmark, como em um worker ASGI
+        latencies.extend(contextvars.Context().run(asyncio.run, run_round(r)))
+    return latencies, time.perf_counter() - start
+
+
+def main(latency: float = 0.05, page_size: int = 20, rounds: int = 3, levels=(4, 16, 32)):
+    if httpx is None:
+        print("Este benchmark requer o pacote 'httpx' (pip install httpx).")
+        return
+
+    stub, server = start_stub_pokeapi()
+    stub.names = [f"poke{i}" for i in range(1, max(levels) * rounds * page_size + 1)]
+    stub.delay = latency
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            class BenchConfig(TestingConfig):
+                SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+                JWT_SECRET_KEY = 'chave-do-benchmark-com-32-bytes-ou-mais'
+
+            app = create_app(config_object=BenchConfig)
+            from app.api.pokemon_routes import pokemon_service
+
+            with app.app_context():
+                migrate()
+                # Cache mínimo: mede apenas as buscas na PokeAPI
+                client = PokeAPIClient(base_url=stub.base_url, cache=ResponseCache(max_memory_bytes=1))
+                pokemon_service.api_client = client
+                pokemon_service.pokemon_repo.api_client = client
+                headers = {'Authorization': f"Bearer {create_access_token(identity='1')}"}
+                # Aquecimento: monta o índice de nomes
+                app.test_client().get('/api/v1/pokemon/?limit=1', headers=headers)
+
+                print(f"PokeAPI com {latency * 1000:.0f} ms de latência, páginas de {page_size} Pokémon sem cache, "
+                      f"{rounds} rodadas por nível (1 worker)")
+                asgi_app = create_asgi_app(app)
+                for concurrency in levels:
+                    _report("WSGI (threads)", concurrency, *_run_threads(app, headers, concurrency, rounds, page_size))
+                    _report("ASGI (corrotinas)", concurrency, *_run_asgi(app, asgi_app, headers, concurrency, rounds, page_size))
+                    print()
+
+                loop, async_client = pokemon_service._get_async_runtime()
+                loop.run(async_client.aclose())
+                loop.shutdown()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
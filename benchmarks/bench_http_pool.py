@@ -0,0 +1,51 @@
+"""
+Benchmark do pool de conexões do PokeAPIClient contra um servidor local
+que imita a PokeAPI (sem rede externa).
+
+Compara `requests.get` (uma conexão TCP nova por chamada) com o cliente
+pooled (keep-alive) e mostra quantas conexões cada um abriu. Em localhost
+e sem TLS a economia é só o handshake TCP; contra a PokeAPI real (HTTPS)
+cada conexão nova também paga o handshake TLS.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_http_pool
+"""
+import time
+
+import requests
+
+from app.external.poke_api_client import PokeAPIClient
+from app.external.response_cache import ResponseCache
+from tests.stub_pokeapi import start_stub_pokeapi
+
+
+def _run(label: str, stub, fetch, count: int):
+    stub.connections.clear()
+    start = time.perf_counter()
+    for i in range(count):
+        fetch(f"poke{(i % len(stub.names)) + 1}")
+    elapsed = time.perf_counter() - start
+    print(f"{label:28} {count} requisições | {elapsed * 1000:8.1f} ms | "
+          f"{elapsed / count * 1e6:7.0f} µs/req | {len(stub.connections)} conexões")
+    return elapsed
+
+
+def main(count: int = 500):
+    stub, server = start_stub_pokeapi()
+    try:
+        unpooled = _run("requests.get (sem pool)", stub,
+                        lambda name: requests.get(f"{stub.base_url}pokemon/{name}", timeout=10).json(), count)
+
+        # Cache mínimo e chaves sempre novas: mede apenas o HTTP
+        client = PokeAPIClient(base_url=stub.base_url, cache=ResponseCache(max_memory_bytes=1))
+        pooled = _run("PokeAPIClient (keep-alive)", stub, client.get_pokemon_details, count)
+
+        print(f"Latência economizada: {(unpooled - pooled) / count * 1e6:.0f} µs por requisição "
+              f"({(1 - pooled / unpooled) * 100:.0f}%)")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
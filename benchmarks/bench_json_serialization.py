@@ -0,0 +1,76 @@
+"""
+Benchmark da serialização das respostas da listagem: jsonify com o json
+padrão vs. orjson, e montagem a partir dos fragmentos JSON em cache.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_json_serialization
+"""
+import time
+
+from flask import Flask
+
+from app.json_provider import OrjsonJSONProvider, StdlibJSONProvider, fragments_response, orjson
+from app.services.catalog_fragments import CatalogFragmentCache
+
+STAT_NAMES = ['hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed']
+
+
+def _pokemon(pokemon_id: int) -> dict:
+    """Um item da listagem no formato de `PokemonRecord.to_dict`."""
+    return {
+        'id_pokemon': pokemon_id,
+        'nome': f'Pokemon-{pokemon_id}',
+        'codigo': str(pokemon_id),
+        'tipos': ['Grass', 'Poison'] if pokemon_id % 2 else ['Fire'],
+        'imagem_uri': f'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{pokemon_id}.png',
+        'stats': {name: (pokemon_id * 7 + i) % 160 for i, name in enumerate(STAT_NAMES)},
+    }
+
+
+def _envelope(count: int) -> dict:
+    return {'msg': 'Lista de Pokémon obtida com sucesso.', 'total_retornado': count, 'total': 1302, 'next_offset': 100}
+
+
+def _bench(label: str, fn, repeat: int):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        size = len(fn().get_data())
+    per_call = (time.perf_counter() - start) / repeat
+    print(f"{label:34} | {per_call * 1e6:8.1f} µs/resposta | {size} bytes")
+
+
+def main(page_size: int = 100, repeat: int = 2000):
+    pokemons = [_pokemon(i) for i in range(1, page_size + 1)]
+    favorites = set(range(1, page_size + 1, 3))
+
+    providers = [('json padrão', StdlibJSONProvider)]
+    if orjson is not None:
+        providers.append(('orjson', OrjsonJSONProvider))
+    else:
+        print("orjson não instalado: apenas o json padrão será medido.")
+
+    for label, provider_class in providers:
+        app = Flask(__name__)
+        app.json = provider_class(app)
+
+        def from_dicts():
+            # Como antes: um dicionário novo por item, serializado a cada resposta
+            data = [{**p, 'is_favorite': p['id_pokemon'] in favorites, 'in_battle_team': False} for p in pokemons]
+            return app.json.response({**_envelope(len(data)), 'data': data})
+
+        fragments = CatalogFragmentCache(app.json.dumps_bytes)
+        for p in pokemons:
+            fragments.add(p['nome'], p)
+
+        def from_fragments():
+            data = [fragments.get(p['nome']).render(p['id_pokemon'] in favorites, False) for p in pokemons]
+            return fragments_response(app, _envelope(len(data)), 'data', data)
+
+        with app.app_context():
+            _bench(f"{label} (dicionários)", from_dicts, repeat)
+            _bench(f"{label} (fragmentos em cache)", from_fragments, repeat)
+
+
+if __name__ == '__main__':
+    main()
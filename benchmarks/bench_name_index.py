@@ -0,0 +1,52 @@
+"""
+Benchmark do índice de busca por nome (PokemonNameIndex).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_name_index
+"""
+import random
+import string
+import time
+
+from app.services.pokemon_name_index import PokemonNameIndex
+
+QUERIES = ["char", "saur", "pi", "mega", "on", "zzz", "a"]
+
+
+def _synthetic_names(count: int) -> list:
+    """Gera nomes parecidos com os da PokeAPI (minúsculas e hífen)."""
+    random.seed(42)
+    names = set()
+    while len(names) < count:
+        size = random.randint(4, 12)
+        name = ''.join(random.choice(string.ascii_lowercase) for _ in range(size))
+        if random.random() < 0.1:
+            name += "-mega"
+        names.add(name)
+    return list(names)
+
+
+def main(count: int = 1500, repeat: int = 2000):
+    names = _synthetic_names(count) + ["charmander", "charmeleon", "charizard", "bulbasaur"]
+
+    start = time.perf_counter()
+    index = PokemonNameIndex()
+    index.add(names)
+    print(f"Índice montado com {len(index)} nomes em {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    for query in QUERIES:
+        start = time.perf_counter()
+        for _ in range(repeat):
+            matches = index.search(query)
+        per_lookup = (time.perf_counter() - start) / repeat
+        print(f"search({query!r:8}) -> {len(matches):5} resultados | {per_lookup * 1e6:8.1f} µs/consulta")
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            linear = [n for n in names if query in n]
+        per_scan = (time.perf_counter() - start) / repeat
+        print(f"{'varredura linear':18} -> {len(linear):5} resultados | {per_scan * 1e6:8.1f} µs/consulta")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark do custo do hash de senhas: logins (verificações) por segundo por
+núcleo para cada método/custo, e a vazão do pool dedicado (PasswordHasher).
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_password_hashing
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+from app.services.password_hasher import PasswordHasher
+
+METHODS = [
+    'scrypt:32768:8:1',     # padrão do werkzeug (e da aplicação)
+    'scrypt:16384:8:1',
+    'pbkdf2:sha256:1000000',
+    'pbkdf2:sha256:600000', # mínimo recomendado pela OWASP para PBKDF2-SHA256
+]
+PASSWORD = 'senha-de-teste'
+
+
+def _logins_per_second(password_hash: str, min_seconds: float) -> float:
+    """Verificações por segundo em uma única thread (= um núcleo)."""
+    count = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_seconds:
+        check_password_hash(password_hash, PASSWORD)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def _pool_throughput(method: str, password_hash: str, workers: int, requests: int) -> float:
+    """Logins por segundo com `requests` threads de requisição disputando o pool."""
+    hasher = PasswordHasher(method, max_workers=workers, max_pending=requests)
+    with ThreadPoolExecutor(max_workers=requests) as clients:
+        start = time.perf_counter()
+        list(clients.map(lambda _: hasher.verify(password_hash, PASSWORD), range(requests * 2)))
+        elapsed = time.perf_counter() - start
+    hasher.shutdown()
+    return requests * 2 / elapsed
+
+
+def main(min_seconds: float = 1.0):
+    workers = min(4, os.cpu_count() or 1)
+    print(f"{os.cpu_count()} núcleos; pool com {workers} threads")
+    for method in METHODS:
+        password_hash = generate_password_hash(PASSWORD, method)
+        per_core = _logins_per_second(password_hash, min_seconds)
+        pool = _pool_throughput(method, password_hash, workers, requests=16)
+        print(f"{method:24} | {per_core:8.1f} logins/s/núcleo | {1000 / per_core:7.1f} ms/login | "
+              f"pool: {pool:8.1f} logins/s")
+
+
+if __name__ == '__main__':
+    main()
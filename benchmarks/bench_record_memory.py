@@ -0,0 +1,80 @@
+"""
+Benchmark de memória do catálogo em memória: dicionários por Pokémon (com o
+JSON bruto da PokeAPI ainda vivo, como antes) vs. `PokemonRecord` compacto.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_record_memory
+"""
+import gc
+import json
+import random
+import tracemalloc
+
+from app.services.pokemon_record import STAT_NAMES, PokemonRecord
+
+TYPES = ['normal', 'fire', 'water', 'grass', 'electric', 'ice', 'fighting', 'poison', 'ground',
+         'flying', 'psychic', 'bug', 'rock', 'ghost', 'dragon', 'dark', 'steel', 'fairy']
+ARTWORK = 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{}.png'
+
+
+def _raw_details(pokemon_id: int) -> bytes:
+    """Resposta de detalhes parecida com a da PokeAPI (com moves, como a real)."""
+    random.seed(pokemon_id)
+    return json.dumps({
+        'id': pokemon_id,
+        'name': f'pokemon-{pokemon_id}',
+        'types': [{'slot': i + 1, 'type': {'name': t, 'url': f'https://pokeapi.co/api/v2/type/{t}/'}}
+                  for i, t in enumerate(random.sample(TYPES, random.randint(1, 2)))],
+        'sprites': {'other': {'official-artwork': {'front_default': ARTWORK.format(pokemon_id)}}},
+        'stats': [{'base_stat': random.randint(5, 255), 'effort': 0, 'stat': {'name': name}} for name in STAT_NAMES],
+        'moves': [{'move': {'name': f'move-{m}', 'url': f'https://pokeapi.co/api/v2/move/{m}/'}}
+                  for m in random.sample(range(900), 60)],
+    }).encode()
+
+
+def _as_dict(raw_data: dict) -> dict:
+    """Formato anterior: um dicionário novo por Pokémon (como `_extract_data_from_details`)."""
+    return {
+        'id_pokemon': raw_data['id'],
+        'nome': raw_data['name'].capitalize(),
+        'codigo': str(raw_data['id']),
+        'tipos': [t['type']['name'].capitalize() for t in raw_data['types']],
+        'imagem_uri': raw_data['sprites']['other']['official-artwork']['front_default'],
+        'stats': {s['stat']['name']: s['base_stat'] for s in raw_data['stats']},
+    }
+
+
+def _measure(build) -> int:
+    """Bytes alocados (e ainda vivos) pelo resultado de `build`."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main(count: int = 1300):
+    bodies = [_raw_details(i) for i in range(1, count + 1)]
+
+    def dicts_with_raw():
+        raws = [json.loads(body) for body in bodies]
+        return raws, [_as_dict(raw) for raw in raws]
+
+    def dicts_only():
+        return [_as_dict(json.loads(body)) for body in bodies]
+
+    def records():
+        return [PokemonRecord.from_details(json.loads(body)) for body in bodies]
+
+    print(f"{count} Pokémon")
+    for label, build in (("dicionários + JSON bruto", dicts_with_raw),
+                         ("dicionários", dicts_only),
+                         ("PokemonRecord", records)):
+        total = _measure(build)
+        print(f"{label:26} | {total / 1024:9.1f} KiB | {total / count:8.1f} bytes/Pokémon")
+
+
+if __name__ == '__main__':
+    main()
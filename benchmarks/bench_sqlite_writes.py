@@ -0,0 +1,99 @@
+"""
+Benchmark de escritas concorrentes no SQLite: perfil 'default' x 'tuned'.
+
+Várias threads gravam registros de PokemonUsuario (um commit por escrita, como
+um toggle) enquanto outras leem favoritos, em um banco em arquivo temporário.
+Mostra o tempo total, escritas por segundo e quantas falharam com
+"database is locked".
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_sqlite_writes
+"""
+import os
+import tempfile
+import threading
+import time
+
+os.environ.setdefault('POKEAPI_CACHE_PATH', '')
+
+from sqlalchemy.exc import OperationalError
+
+from app import create_app, db
+from app.config import Config
+from app.migrations import migrate
+from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.tipo_pokemon_model import TipoPokemonModel
+from app.models.user_model import UsuarioModel
+from app.repositories.pokemon_repository import PokemonRepository
+
+
+def _make_app(path: str, profile: str):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{path}"
+        SQLITE_PROFILE = profile
+        # Um escritor/leitor por thread, sem esperar por conexões do pool
+        SQLALCHEMY_ENGINE_OPTIONS = {'pool_size': 32, 'max_overflow': 0}
+    return create_app(BenchConfig)
+
+
+def _run(profile: str, writers: int, readers: int, writes_per_thread: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        app = _make_app(os.path.join(tmp, 'bench.db'), profile)
+        with app.app_context():
+            migrate()
+            db.session.add(UsuarioModel(nome='Bench', login='bench', email='bench@pokedex.com', senha='x'))
+            db.session.add(TipoPokemonModel(descricao='Normal'))
+            db.session.commit()
+
+        errors = []
+        done = threading.Event()
+
+        def writer(thread_id: int):
+            with app.app_context():
+                for i in range(writes_per_thread):
+                    try:
+                        db.session.add(PokemonUsuarioModel(
+                            id_usuario=1, id_tipo_pokemon=1, codigo=f"{thread_id}-{i}",
+                            nome='poke', imagem_uri='x', favorito=True
+                        ))
+                        db.session.commit()
+                    except OperationalError as e:
+                        db.session.rollback()
+                        errors.append(e)
+
+        def reader():
+            with app.app_context():
+                while not done.is_set():
+                    PokemonRepository.get_user_favorite_pokemons(1)
+                    db.session.rollback()
+
+        reader_threads = [threading.Thread(target=reader) for _ in range(readers)]
+        writer_threads = [threading.Thread(target=writer, args=(t,)) for t in range(writers)]
+        for t in reader_threads:
+            t.start()
+        start = time.perf_counter()
+        for t in writer_threads:
+            t.start()
+        for t in writer_threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        for t in reader_threads:
+            t.join()
+
+        with app.app_context():
+            db.engine.dispose()
+
+    total = writers * writes_per_thread
+    print(f"{profile:8} {total} escritas ({writers} escritores, {readers} leitores) | "
+          f"{elapsed * 1000:8.1f} ms | {(total - len(errors)) / elapsed:8.0f} escritas/s | "
+          f"{len(errors)} 'database is locked'")
+
+
+def main(writers: int = 8, readers: int = 4, writes_per_thread: int = 100):
+    for profile in ('default', 'tuned'):
+        _run(profile, writers, readers, writes_per_thread)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark da partida a frio de um worker: importação + `create_app` e tempo
+até a primeira resposta, cada rodada em um processo Python novo (como um
+worker recém-criado pelo autoscaling).
+
+Mostra também os módulos mais caros de importar, medidos com
+`python -X importtime`.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_startup
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Executado em cada processo novo: importa a aplicação e faz a primeira requisição
+CHILD = """
+import json, time
+start = time.perf_counter()
+from run import app
+created = time.perf_counter()
+from flask_jwt_extended import create_access_token
+with app.app_context():
+    headers = {'Authorization': 'Bearer ' + create_access_token(identity='1')}
+response = app.test_client().get('/api/v1/pokemon/team', headers=headers)
+assert response.status_code == 200, response.status_code
+print(json.dumps({'create_app': created - start, 'first_request': time.perf_counter() - created}))
+"""
+
+
+def _env(db_path: str) -> dict:
+    env = dict(os.environ)
+    env.update({
+        'DATABASE_URL': f"sqlite:///{db_path}",
+        'SECRET_KEY': 'chave-do-benchmark-com-32-bytes-ou-mais',
+        'POKEAPI_CACHE_PATH': '', # Sem cache em disco
+    })
+    return env
+
+
+def _migrate(env: dict):
+    """Passo de implantação: cria o esquema antes de subir os workers."""
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'run', 'db', 'upgrade'],
+                   cwd=ROOT, env=env, check=True, capture_output=True)
+
+
+def _cold_start(env: dict) -> dict:
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-c', CHILD], cwd=ROOT, env=env, check=True, capture_output=True, text=True)
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    phases['total'] = time.perf_counter() - start
+    return phases
+
+
+def _import_profile(env: dict, top: int):
+    """Tempo de importação (-X importtime) somado por pacote de topo, em ms."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'from run import app'],
+                            cwd=ROOT, env=env, check=True, capture_output=True, text=True)
+    by_package = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        package = name.strip().split('.')[0]
+        by_package[package] = by_package.get(package, 0) + int(self_us) / 1000
+    total = sum(by_package.values())
+    return total, sorted(((ms, package) for package, ms in by_package.items()), reverse=True)[:top]
+
+
+def main(runs: int = 5, top: int = 12):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = _env(os.path.join(tmp, 'bench.db'))
+        _migrate(env)
+
+        results = [_cold_start(env) for _ in range(runs)]
+        print(f"Partida a frio ({runs} processos novos, mediana):")
+        for phase, label in (('create_app', 'importação + create_app'), ('first_request', 'primeira requisição'),
+                             ('total', 'processo até a 1ª resposta')):
+            print(f"  {label:28} {statistics.median(r[phase] for r in results) * 1000:8.1f} ms")
+
+        total, heaviest = _import_profile(env, top)
+        print(f"\nImportações no `from run import app` (-X importtime): {total:.1f} ms no total")
+        for ms, package in heaviest:
+            print(f"  {ms:8.1f} ms  {package}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark do custo da revogação de tokens por requisição autenticada:
+sem checagem vs. filtro de Bloom (TokenBlocklist) vs. uma consulta ao BD
+por requisição, com milhares de tokens revogados.
+
+Uso (a partir da raiz do projeto):
+    python -m benchmarks.bench_token_blocklist
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from flask_jwt_extended import create_access_token, jwt_required
+
+from app import create_app, db
+from app.config import TestingConfig
+from app.migrations import migrate
+from app.models.token_revogado_model import TokenRevogadoModel
+from app.repositories.token_repository import TokenRepository
+from app.services.token_blocklist import TokenBlocklist
+
+
+class _NoBlocklist:
+    """Linha de base: nenhum token é revogado e nada é consultado."""
+
+    def is_revoked(self, jti: str) -> bool:
+        return False
+
+
+class _QueryPerRequest:
+    """Abordagem ingênua: uma consulta ao BD em toda requisição."""
+
+    def is_revoked(self, jti: str) -> bool:
+        return TokenRepository.is_revoked(jti, datetime.utcnow())
+
+
+def main(revoked: int = 10000, requests: int = 2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+            JWT_SECRET_KEY = 'chave-do-benchmark-com-32-bytes-ou-mais'
+
+        app = create_app(config_object=BenchConfig)
+
+        @app.route('/bench')
+        @jwt_required()
+        def bench():
+            return 'ok'
+
+        with app.app_context():
+            migrate()
+            expires_at = datetime.utcnow() + timedelta(hours=1)
+            db.session.execute(db.insert(TokenRevogadoModel.__table__), [
+                {'JTI': f'revogado-{i}', 'IDUsuario': 1, 'ExpiraEm': expires_at, 'DtInclusao': datetime.utcnow()}
+                for i in range(revoked)
+            ])
+            db.session.commit()
+            headers = {'Authorization': f"Bearer {create_access_token(identity='1')}"}
+
+            bloom = TokenBlocklist(capacity=revoked * 2)
+            bloom.load()
+            variants = [('sem checagem', _NoBlocklist()), ('filtro de Bloom', bloom), ('consulta por requisição', _QueryPerRequest())]
+
+            print(f"{revoked} tokens revogados, {requests} requisições autenticadas por variante")
+            client = app.test_client()
+            baseline = None
+            for label, blocklist in variants:
+                app.extensions['token_blocklist'] = blocklist
+                client.get('/bench', headers=headers)
+                start = time.perf_counter()
+                for _ in range(requests):
+                    client.get('/bench', headers=headers)
+                per_request = (time.perf_counter() - start) / requests * 1e6
+                baseline = baseline or per_request
+                print(f"{label:24} | {per_request:8.1f} µs/requisição | +{per_request - baseline:7.1f} µs")
+
+                start = time.perf_counter()
+                for _ in range(requests):
+                    blocklist.is_revoked('token-valido')
+                print(f"{'':24} | {(time.perf_counter() - start) / requests * 1e6:8.1f} µs por checagem isolada")
+
+
+if __name__ == '__main__':
+    main()
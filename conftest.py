@@ -2,7 +2,11 @@
 import pytest
 from app import create_app, db
 from app.config import TestingConfig
+from app.migrations import migrate
 import json
+from tests.stub_pokeapi import start_stub_pokeapi
+from app.external.poke_api_client import PokeAPIClient
+from app.external.response_cache import ResponseCache
 
 from app.models.user_model import UsuarioModel 
 from werkzeug.security import generate_password_hash 
@@ -22,7 +26,7 @@ def app():
     
     with app.app_context():
         # Cria as tabelas no BD em memória antes de rodar os testes
-        db.create_all()
+        migrate()
         yield app
         # Remove as tabelas após os testes
         db.drop_all()
@@ -66,4 +70,82 @@ def auth_headers(client, app): # <--- Adicione 'app' como argumento
         }
         
         # O ID do usuário logado (retornado do JWT) é uma STRING
-        return headers
\ No newline at end of file
+        return headers
+
+@pytest.fixture(scope='function')
+def stub_pokeapi():
+    """
+    Sobe um servidor HTTP local que imita a PokeAPI, com latência artificial
+    configurável, para testar o cliente sem depender da rede.
+    """
+    stub, server = start_stub_pokeapi()
+    yield stub
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(scope='function')
+def make_pokeapi_client(stub_pokeapi):
+    """
+    Fábrica de clientes da PokeAPI apontando para o servidor falso, com cache
+    isolado (só memória). Os argumentos são repassados ao PokeAPIClient.
+    """
+    def make(**kwargs) -> PokeAPIClient:
+        kwargs.setdefault('cache', ResponseCache(max_memory_bytes=1024 * 1024))
+        return PokeAPIClient(base_url=stub_pokeapi.base_url, **kwargs)
+    return make
+
+@pytest.fixture(scope='function')
+def sync_catalog(app, make_pokeapi_client):
+    """Sincroniza o catálogo local a partir do servidor falso (a listagem passa a vir do BD)."""
+    from app.services.catalog_service import CatalogService
+
+    def sync():
+        return CatalogService(api_client=make_pokeapi_client()).sync_catalog(workers=4, batch_size=10)
+    return sync
+
+@pytest.fixture(scope='function')
+def point_service_to_stub(monkeypatch, make_pokeapi_client):
+    """
+    Fábrica: aponta o serviço de Pokémon da aplicação atual (e seu repositório)
+    para o servidor falso, com um runtime assíncrono novo. Retorna o serviço.
+    """
+    from app.api.pokemon_routes import get_pokemon_service
+    services = []
+
+    def point():
+        service = get_pokemon_service()
+        client = make_pokeapi_client()
+        monkeypatch.setattr(service, 'api_client', client)
+        monkeypatch.setattr(service.pokemon_repo, 'api_client', client)
+        monkeypatch.setattr(service, '_async_runtime', None)
+        services.append(service)
+        return service
+
+    yield point
+    for service in services:
+        if service._async_runtime is not None:
+            loop, async_client = service._async_runtime
+            loop.run(async_client.aclose())
+            loop.shutdown()
+
+@pytest.fixture(scope='function')
+def stub_service(app, point_service_to_stub):
+    """O serviço de Pokémon da aplicação de teste, apontado para o servidor falso."""
+    return point_service_to_stub()
+
+@pytest.fixture(scope='function')
+def make_file_app(tmp_path):
+    """
+    Fábrica de aplicações sobre um banco SQLite em arquivo (em tmp_path), para os
+    testes que precisam de conexões reais (PRAGMAs, concorrência, DDL).
+    Os argumentos nomeados sobrescrevem a TestingConfig; com migrate_schema=True
+    o esquema é criado como no `flask db upgrade`.
+    """
+    def make(migrate_schema: bool = True, **overrides):
+        overrides.setdefault('SQLALCHEMY_DATABASE_URI', f"sqlite:///{tmp_path / 'pokedex.db'}")
+        app = create_app(type('FileConfig', (TestingConfig,), overrides))
+        if migrate_schema:
+            with app.app_context():
+                migrate()
+        return app
+    return make
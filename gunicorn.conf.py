@@ -0,0 +1,14 @@
+"""
+Configuração do gunicorn, carregada automaticamente quando ele é iniciado na
+raiz do projeto (ex.: `gunicorn -w 4 run:app`).
+"""
+
+
+def on_starting(server):
+    """
+    Antes de criar os workers: recusa vários workers com o cache de usuários em
+    memória, pelo número real de workers (`-w N` ou --workers, não só WEB_CONCURRENCY).
+    """
+    from app.config import Config
+    from app.services.cache_backends import check_worker_setup
+    check_worker_setup({'USER_CACHE_REDIS_URL': Config.USER_CACHE_REDIS_URL}, workers=server.cfg.workers)
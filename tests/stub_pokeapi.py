@@ -0,0 +1,133 @@
+"""
+Servidor HTTP local que imita os endpoints da PokeAPI usados pela aplicação.
+Usado pelos testes (fixture `stub_pokeapi`) e pelos benchmarks, com latência
+artificial, falhas e contadores configuráveis.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Tuple
+from urllib.parse import urlparse
+
+
+def stub_pokemon_details(name: str, pokemon_id: int) -> dict:
+    """Monta um JSON de detalhes no mesmo formato da PokeAPI (reduzido)."""
+    return {
+        "id": pokemon_id,
+        "name": name,
+        "sprites": {"other": {"official-artwork": {"front_default": f"https://img/{pokemon_id}.png"}}},
+        "types": [{"type": {"name": "normal"}}],
+        "stats": [{"stat": {"name": "hp"}, "base_stat": 50}]
+    }
+
+
+class StubPokeAPIHandler(BaseHTTPRequestHandler):
+    """Handler HTTP que imita os endpoints da PokeAPI usados pela aplicação."""
+
+    protocol_version = "HTTP/1.1" # Permite keep-alive
+    # Cabeçalhos e corpo são escritos separadamente: sem isso, o algoritmo de
+    # Nagle + ACK atrasado adiciona ~40 ms a cada resposta em conexões reaproveitadas.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        stub = self.server.stub
+        with stub.lock:
+            stub.request_count += 1
+            stub.paths.append(self.path)
+            stub.connections.add(self.client_address[1])
+            transient = stub.transient_failures > 0
+            if transient:
+                stub.transient_failures -= 1
+
+        if stub.delay:
+            time.sleep(stub.delay)
+
+        if transient:
+            headers = {'Retry-After': str(stub.retry_after)} if stub.retry_after is not None else {}
+            return self._send(503, {"detail": "Service Unavailable"}, headers)
+
+        path = urlparse(self.path).path.rstrip('/')
+        name = path.rsplit('/', 1)[-1]
+
+        if name in stub.fail_names:
+            return self._send(404, {"detail": "Not found."})
+
+        if name in stub.invalid_json_names:
+            return self._send_raw(200, b"<html>Bad Gateway</html>", 'text/html')
+
+        if path.endswith('/generation'):
+            results = [{"name": f"generation-{g}", "url": f"{stub.base_url}generation/{g}/"} for g in stub.generations]
+            return self._send(200, {"count": len(results), "results": results})
+
+        if '/generation/' in path:
+            species = [
+                {"name": n, "url": f"{stub.base_url}pokemon-species/{stub.names.index(n) + 1}/"}
+                for n in stub.generations.get(int(name), [])
+            ]
+            return self._send(200, {"id": int(name), "pokemon_species": species})
+
+        if path.endswith('/pokemon'):
+            results = [{"name": n, "url": f"{stub.base_url}pokemon/{i}/"} for i, n in enumerate(stub.names, start=1)]
+            return self._send(200, {"count": len(results), "results": results})
+
+        if '/pokemon/' in path:
+            pokemon_id = stub.names.index(name) + 1 if name in stub.names else int(name) if name.isdigit() else 0
+            return self._send(200, stub_pokemon_details(name, pokemon_id))
+
+        return self._send(404, {"detail": "Not found."})
+
+    def _send(self, status: int, payload: dict, headers: dict = None):
+        self._send_raw(status, json.dumps(payload).encode(), 'application/json', headers)
+
+    def _send_raw(self, status: int, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # Silencia o log padrão durante os testes
+
+
+class StubPokeAPI:
+    """Estado compartilhado do servidor falso (latência, falhas e contadores)."""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.fail_names = set()
+        self.invalid_json_names = set() # Respondem 200 com um corpo que não é JSON
+        self.names = [f"poke{i}" for i in range(1, 21)]
+        self.generations = {1: self.names[:12], 2: self.names[12:]}
+        self.request_count = 0
+        self.paths = []
+        # Falhas transitórias: quantas respostas 503 enviar antes de responder normalmente
+        self.transient_failures = 0
+        self.retry_after = None # Valor do cabeçalho Retry-After nas respostas 503
+        self.connections = set() # Portas dos clientes (uma por conexão TCP)
+        self.lock = threading.Lock()
+        self.base_url = None
+
+
+class StubHTTPServer(ThreadingHTTPServer):
+    """Servidor com uma fila de conexões maior que o padrão (5): o cliente assíncrono
+    abre dezenas de conexões de uma vez, e as excedentes seriam descartadas e
+    reenviadas pelo kernel só ~1 s depois."""
+
+    request_queue_size = 128
+    daemon_threads = True
+
+
+def start_stub_pokeapi() -> Tuple[StubPokeAPI, ThreadingHTTPServer]:
+    """Sobe o servidor falso em uma porta livre, em uma thread daemon."""
+    stub = StubPokeAPI()
+    server = StubHTTPServer(('127.0.0.1', 0), StubPokeAPIHandler)
+    server.stub = stub
+    stub.base_url = f"http://127.0.0.1:{server.server_address[1]}/api/v2/"
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return stub, server
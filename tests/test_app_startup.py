@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from sqlalchemy import inspect
+from app import db
+from app.repositories.token_repository import TokenRepository
+from app.repositories.unit_of_work import unit_of_work
+
+
+def test_create_app_does_not_touch_the_schema(make_file_app):
+    """Subir a aplicação não executa DDL: as tabelas vêm de `flask db upgrade`."""
+    app = make_file_app(migrate_schema=False)
+    with app.app_context():
+        assert inspect(db.engine).get_table_names() == []
+
+        runner = app.test_cli_runner()
+        for _ in range(2): # Idempotente
+            result = runner.invoke(args=['db', 'upgrade'])
+            assert result.exit_code == 0, result.output
+            assert 'Esquema atualizado' in result.output
+
+        tables = set(inspect(db.engine).get_table_names())
+        assert {'Usuario', 'PokemonUsuario', 'TipoPokemon', 'TokenRevogado', 'CatalogoPokemon'} <= tables
+        db.engine.dispose()
+
+
+def test_create_app_defers_services_and_heavy_imports():
+    """Os serviços (e requests/httpx) só são carregados na primeira requisição que os usa."""
+    code = (
+        "import sys\n"
+        "from app import create_app\n"
+        "from app.config import TestingConfig\n"
+        "create_app(TestingConfig)\n"
+        "print(sorted(m for m in ('requests', 'httpx', 'app.services.pokemon_service', "
+        "'app.services.user_service', 'app.external.poke_api_client') if m in sys.modules))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=root)
+    assert result.stdout.strip() == '[]'
+
+
+def test_services_are_built_on_first_request(client, auth_headers):
+    """As rotas funcionam com os serviços criados sob demanda."""
+    response = client.get('/api/v1/pokemon/team', headers=auth_headers)
+    assert response.status_code == 200
+
+
+def test_purge_tokens_command(app):
+    """`flask users purge-tokens` remove apenas as revogações expiradas."""
+    with unit_of_work():
+        TokenRepository.revoke('expirado', 1, datetime.utcnow() - timedelta(minutes=1))
+        TokenRepository.revoke('valido', 1, datetime.utcnow() + timedelta(minutes=15))
+
+    result = app.test_cli_runner().invoke(args=['users', 'purge-tokens'])
+
+    assert result.exit_code == 0, result.output
+    assert '1 revogações expiradas removidas' in result.output
+    assert TokenRepository.count_active(datetime.utcnow() - timedelta(hours=1)) == 1
+
+
+def test_each_app_builds_its_own_services(app, make_file_app):
+    """Uma segunda aplicação no mesmo processo não reaproveita os serviços (nem o cliente) da primeira."""
+    from app.api.pokemon_routes import get_pokemon_service
+    from app.api.auth_routes import get_user_service
+
+    first = get_pokemon_service(), get_user_service()
+    other = make_file_app(POKEAPI_TIMEOUT=1.5)
+    with other.app_context():
+        second = get_pokemon_service(), get_user_service()
+        assert second[0].api_client.timeout == 1.5
+
+    assert first[0] is not second[0] and first[1] is not second[1]
+    assert first[0].api_client.timeout == app.config['POKEAPI_TIMEOUT']
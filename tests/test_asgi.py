@@ -0,0 +1,92 @@
+import asyncio
+import contextvars
+import os
+import runpy
+import sys
+import time
+import pytest
+
+httpx = pytest.importorskip('httpx')
+
+from flask_jwt_extended import create_access_token
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def asgi(make_file_app, point_service_to_stub, monkeypatch):
+    """
+    A aplicação exposta pelo asgi.py, com o `create_app()` do run.py trocado por
+    uma aplicação de teste (BD em arquivo) e o serviço apontando para o servidor falso.
+    Retorna (aplicação ASGI, cabeçalhos com um JWT válido, serviço de Pokémon).
+    """
+    import app as app_package
+
+    flask_app = make_file_app()
+    monkeypatch.setattr(app_package, 'create_app', lambda: flask_app)
+    monkeypatch.delitem(sys.modules, 'run', raising=False)
+    with flask_app.app_context():
+        headers = {'Authorization': f"Bearer {create_access_token(identity='1')}"}
+        service = point_service_to_stub()
+
+    yield runpy.run_path(os.path.join(ROOT, 'asgi.py'))['app'], headers, service
+    sys.modules.pop('run', None)
+
+
+def _send_all(asgi_app, requests, headers=None):
+    """Requisições (método, caminho) simultâneas: uma task por requisição, como em um servidor ASGI."""
+    async def main():
+        transport = httpx.ASGITransport(app=asgi_app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://testserver') as client:
+            return await asyncio.gather(*(client.request(method, path, headers=headers) for method, path in requests))
+    # Contexto vazio: sem o app context da fixture `app`, como em um worker ASGI
+    return contextvars.Context().run(asyncio.run, main())
+
+
+def _get(asgi_app, path, headers=None):
+    return _send_all(asgi_app, [('GET', path)], headers)[0]
+
+
+def test_listing_requests_wait_for_the_pokeapi_together(asgi, stub_pokeapi):
+    """Listagens simultâneas esperam a PokeAPI juntas no event loop, sem ficar em fila."""
+    asgi_app, headers, service = asgi
+    _get(asgi_app, '/api/v1/pokemon/?limit=0', headers) # Aquecimento: índice de nomes
+    stub_pokeapi.delay = 0.2
+    requests = [('GET', f'/api/v1/pokemon/?limit=2&offset={2 * i}') for i in range(8)]
+
+    start = time.perf_counter()
+    responses = _send_all(asgi_app, requests, headers)
+    elapsed = time.perf_counter() - start
+
+    assert [r.status_code for r in responses] == [200] * 8
+    assert [p['nome'] for r in responses for p in r.json()['data']] == [f'Poke{i}' for i in range(1, 17)]
+    assert service._async_runtime[1].get_stats()['executed'] == 16
+    assert elapsed < 0.8 # Em fila, as 8 listagens levariam ao menos 1,6 s
+
+
+def test_sync_routes_run_in_parallel_threads(asgi, stub_pokeapi):
+    """As demais rotas (views síncronas) rodam em várias threads, não uma de cada vez."""
+    asgi_app, headers, _ = asgi
+    stub_pokeapi.delay = 0.2
+    requests = [('POST', f'/api/v1/pokemon/{code}/favorite') for code in range(1, 5)]
+
+    start = time.perf_counter()
+    responses = _send_all(asgi_app, requests, headers)
+    elapsed = time.perf_counter() - start
+
+    assert [r.status_code for r in responses] == [200] * 4
+    assert all(r.json()['is_favorite'] for r in responses)
+    assert elapsed < 0.6 # Uma de cada vez, levariam ao menos 0,8 s
+
+
+def test_async_listing_keeps_jwt_and_etag_behavior(asgi):
+    """Sem JWT a listagem assíncrona responde 401; com a ETag da resposta, 304."""
+    asgi_app, headers, _ = asgi
+
+    assert _get(asgi_app, '/api/v1/pokemon/?limit=2').status_code == 401
+
+    listing = _get(asgi_app, '/api/v1/pokemon/?limit=2', headers)
+    assert listing.status_code == 200 and listing.headers['ETag']
+
+    revalidated = _get(asgi_app, '/api/v1/pokemon/?limit=2', {**headers, 'If-None-Match': listing.headers['ETag']})
+    assert revalidated.status_code == 304
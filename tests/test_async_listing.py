@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+import pytest
+
+pytest.importorskip('httpx')
+
+from app.external.async_poke_api_client import AsyncPokeAPIClient
+from app.external.circuit_breaker import CircuitBreaker
+from app.external.response_cache import ResponseCache
+from tests.test_circuit_breaker import FakeClock
+
+
+def _make_clients(make_pokeapi_client, **kwargs):
+    """Cliente síncrono do servidor falso e a variante assíncrona sobre ele."""
+    sync_client = make_pokeapi_client(**kwargs)
+    return sync_client, AsyncPokeAPIClient(sync_client)
+
+
+def _run(async_client, coro):
+    """Executa a corrotina em um loop novo e fecha as conexões do cliente ao final."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await async_client.aclose()
+    return asyncio.run(main())
+
+
+def test_async_get_many_keeps_order_and_isolates_failures(stub_pokeapi, make_pokeapi_client):
+    """Mesmo contrato do cliente síncrono: ordem preservada e falhas como None."""
+    stub_pokeapi.fail_names = {"poke2"}
+    _, client = _make_clients(make_pokeapi_client, max_concurrency=4)
+
+    results = _run(client, client.get_many_pokemon_details(["poke5", "poke2", "poke1"]))
+
+    assert results[0]['name'] == "poke5"
+    assert results[1] is None
+    assert results[2]['name'] == "poke1"
+
+
+def test_async_requests_run_concurrently_and_are_deduplicated(stub_pokeapi, make_pokeapi_client):
+    """Buscas simultâneas correm juntas, e as repetidas viram uma única chamada HTTP."""
+    stub_pokeapi.delay = 0.2
+    _, client = _make_clients(make_pokeapi_client, max_concurrency=10)
+    names = [f"poke{i}" for i in range(1, 6)] * 2
+
+    start = time.perf_counter()
+    results = _run(client, client.get_many_pokemon_details(names))
+    elapsed = time.perf_counter() - start
+
+    assert [r['name'] for r in results] == names
+    assert stub_pokeapi.request_count == 5
+    assert client.get_stats()['deduplicated'] == 5
+    assert elapsed < 0.8 # Sequencial levaria ~1 s
+
+
+def test_async_client_retries_transient_failures(stub_pokeapi, make_pokeapi_client):
+    """Respostas 503 seguidas de sucesso são absorvidas pelas novas tentativas."""
+    stub_pokeapi.transient_failures = 2
+    stub_pokeapi.retry_after = 0
+    _, client = _make_clients(make_pokeapi_client, max_retries=3)
+
+    data = _run(client, client.get_pokemon_details("poke1"))
+
+    assert data['name'] == "poke1"
+    assert stub_pokeapi.request_count == 3
+
+
+def test_async_client_respects_batch_deadline(stub_pokeapi, make_pokeapi_client):
+    """Itens que não terminam dentro do prazo do lote voltam como None."""
+    stub_pokeapi.delay = 0.5
+    _, client = _make_clients(make_pokeapi_client, batch_timeout=0.2)
+
+    start = time.perf_counter()
+    results = _run(client, client.get_many_pokemon_details(["poke1", "poke2"]))
+
+    assert results == [None, None]
+    assert time.perf_counter() - start < 0.45
+
+
+def test_async_invalid_json_during_half_open_reopens_and_recovers(stub_pokeapi, make_pokeapi_client):
+    """Um 200 que não é JSON na chamada de teste conta como falha, sem prender o disjuntor em meio-aberto."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=60, reset_timeout=5, clock=clock)
+    _, client = _make_clients(make_pokeapi_client, max_retries=0, breaker=breaker)
+    breaker.record_failure()
+    stub_pokeapi.invalid_json_names = {"poke1"}
+
+    async def scenario():
+        clock.now = 6
+        assert await client.get_pokemon_details("poke1") is None
+        assert breaker.state == CircuitBreaker.OPEN
+
+        stub_pokeapi.invalid_json_names = set()
+        clock.now = 12
+        return await client.get_pokemon_details("poke1")
+
+    assert _run(client, scenario())['name'] == "poke1"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+def test_async_cold_fetch_counts_a_single_miss(stub_pokeapi, make_pokeapi_client):
+    """Como no cliente síncrono: uma busca fria conta um único miss."""
+    sync_client, client = _make_clients(make_pokeapi_client)
+
+    _run(client, client.get_pokemon_details("poke1"))
+
+    assert stub_pokeapi.request_count == 1
+    assert sync_client.cache.get_stats()['misses'] == 1
+
+def test_async_client_reads_and_writes_the_disk_tier_off_the_event_loop(stub_pokeapi, make_pokeapi_client, tmp_path):
+    """SQLite e zlib da camada em disco rodam em threads, sem travar as outras corrotinas do loop."""
+    path = str(tmp_path / 'cache.sqlite3')
+    make_pokeapi_client(cache=ResponseCache(1024 * 1024, disk_path=path)).get_pokemon_details("poke1")
+    _, client = _make_clients(make_pokeapi_client, cache=ResponseCache(1024 * 1024, disk_path=path))
+    disk_threads = []
+    for method in ('get', 'set'):
+        original = getattr(client.cache.disk, method)
+        def traced(*args, _original=original):
+            disk_threads.append(threading.get_ident())
+            return _original(*args)
+        setattr(client.cache.disk, method, traced)
+
+    async def scenario():
+        loop_thread = threading.get_ident()
+        cached = await client.get_pokemon_details("poke1") # Acerto no disco
+        fetched = await client.get_pokemon_details("poke2") # Miss: rede e gravação no disco
+        return loop_thread, cached, fetched
+
+    loop_thread, cached, fetched = _run(client, scenario())
+
+    assert (cached['name'], fetched['name']) == ("poke1", "poke2")
+    assert stub_pokeapi.request_count == 2
+    assert disk_threads and loop_thread not in disk_threads
+
+def test_async_client_shares_cache_with_sync_client(stub_pokeapi, make_pokeapi_client):
+    """O que o cliente assíncrono busca fica disponível para o síncrono sem nova chamada."""
+    sync_client, client = _make_clients(make_pokeapi_client)
+    _run(client, client.get_pokemon_details("poke3"))
+
+    assert sync_client.get_pokemon_details("poke3")['name'] == "poke3"
+    assert stub_pokeapi.request_count == 1
+
+
+def test_async_listing_matches_sync_listing(app, stub_service):
+    """As versões assíncronas da listagem devolvem o mesmo que as síncronas."""
+    expected = stub_service.get_pokemon_listing_page(1, limit=5, offset=2)
+    app.extensions.pop('pokemon_records')
+
+    page = asyncio.run(stub_service.get_pokemon_listing_page_async(1, limit=5, offset=2))
+    fragments = asyncio.run(stub_service.get_pokemon_listing_fragments_async(1, limit=5, offset=2))
+
+    assert page == expected
+    assert [p['nome'] for p in page['data']] == ['Poke3', 'Poke4', 'Poke5', 'Poke6', 'Poke7']
+    assert len(fragments['data']) == 5
+    assert fragments['total'] == page['total'] and fragments['next_offset'] == page['next_offset']
+
@@ -0,0 +1,94 @@
+
+import json
+from unittest.mock import patch
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+MOCK_POKEMON_DETAILS = {
+    "id": 25,
+    "name": "pikachu",
+    "sprites": {"other": {"official-artwork": {"front_default": "img_pikachu"}}},
+    "types": [{"type": {"name": "electric"}}],
+    "stats": []
+}
+
+
+def _op(code, field, value, **extra):
+    return dict(pokemon_code=code, field=field, value=value, **extra)
+
+
+def _post_batch(client, headers, operations):
+    return client.post('/api/v1/pokemon/batch', headers=headers, data=json.dumps({"operations": operations}))
+
+
+@patch('app.external.poke_api_client.PokeAPIClient.get_pokemon_details', return_value=MOCK_POKEMON_DETAILS)
+def test_batch_applies_operations_in_a_single_commit(mock_details, client, auth_headers):
+    """O lote aplica tudo em uma transação e reporta o resultado de cada item."""
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(Session, 'after_commit', listener)
+    try:
+        response = _post_batch(client, auth_headers, [
+            _op("1", "favorite", True, pokemon_data={"nome": "Bulbasaur", "imagem_uri": "uri", "tipos": ["Grass"]}),
+            _op("25", "team", True), # Dados buscados na PokeAPI (mock)
+            _op("1", "favorite", True), # Idempotente
+            _op("7", "team", False), # Já não estava no time
+        ])
+    finally:
+        event.remove(Session, 'after_commit', listener)
+
+    assert response.status_code == 200
+    results = response.get_json()['results']
+    assert [r['status'] for r in results] == ['applied', 'applied', 'unchanged', 'unchanged']
+    assert results[1]['in_battle_team'] is True
+    assert len(commits) == 1
+
+    favorites = client.get('/api/v1/pokemon/favorites', headers=auth_headers).get_json()['data']
+    team = client.get('/api/v1/pokemon/team', headers=auth_headers).get_json()['data']
+    assert [p['codigo'] for p in favorites] == ['1']
+    assert [(p['codigo'], p['nome']) for p in team] == [('25', 'Pikachu')]
+
+
+def test_batch_validates_team_limit_across_the_batch(client, auth_headers):
+    """O limite de 6 vale para o lote inteiro; remoções no mesmo lote liberam vagas."""
+    data = {"nome": "Poke", "imagem_uri": "uri", "tipos": ["Normal"]}
+    _post_batch(client, auth_headers, [_op(str(i), "team", True, pokemon_data=data) for i in range(1, 7)])
+
+    response = _post_batch(client, auth_headers, [
+        _op("7", "team", True, pokemon_data=data), # Time cheio: erro
+        _op("1", "team", False), # Libera uma vaga
+        _op("8", "team", True, pokemon_data=data), # Cabe
+    ])
+
+    results = response.get_json()['results']
+    assert [r['status'] for r in results] == ['error', 'applied', 'applied']
+    assert "Equipe de Batalha já está completa" in results[0]['msg']
+
+    team = client.get('/api/v1/pokemon/team', headers=auth_headers).get_json()
+    assert team['count'] == 6
+    assert sorted(p['codigo'] for p in team['data']) == ['2', '3', '4', '5', '6', '8']
+
+
+def test_batch_rejects_invalid_payload(client, auth_headers):
+    """Operações malformadas são rejeitadas antes de tocar no BD."""
+    response = _post_batch(client, auth_headers, [_op("1", "shiny", True)])
+    assert response.status_code == 400
+
+    response = client.post('/api/v1/pokemon/batch', headers=auth_headers, data=json.dumps({}))
+    assert response.status_code == 400
+
+
+def test_batch_rejects_invalid_pokemon_data(client, auth_headers):
+    """pokemon_data sem nome ou com tipos vazios é recusado com 400, sem abrir a transação."""
+    invalid = [
+        {"imagem_uri": "uri", "tipos": ["Grass"]},
+        {"nome": "Bulbasaur", "imagem_uri": "uri", "tipos": []},
+        {"nome": "Bulbasaur", "imagem_uri": "uri", "tipos": "Grass"},
+        "Bulbasaur",
+    ]
+    for pokemon_data in invalid:
+        response = _post_batch(client, auth_headers, [_op("1", "favorite", True, pokemon_data=pokemon_data)])
+        assert response.status_code == 400
+        assert 'posição 0' in response.get_json()['msg']
+
+    assert client.get('/api/v1/pokemon/favorites', headers=auth_headers).get_json()['data'] == []
@@ -0,0 +1,121 @@
+
+import zlib
+from unittest.mock import patch
+import pytest
+from app.external.response_cache import ResponseCache
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+from app.services.catalog_service import CatalogService
+
+
+@pytest.fixture
+def catalog_service(make_pokeapi_client) -> CatalogService:
+    """Serviço de catálogo apontando para o servidor falso, com cache isolado."""
+    return CatalogService(api_client=make_pokeapi_client())
+
+
+def test_sync_catalog_stores_normalized_rows(app, catalog_service):
+    """A sincronização grava um registro normalizado por Pokémon."""
+    summary = catalog_service.sync_catalog(workers=4, batch_size=7)
+
+    assert summary == {'total': 20, 'inserted': 20, 'skipped': 0, 'failed': 0}
+    bulba = CatalogoPokemonModel.query.filter_by(nome='poke1').first()
+    assert bulba.id_pokemon == 1
+    assert bulba.tipo_primario == 'Normal'
+    assert bulba.hp == 50
+
+
+def test_sync_catalog_resumes_from_checkpoint(app, stub_pokeapi, catalog_service, make_pokeapi_client):
+    """Uma nova execução pula o que já foi gravado e tenta de novo só as falhas."""
+    stub_pokeapi.fail_names = {'poke3'}
+    first = catalog_service.sync_catalog(workers=4, batch_size=5)
+    assert first['failed'] == 1
+
+    # Nova execução (outro processo): sem o cache de respostas da primeira
+    stub_pokeapi.fail_names = set()
+    stub_pokeapi.request_count = 0
+    second = CatalogService(api_client=make_pokeapi_client()).sync_catalog(workers=4, batch_size=5)
+
+    assert second == {'total': 20, 'inserted': 1, 'skipped': 19, 'failed': 0}
+    assert stub_pokeapi.request_count == 2 # Lista + o único Pokémon pendente
+
+
+def test_listing_served_from_catalog(app, client, auth_headers, catalog_service):
+    """Com o catálogo sincronizado, a listagem não chama a PokeAPI."""
+    catalog_service.sync_catalog(workers=4, batch_size=10)
+
+    with patch('app.external.poke_api_client.PokeAPIClient._fetch_data') as mock_fetch:
+        response = client.get('/api/v1/pokemon/?limit=5&offset=10', headers=auth_headers)
+        mock_fetch.assert_not_called()
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert [p['id_pokemon'] for p in data] == [11, 12, 13, 14, 15]
+    assert data[0]['stats']['hp'] == 50
+    assert data[0]['is_favorite'] is False
+
+
+def test_sync_generations_builds_membership_index(app, catalog_service):
+    """O índice de gerações é montado a partir dos endpoints de geração."""
+    summary = catalog_service.sync_generations()
+
+    assert summary == {1: 12, 2: 8}
+
+
+def test_listing_generation_filter_uses_local_index(app, client, auth_headers, stub_pokeapi, catalog_service):
+    """O filtro por geração combina com o filtro por nome e a paginação, sem chamadas extras."""
+    catalog_service.sync_catalog(workers=4, batch_size=10)
+    catalog_service.sync_generations()
+    stub_pokeapi.request_count = 0
+
+    response = client.get('/api/v1/pokemon/?generation=2&limit=3', headers=auth_headers)
+    body = response.get_json()
+    assert [p['id_pokemon'] for p in body['data']] == [13, 14, 15]
+    assert body['total'] == 8
+    assert body['next_offset'] == 3
+
+    response = client.get('/api/v1/pokemon/?generation=1&name=poke1', headers=auth_headers)
+    body = response.get_json()
+    assert [p['nome'] for p in body['data']] == ['Poke1', 'Poke10', 'Poke11', 'Poke12']
+    assert stub_pokeapi.request_count == 0
+
+
+def test_sync_command_purges_expired_cache_entries(app, make_pokeapi_client, monkeypatch, tmp_path):
+    """`flask catalog sync` remove do cache em disco as respostas vencidas."""
+    cache = ResponseCache(max_memory_bytes=1024 * 1024, disk_path=str(tmp_path / 'cache.sqlite3'))
+    cache.disk.set('pokemon/antigo', zlib.compress(b'{}'), expires_at=0)
+    client = make_pokeapi_client(cache=cache)
+    monkeypatch.setattr('app.services.catalog_service.CatalogService', lambda: CatalogService(api_client=client))
+
+    result = app.test_cli_runner().invoke(args=['catalog', 'sync', '--workers', '2'])
+
+    assert result.exit_code == 0, result.output
+    assert '20 inseridos' in result.output
+    assert '1 respostas expiradas removidas' in result.output
+    assert cache.disk.get('pokemon/antigo') is None
+
+
+def test_generation_filter_needs_a_synced_index(app, client, auth_headers, stub_pokeapi, catalog_service):
+    """Sem o índice sincronizado o filtro responde 503, sem ir à PokeAPI; depois da sincronização, funciona."""
+    catalog_service.sync_catalog(workers=4, batch_size=10)
+    stub_pokeapi.request_count = 0
+
+    response = client.get('/api/v1/pokemon/?generation=2&limit=3', headers=auth_headers)
+    assert response.status_code == 503
+    assert stub_pokeapi.request_count == 0
+
+    catalog_service.sync_generations()
+    response = client.get('/api/v1/pokemon/?generation=2&limit=3', headers=auth_headers)
+    assert response.status_code == 200
+    assert response.get_json()['total'] == 8
+
+
+def test_generation_index_reloads_after_a_new_sync(app, client, auth_headers, stub_pokeapi, catalog_service):
+    """Uma nova sincronização do índice de gerações vale para as próximas consultas."""
+    catalog_service.sync_catalog(workers=4, batch_size=10)
+    catalog_service.sync_generations()
+    assert client.get('/api/v1/pokemon/?generation=2', headers=auth_headers).get_json()['total'] == 8
+
+    stub_pokeapi.generations = {1: stub_pokeapi.names[:15], 2: stub_pokeapi.names[15:]}
+    catalog_service.api_client.cache = ResponseCache(max_memory_bytes=1024 * 1024)
+    catalog_service.sync_generations()
+    assert client.get('/api/v1/pokemon/?generation=2', headers=auth_headers).get_json()['total'] == 5
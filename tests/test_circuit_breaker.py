@@ -0,0 +1,111 @@
+
+import time
+from app.external.circuit_breaker import CircuitBreaker
+from app.external.response_cache import ResponseCache
+
+
+class FakeClock:
+    """Relógio controlado manualmente pelos testes."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_after_failures_and_recovers():
+    """Fechado -> aberto após N falhas na janela -> meio-aberto -> fechado."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, window_seconds=10, reset_timeout=5, clock=clock)
+
+    for _ in range(3):
+        assert breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+    clock.now = 6
+    assert breaker.allow_request() # Chamada de teste
+    assert not breaker.allow_request() # Só uma por vez
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.get_stats()['short_circuited'] == 2
+
+
+def test_breaker_ignores_failures_outside_the_window():
+    """Falhas antigas (fora da janela) não contam para abrir o disjuntor."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, window_seconds=10, reset_timeout=5, clock=clock)
+
+    breaker.record_failure()
+    clock.now = 20
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_open_breaker_short_circuits_upstream_calls(stub_pokeapi, make_pokeapi_client):
+    """Com a PokeAPI falhando, o disjuntor abre e as chamadas seguintes nem chegam a ela."""
+    stub_pokeapi.transient_failures = 100
+    breaker = CircuitBreaker(failure_threshold=2, window_seconds=60, reset_timeout=60)
+    client = make_pokeapi_client(max_retries=0, breaker=breaker)
+
+    assert client.get_pokemon_details("poke1") is None
+    assert client.get_pokemon_details("poke2") is None
+    assert breaker.state == CircuitBreaker.OPEN
+
+    assert client.get_pokemon_details("poke3") is None
+    assert stub_pokeapi.request_count == 2
+
+
+def test_stale_entry_is_served_while_revalidating(stub_pokeapi, make_pokeapi_client):
+    """Um dado expirado é servido na hora e atualizado em segundo plano."""
+    cache = ResponseCache(1024 * 1024, ttls={'pokemon/': 0})
+    client = make_pokeapi_client(cache=cache)
+    assert client.get_pokemon_details("poke1")['name'] == "poke1"
+
+    stub_pokeapi.delay = 0.5
+    start = time.perf_counter()
+    assert client.get_pokemon_details("poke1")['name'] == "poke1"
+    assert time.perf_counter() - start < 0.2
+
+    deadline = time.time() + 3
+    while stub_pokeapi.request_count < 2 and time.time() < deadline:
+        time.sleep(0.05)
+    assert stub_pokeapi.request_count == 2
+    stats = client.get_stats()['stale']
+    assert stats == {'stale_served': 1, 'background_refreshes': 1}
+
+
+def test_monitoring_endpoint_exposes_breaker_state(client, auth_headers):
+    """O endpoint de monitoramento expõe o estado do disjuntor e os contadores."""
+    response = client.get('/api/v1/monitoring/pokeapi', headers=auth_headers)
+
+    assert response.status_code == 200
+    data = response.get_json()['data']
+    assert data['circuit_breaker']['state'] == 'closed'
+    assert set(data) == {'cache', 'single_flight', 'circuit_breaker', 'stale'}
+
+
+def test_monitoring_endpoints_require_jwt(client):
+    """Os contadores internos não ficam expostos sem autenticação."""
+    for endpoint in ('pokeapi', 'user-cache', 'password-hashing', 'token-blocklist'):
+        assert client.get(f'/api/v1/monitoring/{endpoint}').status_code == 401
+
+
+def test_invalid_json_during_half_open_reopens_and_recovers(stub_pokeapi, make_pokeapi_client):
+    """Um 200 que não é JSON na chamada de teste conta como falha: o disjuntor reabre e depois se recupera."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, window_seconds=60, reset_timeout=5, clock=clock)
+    client = make_pokeapi_client(max_retries=0, breaker=breaker)
+    breaker.record_failure()
+    stub_pokeapi.invalid_json_names = {"poke1"}
+
+    clock.now = 6
+    assert client.get_pokemon_details("poke1") is None
+    assert breaker.state == CircuitBreaker.OPEN
+
+    stub_pokeapi.invalid_json_names = set()
+    clock.now = 12
+    assert client.get_pokemon_details("poke1")['name'] == "poke1"
+    assert breaker.state == CircuitBreaker.CLOSED
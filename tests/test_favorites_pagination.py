@@ -0,0 +1,114 @@
+
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import text, inspect
+from app import db
+from app.migrations import upgrade_schema
+from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.tipo_pokemon_model import TipoPokemonModel
+from app.repositories.pokemon_repository import PokemonRepository
+from tests.test_query_plans import FULL_SCAN, _capture_statements
+
+NAMES = ['Pikachu', 'Bulbasaur', 'Charmander', 'Squirtle', 'Pidgey', 'Eevee', 'Mew', 'Onix', 'Psyduck', 'Abra',
+         'Gastly', 'Machop', 'Geodude', 'Ponyta', 'Snorlax', 'Lapras', 'Ditto', 'Vulpix', 'Jigglypuff', 'Zubat',
+         'Oddish', 'Paras', 'Meowth', 'Mankey', 'Growlithe']
+
+
+@pytest.fixture
+def favorites(app, auth_headers):
+    """25 favoritos do usuário de teste, com datas de inclusão crescentes."""
+    tipo = TipoPokemonModel(descricao='Normal')
+    db.session.add(tipo)
+    db.session.flush()
+    start = datetime(2024, 1, 1)
+    for i, name in enumerate(NAMES):
+        db.session.add(PokemonUsuarioModel(
+            id_usuario=1, id_tipo_pokemon=tipo.id_tipo_pokemon, codigo=str(100 - i), nome=name,
+            imagem_uri='uri', favorito=True, dt_inclusao=start + timedelta(minutes=i)
+        ))
+    db.session.commit()
+    return NAMES
+
+
+def _all_pages(client, headers, query):
+    """Percorre todas as páginas seguindo o cursor e retorna os nomes e a quantidade de páginas."""
+    names, cursor, pages = [], None, 0
+    while True:
+        url = f'/api/v1/pokemon/favorites?{query}' + (f'&cursor={cursor}' if cursor else '')
+        body = client.get(url, headers=headers).get_json()
+        names += [p['nome'] for p in body['data']]
+        pages += 1
+        cursor = body['next_cursor']
+        if not cursor:
+            return names, pages
+
+
+@pytest.mark.parametrize('query, expected', [
+    ('limit=10', NAMES),
+    ('limit=10&sort=added&order=desc', NAMES[::-1]),
+    ('limit=7&sort=name', sorted(NAMES)),
+    ('limit=7&sort=name&order=desc', sorted(NAMES, reverse=True)),
+    ('limit=4&sort=id', NAMES[::-1]), # Códigos decrescentes na inclusão
+])
+def test_cursor_walks_every_favorite_once_in_order(client, auth_headers, favorites, query, expected):
+    names, pages = _all_pages(client, auth_headers, query)
+    assert names == expected
+    limit = int(query.split('&')[0].split('=')[1])
+    assert pages == -(-len(NAMES) // limit)
+
+
+def test_name_prefix_and_type_filters(client, auth_headers, favorites):
+    response = client.get('/api/v1/pokemon/favorites?sort=name&name=p', headers=auth_headers)
+    assert [p['nome'] for p in response.get_json()['data']] == ['Paras', 'Pidgey', 'Pikachu', 'Ponyta', 'Psyduck']
+
+    # '%' e '_' são literais no prefixo
+    response = client.get('/api/v1/pokemon/favorites?name=%25', headers=auth_headers)
+    assert response.get_json()['data'] == []
+
+    response = client.get('/api/v1/pokemon/favorites?type=normal&limit=100', headers=auth_headers)
+    assert response.get_json()['data'] == [] # Registros inseridos sem associação de tipos
+
+
+def test_invalid_parameters_return_400(client, auth_headers, favorites):
+    cursor = client.get('/api/v1/pokemon/favorites?limit=5&sort=name', headers=auth_headers).get_json()['next_cursor']
+
+    assert client.get(f'/api/v1/pokemon/favorites?sort=id&cursor={cursor}', headers=auth_headers).status_code == 400
+    assert client.get('/api/v1/pokemon/favorites?cursor=lixo', headers=auth_headers).status_code == 400
+    assert client.get('/api/v1/pokemon/favorites?sort=shiny', headers=auth_headers).status_code == 400
+    assert client.get('/api/v1/pokemon/favorites?limit=1000', headers=auth_headers).status_code == 400
+
+
+@pytest.mark.parametrize('sort', ['added', 'name', 'id'])
+@pytest.mark.parametrize('descending', [False, True])
+def test_deep_pages_use_an_index_without_sorting(app, favorites, sort, descending):
+    """
+    Uma página profunda (com cursor) percorre o índice da ordenação: sem varredura
+    completa e sem ordenação em memória (TEMP B-TREE), então o custo não depende da profundidade.
+    """
+    after = {'added': datetime(2024, 1, 1, 0, 20), 'name': 'Pikachu', 'id': 80}[sort]
+    statements = _capture_statements(
+        lambda: PokemonRepository.get_user_favorites_page(1, 10, sort=sort, descending=descending, after=(after, 20))
+    )
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()]
+            assert not any(FULL_SCAN.match(d) or 'TEMP B-TREE' in d for d in plan), plan
+
+
+def test_upgrade_adds_date_added_column(app):
+    """Bancos anteriores à coluna DtInclusao a recebem, preenchida, ao iniciar."""
+    tipo = TipoPokemonModel(descricao='Normal')
+    db.session.add(tipo)
+    db.session.flush()
+    db.session.add(PokemonUsuarioModel(id_usuario=1, id_tipo_pokemon=tipo.id_tipo_pokemon, codigo='1',
+                                       nome='bulbasaur', imagem_uri='uri', favorito=True))
+    db.session.commit()
+    with db.engine.begin() as conn:
+        conn.execute(text('DROP INDEX ix_pokemon_usuario_favorito_inclusao'))
+        conn.execute(text('ALTER TABLE "PokemonUsuario" DROP COLUMN "DtInclusao"'))
+
+    upgrade_schema()
+
+    assert 'DtInclusao' in {c['name'] for c in inspect(db.engine).get_columns('PokemonUsuario')}
+    db.session.expire_all()
+    assert PokemonUsuarioModel.query.first().dt_inclusao is not None
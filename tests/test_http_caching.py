@@ -0,0 +1,72 @@
+
+import json
+from tests.test_listing_queries import count_queries
+
+
+def test_favorites_returns_304_without_touching_the_database(app, client, auth_headers):
+    """Com If-None-Match igual à ETag atual, a resposta é 304 e nenhum SQL é executado."""
+    response = client.get('/api/v1/pokemon/favorites', headers=auth_headers)
+    assert response.status_code == 200
+    etag = response.headers['ETag']
+    assert response.headers['Cache-Control'] == 'private, no-cache'
+    assert 'Authorization' in response.headers['Vary']
+
+    with count_queries() as statements:
+        cached = client.get('/api/v1/pokemon/favorites', headers={**auth_headers, 'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.data == b''
+    assert statements == []
+
+
+def test_etag_changes_after_toggle(app, client, auth_headers, sync_catalog):
+    """Marcar um favorito ou alterar o time invalida as ETags do usuário."""
+    sync_catalog()
+
+    favorites_etag = client.get('/api/v1/pokemon/favorites', headers=auth_headers).headers['ETag']
+    team_etag = client.get('/api/v1/pokemon/team', headers=auth_headers).headers['ETag']
+    list_etag = client.get('/api/v1/pokemon/?limit=5', headers=auth_headers).headers['ETag']
+
+    client.post('/api/v1/pokemon/3/favorite', headers=auth_headers, data=json.dumps({}))
+
+    response = client.get('/api/v1/pokemon/favorites', headers={**auth_headers, 'If-None-Match': favorites_etag})
+    assert response.status_code == 200
+    assert [p['codigo'] for p in response.get_json()['data']] == ['3']
+    assert response.headers['ETag'] != favorites_etag
+
+    response = client.get('/api/v1/pokemon/?limit=5', headers={**auth_headers, 'If-None-Match': list_etag})
+    assert response.status_code == 200
+    assert response.get_json()['data'][2]['is_favorite'] is True
+
+    # A versão é por usuário: qualquer alteração invalida também a ETag do time
+    client.post('/api/v1/pokemon/4/team', headers=auth_headers, data=json.dumps({}))
+    response = client.get('/api/v1/pokemon/team', headers={**auth_headers, 'If-None-Match': team_etag})
+    assert response.status_code == 200
+    assert response.get_json()['count'] == 1
+
+
+def test_listing_etag_depends_on_query(app, client, auth_headers, sync_catalog):
+    """Páginas ou filtros diferentes têm ETags diferentes; a mesma página gera 304."""
+    sync_catalog()
+
+    first = client.get('/api/v1/pokemon/?limit=5', headers=auth_headers)
+    second = client.get('/api/v1/pokemon/?limit=5&offset=5', headers=auth_headers)
+    assert first.headers['ETag'] != second.headers['ETag']
+
+    again = client.get('/api/v1/pokemon/?limit=5', headers={**auth_headers, 'If-None-Match': first.headers['ETag']})
+    assert again.status_code == 304
+
+
+def test_incomplete_listing_page_is_not_cached(app, client, auth_headers, stub_pokeapi, stub_service):
+    """Uma página sem os Pokémon que falharam na PokeAPI não recebe ETag (nem 304 depois)."""
+    stub_pokeapi.fail_names = {'poke2'}
+    partial = client.get('/api/v1/pokemon/?limit=3', headers=auth_headers)
+    assert [p['nome'] for p in partial.get_json()['data']] == ['Poke1', 'Poke3']
+    assert 'ETag' not in partial.headers
+    assert partial.headers['Cache-Control'] == 'no-store'
+
+    # A PokeAPI se recupera: a mesma página volta completa e passa a ter ETag
+    stub_pokeapi.fail_names = set()
+    complete = client.get('/api/v1/pokemon/?limit=3', headers=auth_headers)
+    assert [p['nome'] for p in complete.get_json()['data']] == ['Poke1', 'Poke2', 'Poke3']
+    again = client.get('/api/v1/pokemon/?limit=3', headers={**auth_headers, 'If-None-Match': complete.headers['ETag']})
+    assert again.status_code == 304
@@ -0,0 +1,71 @@
+
+import json
+from datetime import datetime
+from decimal import Decimal
+import pytest
+from flask import Flask
+from app.json_provider import OrjsonJSONProvider, StdlibJSONProvider, create_json_provider, fragments_response
+from tests.test_listing_queries import count_queries
+
+
+def _flask_app(json_provider: str) -> Flask:
+    flask_app = Flask(__name__)
+    flask_app.config['JSON_PROVIDER'] = json_provider
+    return flask_app
+
+
+def test_provider_selection():
+    assert type(create_json_provider(_flask_app('auto'))) is OrjsonJSONProvider
+    assert type(create_json_provider(_flask_app('orjson'))) is OrjsonJSONProvider
+    assert type(create_json_provider(_flask_app('stdlib'))) is StdlibJSONProvider
+    with pytest.raises(RuntimeError):
+        create_json_provider(_flask_app('ujson'))
+
+
+def test_orjson_matches_the_default_provider():
+    """Mesmo resultado do json padrão do Flask, inclusive para datas, Decimal e chaves numéricas."""
+    payload = {'b': [1, 2.5, None, True], 'a': 'Pokémon', 'quando': datetime(2024, 1, 2, 3, 4, 5),
+               'preco': Decimal('1.10'), 'stats': {1: 'hp'}}
+    stdlib = StdlibJSONProvider(_flask_app('stdlib'))
+    fast = OrjsonJSONProvider(_flask_app('orjson'))
+
+    assert json.loads(fast.dumps_bytes(payload)) == json.loads(stdlib.dumps_bytes(payload))
+    assert fast.loads('{"x": [1, "é"]}') == {'x': [1, 'é']}
+
+
+def test_fragments_response_embeds_pre_serialized_items():
+    flask_app = _flask_app('auto')
+    flask_app.json = create_json_provider(flask_app)
+
+    response = fragments_response(flask_app, {'msg': 'ok', 'total': 2}, 'data', [b'{"a":1}', b'{"b":2}'])
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.data) == {'data': [{'a': 1}, {'b': 2}], 'msg': 'ok', 'total': 2}
+    assert json.loads(fragments_response(flask_app, {}, 'data', []).data) == {'data': []}
+
+
+def test_listing_is_identical_with_both_providers(app, client, auth_headers, sync_catalog):
+    """A listagem montada por fragmentos com orjson é igual à montada com o json padrão."""
+    sync_catalog()
+    client.post('/api/v1/pokemon/2/favorite', headers=auth_headers, data=json.dumps({}))
+    assert type(app.json) is OrjsonJSONProvider
+    fast = client.get('/api/v1/pokemon/?limit=5', headers=auth_headers).get_json()
+
+    app.json = StdlibJSONProvider(app)
+    app.extensions.pop('catalog_json_fragments')
+    slow = client.get('/api/v1/pokemon/?limit=5&offset=0', headers=auth_headers).get_json()
+
+    assert fast == slow
+    assert [p['is_favorite'] for p in fast['data']] == [False, True, False, False, False]
+    assert set(fast['data'][0]) == {'id_pokemon', 'nome', 'codigo', 'tipos', 'imagem_uri', 'stats', 'is_favorite', 'in_battle_team'}
+
+
+def test_listing_reuses_cached_fragments(app, client, auth_headers, sync_catalog):
+    """A partir da segunda página igual, o catálogo não é consultado: só o status do usuário."""
+    sync_catalog()
+    client.get('/api/v1/pokemon/?limit=5', headers=auth_headers)
+    assert len(app.extensions['catalog_json_fragments']) == 5
+
+    with count_queries() as statements:
+        response = client.get('/api/v1/pokemon/?limit=5&name=', headers=auth_headers)
+    assert response.status_code == 200
+    assert not any('FROM "CatalogoPokemon"' in s for s in statements)
@@ -0,0 +1,44 @@
+
+import json
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import db
+
+
+@contextmanager
+def count_queries():
+    """Conta os comandos SQL executados dentro do bloco."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_listing_query_count_does_not_grow_with_limit(app, client, auth_headers, sync_catalog):
+    """A listagem deve executar um número constante de SQLs, seja qual for o `limit`."""
+    sync_catalog()
+
+    # Alguns registros do usuário, para que o merge tenha o que encontrar
+    for code in ('2', '3'):
+        client.post(f'/api/v1/pokemon/{code}/favorite', headers=auth_headers, data=json.dumps({}))
+
+    # Aquecimento: monta o índice de nomes da aplicação
+    client.get('/api/v1/pokemon/?limit=1', headers=auth_headers)
+
+    counts = {}
+    for limit in (2, 20):
+        with count_queries() as statements:
+            response = client.get(f'/api/v1/pokemon/?limit={limit}', headers=auth_headers)
+        assert response.status_code == 200
+        counts[limit] = len(statements)
+
+    data = response.get_json()['data']
+    assert [p['is_favorite'] for p in data[:4]] == [False, True, True, False]
+    assert counts[2] == counts[20]
+    assert counts[20] <= 2 # Catálogo + estado do usuário
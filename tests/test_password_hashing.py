@@ -0,0 +1,70 @@
+
+import json
+import pytest
+from werkzeug.security import generate_password_hash
+from app.models.user_model import UsuarioModel
+from app.services.password_hasher import PasswordHasher, PasswordHasherBusyError, normalize_hash_method
+from conftest import TEST_USER
+
+
+def test_normalize_hash_method_fills_defaults():
+    assert normalize_hash_method('scrypt') == 'scrypt:32768:8:1'
+    assert normalize_hash_method('scrypt:16384:8:1') == 'scrypt:16384:8:1'
+    assert normalize_hash_method('pbkdf2:sha256:600000') == 'pbkdf2:sha256:600000'
+    assert normalize_hash_method('pbkdf2:sha512').startswith('pbkdf2:sha512:')
+    for invalid in ('md5', 'scrypt:1:2', 'pbkdf2:sha256:x'):
+        with pytest.raises(ValueError):
+            normalize_hash_method(invalid)
+
+
+def test_hasher_round_trip_and_rehash_detection():
+    hasher = PasswordHasher('pbkdf2:sha256:1000', max_workers=1)
+    password_hash = hasher.hash('pikachu')
+    assert password_hash.startswith('pbkdf2:sha256:1000$')
+    assert hasher.verify(password_hash, 'pikachu')
+    assert not hasher.verify(password_hash, 'raichu')
+    assert not hasher.needs_rehash(password_hash)
+    assert hasher.needs_rehash(generate_password_hash('pikachu', 'pbkdf2:sha256:2000'))
+    assert hasher.get_stats()['hashed'] == 1
+    hasher.shutdown()
+
+
+def test_hasher_rejects_when_queue_is_full():
+    """Com todas as vagas ocupadas, o pedido espera no máximo `wait_timeout` e é recusado."""
+    hasher = PasswordHasher('pbkdf2:sha256:1000', max_workers=1, max_pending=0, wait_timeout=0.01)
+    hasher._slots.acquire()
+    with pytest.raises(PasswordHasherBusyError):
+        hasher.hash('pikachu')
+    assert hasher.get_stats()['rejected'] == 1
+    hasher._slots.release()
+    assert hasher.verify(hasher.hash('pikachu'), 'pikachu')
+
+
+def test_register_uses_configured_method(client):
+    response = client.post('/api/v1/auth/register', data=json.dumps({
+        'nome': 'Ash', 'login': 'ash', 'email': 'ash@pokedex.com', 'senha': 'pikachu'
+    }), content_type='application/json')
+    assert response.status_code == 201
+    assert UsuarioModel.query.filter_by(login='ash').one().senha.startswith('pbkdf2:sha256:1000$')
+
+
+def test_login_rehashes_password_with_old_parameters(app, client, auth_headers):
+    """O usuário do conftest foi gravado com o scrypt padrão: o login regrava o hash."""
+    user = UsuarioModel.query.filter_by(login=TEST_USER['login']).one()
+    assert user.senha.startswith('pbkdf2:sha256:1000$')
+
+    # Um novo login com o hash já atualizado continua funcionando (sem regravar)
+    old_hash = user.senha
+    response = client.post('/api/v1/auth/login', data=json.dumps(TEST_USER), content_type='application/json')
+    assert response.status_code == 200
+    assert UsuarioModel.query.filter_by(login=TEST_USER['login']).one().senha == old_hash
+
+
+def test_login_returns_503_when_hashing_is_saturated(app, client, auth_headers):
+    hasher = PasswordHasher('pbkdf2:sha256:1000', max_workers=1, max_pending=0, wait_timeout=0.01)
+    hasher._slots.acquire()
+    app.extensions['password_hasher'] = hasher
+
+    response = client.post('/api/v1/auth/login', data=json.dumps(TEST_USER), content_type='application/json')
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
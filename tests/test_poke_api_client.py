@@ -0,0 +1,103 @@
+
+import time
+from app.external.poke_api_client import PokeAPIClient
+
+
+def test_get_many_pokemon_details_keeps_order(make_pokeapi_client):
+    """Os detalhes devem voltar na mesma ordem dos identificadores enviados."""
+    client = make_pokeapi_client(max_concurrency=4)
+    names = ["poke5", "poke1", "poke3", "poke2"]
+
+    results = client.get_many_pokemon_details(names)
+
+    assert [r['name'] for r in results] == names
+
+
+def test_get_many_pokemon_details_partial_failure(stub_pokeapi, make_pokeapi_client):
+    """A falha de um Pokémon não pode derrubar o lote inteiro."""
+    stub_pokeapi.fail_names = {"poke2"}
+    client = make_pokeapi_client(max_concurrency=4)
+
+    results = client.get_many_pokemon_details(["poke1", "poke2", "poke3"])
+
+    assert results[0]['name'] == "poke1"
+    assert results[1] is None
+    assert results[2]['name'] == "poke3"
+
+
+def test_get_many_pokemon_details_respects_batch_deadline(stub_pokeapi, make_pokeapi_client):
+    """Itens que não terminam dentro do prazo do lote voltam como None."""
+    stub_pokeapi.delay = 0.5
+    client = make_pokeapi_client(max_concurrency=2, batch_timeout=0.2)
+
+    start = time.perf_counter()
+    results = client.get_many_pokemon_details(["poke1", "poke2"])
+    elapsed = time.perf_counter() - start
+
+    assert results == [None, None]
+    assert elapsed < 0.45
+
+
+def test_get_many_pokemon_details_one_round_trip_per_window(stub_pokeapi, make_pokeapi_client):
+    """
+    Com latência artificial de 200 ms, 10 Pokémon e concorrência 5, o tempo
+    total deve ser de ~2 janelas (~0,4 s), e não de 10 chamadas sequenciais (~2 s).
+    """
+    stub_pokeapi.delay = 0.2
+    client = make_pokeapi_client(max_concurrency=5)
+    names = [f"poke{i}" for i in range(1, 11)]
+
+    start = time.perf_counter()
+    results = client.get_many_pokemon_details(names)
+    elapsed = time.perf_counter() - start
+
+    assert all(results)
+    windows = len(names) / 5
+    assert elapsed >= windows * stub_pokeapi.delay * 0.9
+    assert elapsed < windows * stub_pokeapi.delay * 2
+
+
+def test_pooled_session_reuses_connections(stub_pokeapi, make_pokeapi_client):
+    """Requisições sequenciais reaproveitam a mesma conexão TCP (keep-alive)."""
+    client = make_pokeapi_client()
+
+    for i in range(1, 11):
+        assert client.get_pokemon_details(f"poke{i}") is not None
+
+    assert stub_pokeapi.request_count == 10
+    assert len(stub_pokeapi.connections) == 1
+
+
+def test_transient_failures_are_retried(stub_pokeapi, make_pokeapi_client):
+    """Respostas 503 são repetidas até o sucesso, respeitando o Retry-After."""
+    stub_pokeapi.transient_failures = 2
+    stub_pokeapi.retry_after = "0"
+    client = make_pokeapi_client(max_retries=3)
+
+    assert client.get_pokemon_details("poke1")['name'] == "poke1"
+    assert stub_pokeapi.request_count == 3
+
+
+def test_retries_stop_when_request_budget_runs_out(stub_pokeapi, make_pokeapi_client):
+    """Se o Retry-After estoura o orçamento da requisição, o cliente desiste sem esperar."""
+    stub_pokeapi.transient_failures = 10
+    stub_pokeapi.retry_after = "5"
+    client = make_pokeapi_client(max_retries=5, request_budget=1)
+
+    start = time.perf_counter()
+    assert client.get_pokemon_details("poke1") is None
+    assert time.perf_counter() - start < 0.5
+    assert stub_pokeapi.request_count == 1
+
+
+def test_client_settings_come_from_app_config(app):
+    """O cliente criado pela aplicação segue o app.config (inclusive os overrides de teste)."""
+    app.config.update(POKEAPI_TIMEOUT=1.5, POKEAPI_MAX_RETRIES=0, POKEAPI_BREAKER_FAILURE_THRESHOLD=2)
+
+    client = PokeAPIClient(config=app.config)
+
+    assert client.timeout == 1.5
+    assert client.max_retries == 0
+    assert client.breaker.failure_threshold == 2
+    assert client.cache.disk is None # TestingConfig: cache só em memória
+    assert PokeAPIClient().settings is app.config # Padrão dentro do app context
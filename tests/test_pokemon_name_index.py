@@ -0,0 +1,51 @@
+
+from unittest.mock import patch
+from app.services.pokemon_name_index import PokemonNameIndex
+
+NAMES = ["bulbasaur", "ivysaur", "venusaur", "charmander", "charmeleon", "charizard", "squirtle"]
+
+
+def test_search_substring_returns_catalog_order():
+    """A busca por trecho usa trigramas e respeita a ordem do catálogo."""
+    index = PokemonNameIndex()
+    index.add(NAMES)
+
+    assert index.search("saur") == ["bulbasaur", "ivysaur", "venusaur"]
+    assert index.search("CHAR") == ["charmander", "charmeleon", "charizard"]
+    assert index.search("ar") == ["charmander", "charmeleon", "charizard"]
+    assert index.search("xyz") == []
+
+
+def test_incremental_add():
+    """Novos nomes entram sem reconstruir o índice."""
+    index = PokemonNameIndex()
+    index.add(NAMES)
+
+    assert index.add(["charmander", "chikorita"]) == 1 # 'charmander' já existia
+    assert len(index) == 8
+    assert index.search("ch")[-1] == "chikorita"
+    assert index.search("kor") == ["chikorita"]
+
+
+@patch('app.external.poke_api_client.PokeAPIClient.get_pokemon_list')
+def test_listing_name_filter_paginates_over_whole_catalog(mock_list, client, auth_headers):
+    """'?name=' encontra Pokémon fora da primeira página e pagina o resultado filtrado."""
+    names = [f"filler{i}" for i in range(30)] + ["charmander", "charmeleon", "charizard"]
+    mock_list.return_value = [{"name": n, "url": f"url_{n}"} for n in names]
+
+    details = lambda name: {
+        "id": names.index(name) + 1, "name": name,
+        "sprites": {"other": {"official-artwork": {"front_default": "img"}}},
+        "types": [{"type": {"name": "fire"}}], "stats": []
+    }
+    with patch('app.external.poke_api_client.PokeAPIClient.get_pokemon_details', side_effect=details):
+        response = client.get('/api/v1/pokemon/?name=char&limit=2&offset=0', headers=auth_headers)
+        body = response.get_json()
+        assert [p['nome'] for p in body['data']] == ["Charmander", "Charmeleon"]
+        assert body['total'] == 3
+        assert body['next_offset'] == 2
+
+        response = client.get('/api/v1/pokemon/?name=char&limit=2&offset=2', headers=auth_headers)
+        body = response.get_json()
+        assert [p['nome'] for p in body['data']] == ["Charizard"]
+        assert body['next_offset'] is None
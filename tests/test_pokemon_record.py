@@ -0,0 +1,55 @@
+
+import pytest
+from app.models.catalogo_pokemon_model import CatalogoPokemonModel
+from app.services.pokemon_record import POKEMON_TYPES, PokemonRecord
+
+RAW_BULBASAUR = {
+    'id': 1,
+    'name': 'bulbasaur',
+    'types': [{'type': {'name': 'grass'}}, {'type': {'name': 'poison'}}],
+    'sprites': {'other': {'official-artwork': {'front_default': 'https://img/1.png'}}},
+    'stats': [{'stat': {'name': name}, 'base_stat': value} for name, value in (
+        ('hp', 45), ('attack', 49), ('defense', 49), ('special-attack', 65), ('special-defense', 65), ('speed', 45)
+    )],
+    'moves': [{'move': {'name': f'move-{i}'}} for i in range(50)], # Descartado na conversão
+}
+
+EXPECTED = {
+    'id_pokemon': 1,
+    'nome': 'Bulbasaur',
+    'codigo': '1',
+    'tipos': ['Grass', 'Poison'],
+    'imagem_uri': 'https://img/1.png',
+    'stats': {'hp': 45, 'attack': 49, 'defense': 49, 'special-attack': 65, 'special-defense': 65, 'speed': 45},
+}
+
+
+def test_record_from_details_keeps_the_listing_format():
+    record = PokemonRecord.from_details(RAW_BULBASAUR)
+    assert record.to_dict() == EXPECTED
+    assert record.codigo == '1'
+    assert PokemonRecord.from_details(None) is None
+
+
+def test_record_from_catalog_entry_matches_details(app):
+    entry = CatalogoPokemonModel(id_pokemon=1, nome='bulbasaur', tipo_primario='Grass', tipo_secundario='Poison',
+                                 imagem_uri='https://img/1.png', hp=45, ataque=49, defesa=49,
+                                 ataque_especial=65, defesa_especial=65, velocidade=45)
+    assert PokemonRecord.from_catalog_entry(entry).to_dict() == EXPECTED
+
+
+def test_types_are_interned_as_small_ints():
+    first = PokemonRecord.from_details(RAW_BULBASAUR)
+    second = PokemonRecord.from_details({**RAW_BULBASAUR, 'id': 2, 'name': 'ivysaur'})
+    assert first.tipos == second.tipos
+    assert all(isinstance(type_id, int) and type_id < len(POKEMON_TYPES) for type_id in first.tipos)
+    assert POKEMON_TYPES.intern('Grass') == first.tipos[0]
+
+
+def test_record_is_immutable_and_slotted():
+    record = PokemonRecord.from_details(RAW_BULBASAUR)
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.nome = 'ivysaur'
+    with pytest.raises(AttributeError):
+        del record.stats
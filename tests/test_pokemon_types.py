@@ -0,0 +1,94 @@
+
+import json
+import pytest
+from flask import current_app
+from app import db
+from app.migrations import upgrade_schema
+from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.pokemon_usuario_tipo_model import PokemonUsuarioTipoModel
+from app.models.tipo_pokemon_model import TipoPokemonModel
+from app.repositories.pokemon_repository import PokemonRepository
+from app.repositories.unit_of_work import unit_of_work
+from tests.test_listing_queries import count_queries
+from tests.test_query_plans import FULL_SCAN, _capture_statements
+
+CHARIZARD = {"nome": "Charizard", "imagem_uri": "uri", "tipos": ["Fire", "Flying"]}
+SQUIRTLE = {"nome": "Squirtle", "imagem_uri": "uri", "tipos": ["Water"]}
+
+
+def _favorite(client, headers, code, data, value=True):
+    """Marca/desmarca um favorito pelo lote (que aceita os dados do Pokémon no corpo)."""
+    operation = {"pokemon_code": code, "field": "favorite", "value": value, "pokemon_data": data}
+    return client.post('/api/v1/pokemon/batch', headers=headers, data=json.dumps({"operations": [operation]}))
+
+
+def test_all_types_are_persisted_and_filterable(client, auth_headers):
+    """Todos os tipos vão para a associação e o filtro ?type= usa qualquer um deles."""
+    _favorite(client, auth_headers, '6', CHARIZARD)
+    _favorite(client, auth_headers, '7', SQUIRTLE)
+
+    record = PokemonUsuarioModel.query.filter_by(codigo='6').first()
+    assert [link.ordem for link in record.tipos] == [1, 2]
+
+    response = client.get('/api/v1/pokemon/favorites?type=flying', headers=auth_headers)
+    assert [p['codigo'] for p in response.get_json()['data']] == ['6']
+    response = client.get('/api/v1/pokemon/favorites?type=water', headers=auth_headers)
+    assert [p['codigo'] for p in response.get_json()['data']] == ['7']
+    response = client.get('/api/v1/pokemon/favorites?type=ghost', headers=auth_headers)
+    assert response.get_json()['data'] == []
+
+    # Desfavoritar remove também as associações
+    _favorite(client, auth_headers, '6', CHARIZARD, value=False)
+    assert PokemonUsuarioTipoModel.query.count() == 1
+
+
+def test_known_types_skip_the_type_table(client, auth_headers):
+    """Com os tipos já na tabela em memória, nenhum SQL toca em 'TipoPokemon'."""
+    _favorite(client, auth_headers, '6', CHARIZARD)
+
+    with count_queries() as statements:
+        _favorite(client, auth_headers, '4', {"nome": "Charmander", "imagem_uri": "uri", "tipos": ["Fire"]})
+    assert not [s for s in statements if 'FROM "TipoPokemon"' in s or 'INTO "TipoPokemon"' in s]
+
+
+def test_type_created_in_a_rolled_back_transaction_is_not_cached(app):
+    """Um tipo criado em uma transação desfeita não entra na tabela em memória."""
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            PokemonRepository.get_or_create_type_id('Shadow')
+            raise RuntimeError("falha")
+
+    assert current_app.extensions['tipo_pokemon_cache'].get('Shadow') is None
+    assert TipoPokemonModel.query.filter_by(descricao='Shadow').first() is None
+
+    with unit_of_work():
+        type_id = PokemonRepository.get_or_create_type_id('Shadow')
+    assert current_app.extensions['tipo_pokemon_cache'].get('Shadow') == type_id
+
+
+def test_filter_by_type_uses_indexes(client, auth_headers):
+    """O filtro de favoritos por tipo não faz varredura completa."""
+    _favorite(client, auth_headers, '6', CHARIZARD)
+
+    statements = _capture_statements(lambda: PokemonRepository.get_user_favorites_page(1, 10, type_description='Fire'))
+    with db.engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = [row[-1] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()]
+            assert not any(FULL_SCAN.match(d) or d.startswith('SCAN PokemonUsuarioTipo') for d in plan), plan
+
+
+def test_upgrade_backfills_type_links(app):
+    """Registros antigos (sem associação) recebem o tipo primário na migração."""
+    tipo = TipoPokemonModel(descricao='Grass')
+    db.session.add(tipo)
+    db.session.flush()
+    db.session.add(PokemonUsuarioModel(
+        id_usuario=1, id_tipo_pokemon=tipo.id_tipo_pokemon, codigo='1', nome='bulbasaur', imagem_uri='uri', favorito=True
+    ))
+    db.session.commit()
+
+    upgrade_schema()
+    upgrade_schema() # Idempotente
+
+    links = PokemonUsuarioTipoModel.query.all()
+    assert [(link.id_tipo_pokemon, link.ordem) for link in links] == [(tipo.id_tipo_pokemon, 1)]
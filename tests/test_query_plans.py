@@ -0,0 +1,78 @@
+
+import re
+import pytest
+from sqlalchemy import event, inspect, text
+from app import db
+from app.migrations import upgrade_schema
+from app.repositories.pokemon_repository import PokemonRepository
+
+# "SCAN PokemonUsuario" (ou "SCAN TABLE ..." em SQLites antigos) = varredura completa
+FULL_SCAN = re.compile(r'^SCAN (TABLE )?PokemonUsuario\b')
+
+# Cada consulta do repositório que lê/atualiza PokemonUsuario
+REPOSITORY_QUERIES = {
+    'get_pokemon_by_user_and_code': lambda: PokemonRepository.get_pokemon_by_user_and_code(1, '25'),
+    'get_user_states_by_codes': lambda: PokemonRepository.get_user_states_by_codes(1, ['1', '2', '3']),
+    'get_user_battle_team_count': lambda: PokemonRepository.get_user_battle_team_count(1),
+    'get_user_favorite_pokemons': lambda: PokemonRepository.get_user_favorite_pokemons(1),
+    'get_user_battle_team': lambda: PokemonRepository.get_user_battle_team(1),
+    'clear_user_battle_team': lambda: PokemonRepository.clear_user_battle_team(1),
+    # Cria o contador do time a partir da contagem atual (INSERT ... SELECT count)
+    'adjust_battle_team_counter': lambda: PokemonRepository.adjust_battle_team_counter(1, 1, 6),
+}
+
+
+def _capture_statements(fn):
+    """Executa `fn` e retorna os (SQL, parâmetros) enviados ao banco."""
+    captured = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if 'PokemonUsuario' in statement:
+            captured.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', before_cursor_execute)
+    return captured
+
+
+@pytest.mark.parametrize('query_name', sorted(REPOSITORY_QUERIES))
+def test_repository_query_uses_an_index(app, query_name):
+    """Nenhuma consulta do repositório pode virar uma varredura completa da tabela."""
+    with app.app_context():
+        statements = _capture_statements(REPOSITORY_QUERIES[query_name])
+        assert statements, f"{query_name} não executou SQL em PokemonUsuario"
+
+        with db.engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+                details = [row[-1] for row in plan]
+                assert not any(FULL_SCAN.match(d) for d in details), f"{query_name}: {details}"
+
+
+def test_team_and_favorites_use_composite_indexes(app):
+    """As leituras de time e favoritos usam os índices compostos (não só o prefixo IDUsuario)."""
+    with app.app_context():
+        for fn, index_name in (
+            (REPOSITORY_QUERIES['get_user_battle_team'], 'ix_pokemon_usuario_grupo_batalha'),
+            (REPOSITORY_QUERIES['get_user_favorite_pokemons'], 'ix_pokemon_usuario_favorito'),
+        ):
+            statement, parameters = _capture_statements(fn)[0]
+            with db.engine.connect() as conn:
+                plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            assert any(index_name in row[-1] for row in plan)
+
+
+def test_upgrade_schema_creates_missing_indexes(app):
+    """Um banco criado antes dos índices os recebe ao iniciar a aplicação."""
+    with app.app_context():
+        with db.engine.begin() as conn:
+            conn.execute(text('DROP INDEX ix_pokemon_usuario_grupo_batalha'))
+            conn.execute(text('DROP INDEX ix_pokemon_usuario_favorito'))
+
+        upgrade_schema()
+
+        names = {ix['name'] for ix in inspect(db.engine).get_indexes('PokemonUsuario')}
+        assert {'ix_pokemon_usuario_grupo_batalha', 'ix_pokemon_usuario_favorito'} <= names
@@ -0,0 +1,97 @@
+import json
+
+import time
+from app.external.response_cache import MemoryLRUCache, ResponseCache
+
+
+def test_memory_lru_evicts_least_recently_used_by_bytes():
+    """Ao exceder o limite de bytes, a entrada menos usada é removida."""
+    cache = MemoryLRUCache(max_bytes=100)
+    expires = time.time() + 60
+    cache.set('a', {'n': 'a'}, 40, expires)
+    cache.set('b', {'n': 'b'}, 40, expires)
+    cache.get('a') # 'a' passa a ser a mais recente
+    cache.set('c', {'n': 'c'}, 40, expires)
+
+    assert cache.get('b') is None
+    assert cache.get('a') is not None
+    assert cache.get('c') is not None
+    assert cache.evictions == 1
+    assert cache.current_bytes == 80
+
+
+def test_response_cache_respects_ttl_per_endpoint():
+    """Cada prefixo de endpoint usa seu próprio TTL."""
+    cache = ResponseCache(max_memory_bytes=1024, ttls={'pokemon/': 60, 'pokemon-species/': 0})
+    cache.set('pokemon/1', {'id': 1})
+    cache.set('pokemon-species/1', {'id': 1})
+
+    assert cache.ttl_for('pokemon?limit=20&offset=0') == cache.default_ttl
+    assert cache.get('pokemon/1') == {'id': 1}
+    assert cache.get('pokemon-species/1') is None # Expirou imediatamente
+    stats = cache.get_stats()
+    assert stats['memory_hits'] == 1
+    assert stats['misses'] == 1
+
+
+def test_memory_tier_keeps_only_compressed_bytes():
+    """A memória guarda o JSON comprimido; cada acerto devolve um dicionário novo."""
+    cache = ResponseCache(max_memory_bytes=1024 * 1024)
+    details = {'name': 'pikachu', 'moves': [{'move': {'name': f'move-{i}'}} for i in range(200)]}
+    cache.set('pokemon/25', details)
+
+    stored, _ = cache.memory.get('pokemon/25')
+    assert isinstance(stored, bytes)
+    assert cache.get_stats()['memory_bytes'] < len(json.dumps(details)) / 5
+    first, second = cache.get('pokemon/25'), cache.get('pokemon/25')
+    assert first == second == details
+    assert first is not second
+
+def test_response_cache_disk_tier_survives_new_instance(tmp_path):
+    """Uma nova instância (ex.: após reinício) lê do disco e promove para a memória."""
+    path = str(tmp_path / 'cache.sqlite3')
+    ResponseCache(max_memory_bytes=1024, disk_path=path).set('pokemon/25', {'name': 'pikachu'})
+
+    warm = ResponseCache(max_memory_bytes=1024, disk_path=path)
+    assert warm.get('pokemon/25') == {'name': 'pikachu'}
+    assert warm.get('pokemon/25') == {'name': 'pikachu'}
+    stats = warm.get_stats()
+    assert stats['disk_hits'] == 1
+    assert stats['memory_hits'] == 1
+
+
+def test_purge_expired_removes_only_expired_disk_entries(tmp_path):
+    """Entradas vencidas saem do disco; as válidas continuam lá."""
+    cache = ResponseCache(max_memory_bytes=1024, disk_path=str(tmp_path / 'cache.sqlite3'),
+                          ttls={'pokemon/': 60, 'pokemon-species/': -1})
+    cache.set('pokemon/1', {'id': 1})
+    cache.set('pokemon-species/1', {'id': 1})
+
+    assert cache.purge_expired() == 1
+    assert cache.disk.get('pokemon-species/1') is None
+    assert cache.disk.get('pokemon/1') is not None
+    assert ResponseCache(max_memory_bytes=1024).purge_expired() == 0 # Sem disco
+
+
+def test_client_does_not_touch_network_for_cached_data(stub_pokeapi, make_pokeapi_client, tmp_path):
+    """Um nó aquecido não deve voltar à rede para dados que já viu."""
+    path = str(tmp_path / 'cache.sqlite3')
+    client = make_pokeapi_client(cache=ResponseCache(1024 * 1024, disk_path=path))
+    client.get_pokemon_details('poke1')
+    client.get_pokemon_details('poke1')
+    assert stub_pokeapi.request_count == 1
+
+    restarted = make_pokeapi_client(cache=ResponseCache(1024 * 1024, disk_path=path))
+    assert restarted.get_pokemon_details('poke1')['name'] == 'poke1'
+    assert stub_pokeapi.request_count == 1
+
+
+def test_cold_fetch_counts_a_single_miss(stub_pokeapi, make_pokeapi_client):
+    """A nova checagem do cache antes da chamada HTTP não conta um segundo miss."""
+    client = make_pokeapi_client()
+    client.get_pokemon_details('poke1')
+    client.get_pokemon_details('poke1')
+
+    stats = client.cache.get_stats()
+    assert stub_pokeapi.request_count == 1
+    assert (stats['misses'], stats['hits']) == (1, 1)
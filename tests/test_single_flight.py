@@ -0,0 +1,64 @@
+
+import threading
+import pytest
+from app.external.single_flight import SingleFlight
+
+
+def _run_concurrently(count: int, target):
+    """Dispara `count` threads ao mesmo tempo e devolve (resultados, erros)."""
+    barrier = threading.Barrier(count)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results, errors
+
+
+def test_concurrent_fetches_share_one_upstream_call(stub_pokeapi, make_pokeapi_client):
+    """Vários workers pedindo o mesmo Pokémon geram uma única chamada à PokeAPI."""
+    stub_pokeapi.delay = 0.3
+    client = make_pokeapi_client()
+
+    results, errors = _run_concurrently(10, lambda: client.get_pokemon_details("poke1"))
+
+    assert not errors
+    assert [r['name'] for r in results] == ["poke1"] * 10
+    assert stub_pokeapi.request_count == 1
+    stats = client.get_stats()['single_flight']
+    assert stats['executed'] == 1
+    assert stats['deduplicated'] == 9
+    assert stats['in_flight'] == 0
+
+
+def test_error_propagates_to_every_waiter():
+    """Uma falha na execução compartilhada chega a todas as threads que esperavam."""
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing_fetch():
+        release.wait(1)
+        raise RuntimeError("PokeAPI fora do ar")
+
+    timer = threading.Timer(0.2, release.set)
+    timer.start()
+    results, errors = _run_concurrently(5, lambda: flight.do("pokemon/1", failing_fetch))
+
+    assert results == []
+    assert len(errors) == 5
+    assert all(str(e) == "PokeAPI fora do ar" for e in errors)
+    assert flight.get_stats() == {'executed': 1, 'deduplicated': 4, 'in_flight': 0}
+
+    # A chave foi liberada: uma nova chamada executa de novo
+    assert flight.do("pokemon/1", lambda: "ok") == "ok"
+    with pytest.raises(RuntimeError):
+        flight.do("pokemon/2", failing_fetch)
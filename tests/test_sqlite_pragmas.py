@@ -0,0 +1,31 @@
+
+from app import db
+
+
+def _pragma(name):
+    with db.engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_tuned_profile_is_applied_to_every_connection(make_file_app):
+    """O perfil 'tuned' liga WAL e ajusta as PRAGMAs de cada conexão."""
+    app = make_file_app(migrate_schema=False, SQLITE_PROFILE='tuned')
+    with app.app_context():
+        assert _pragma('journal_mode') == 'wal'
+        assert _pragma('synchronous') == 1 # NORMAL
+        assert _pragma('busy_timeout') == 5000
+        assert _pragma('cache_size') == -64000
+
+        # Uma conexão nova (após descartar o pool) recebe as mesmas PRAGMAs
+        db.engine.dispose()
+        assert _pragma('busy_timeout') == 5000
+        db.engine.dispose()
+
+
+def test_default_profile_keeps_sqlite_defaults(make_file_app):
+    """O perfil 'default' não altera a configuração do SQLite."""
+    app = make_file_app(migrate_schema=False, SQLITE_PROFILE='default')
+    with app.app_context():
+        assert _pragma('journal_mode') == 'delete'
+        assert _pragma('synchronous') == 2 # FULL
+        db.engine.dispose()
@@ -0,0 +1,94 @@
+
+import json
+import random
+import threading
+import time
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.equipe_batalha_contador_model import EquipeBatalhaContadorModel
+from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.tipo_pokemon_model import TipoPokemonModel
+from app.models.user_model import UsuarioModel
+from app.repositories.pokemon_repository import PokemonRepository
+
+POKEMON_DATA = {"nome": "Poke", "imagem_uri": "uri", "tipos": ["Normal"]}
+
+
+def _create_users(app, count):
+    """Cria os usuários e retorna os cabeçalhos de autorização de cada um."""
+    headers = []
+    with app.app_context():
+        for i in range(count):
+            user = UsuarioModel(nome=f'User {i}', login=f'user{i}', email=f'user{i}@pokedex.com', senha='x')
+            db.session.add(user)
+            db.session.commit()
+            headers.append({
+                'Authorization': f"Bearer {create_access_token(identity=str(user.id_usuario))}",
+                'Content-Type': 'application/json'
+            })
+    return headers
+
+
+def test_team_limit_holds_under_concurrent_adds_and_removes(make_file_app):
+    """
+    Teste de estresse: várias threads adicionam/removem Pokémon do time de poucos
+    usuários ao mesmo tempo. Ao final, nenhum time passa de 6 e o contador
+    bate com os registros.
+    """
+    app = make_file_app()
+    users = _create_users(app, 3)
+    threads_count, toggles_per_thread = 16, 25
+    statuses = []
+    lock = threading.Lock()
+    barrier = threading.Barrier(threads_count)
+
+    def worker(seed):
+        rng = random.Random(seed)
+        client = app.test_client()
+        barrier.wait()
+        for _ in range(toggles_per_thread):
+            headers = rng.choice(users)
+            code = str(rng.randint(1, 10))
+            response = client.post(f'/api/v1/pokemon/{code}/team', headers=headers, data=json.dumps(POKEMON_DATA))
+            with lock:
+                statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(threads_count)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    total = threads_count * toggles_per_thread
+    print(f"\n{total} toggles concorrentes em {elapsed:.2f}s ({total / elapsed:.0f} toggles/s)")
+
+    assert set(statuses) <= {200, 400}
+    assert 400 in statuses # O limite foi de fato atingido durante o teste
+    with app.app_context():
+        for user_id in range(1, len(users) + 1):
+            team_size = PokemonUsuarioModel.query.filter_by(id_usuario=user_id, grupo_batalha=True).count()
+            counter = db.session.get(EquipeBatalhaContadorModel, user_id)
+            assert team_size <= 6
+            assert counter is None or counter.quantidade == team_size
+        db.engine.dispose()
+
+
+def test_counter_is_initialized_from_existing_team(app):
+    """Usuários que já tinham time antes do contador começam com a contagem real."""
+    user = UsuarioModel(nome='Antigo', login='antigo', email='antigo@pokedex.com', senha='x')
+    tipo = TipoPokemonModel(descricao='Normal')
+    db.session.add_all([user, tipo])
+    db.session.flush()
+    for code in range(1, 7):
+        db.session.add(PokemonUsuarioModel(
+            id_usuario=user.id_usuario, id_tipo_pokemon=tipo.id_tipo_pokemon, codigo=str(code),
+            nome='poke', imagem_uri='uri', grupo_batalha=True
+        ))
+    db.session.commit()
+
+    assert PokemonRepository.adjust_battle_team_counter(user.id_usuario, 1, 6) is False
+    assert PokemonRepository.get_battle_team_counter(user.id_usuario) == 6
+    assert PokemonRepository.adjust_battle_team_counter(user.id_usuario, -1, 6) is True
+    assert PokemonRepository.get_battle_team_counter(user.id_usuario) == 5
@@ -0,0 +1,129 @@
+
+import json
+from datetime import datetime, timedelta
+from app.repositories.token_repository import TokenRepository
+from app.repositories.unit_of_work import unit_of_work
+from app.services.bloom_filter import BloomFilter
+from app.services.token_blocklist import TokenBlocklist
+from conftest import TEST_USER
+from tests.test_listing_queries import count_queries
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    items = [f'jti-{i}' for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+
+    false_positives = sum(f'outro-{i}' in bloom for i in range(10000))
+    assert false_positives < 10000 * 0.01 * 3
+    assert not bloom.is_full()
+    bloom.add('mais-um')
+    assert bloom.is_full()
+
+
+def _login(client):
+    response = client.post('/api/v1/auth/login', data=json.dumps(TEST_USER), content_type='application/json')
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+def test_logout_revokes_only_the_current_token(app, client, auth_headers):
+    other_session = _login(client)
+
+    assert client.post('/api/v1/auth/logout', headers=auth_headers).status_code == 200
+
+    response = client.get('/api/v1/pokemon/team', headers=auth_headers)
+    assert response.status_code == 401
+    assert client.post('/api/v1/auth/logout', headers=auth_headers).status_code == 401
+    assert client.get('/api/v1/pokemon/team', headers=other_session).status_code == 200
+
+
+def test_non_revoked_tokens_cost_no_queries(app, client, auth_headers):
+    """Com revogações registradas, um token válido continua sem nenhum SQL para a checagem."""
+    client.post('/api/v1/auth/logout', headers=_login(client))
+    etag = client.get('/api/v1/pokemon/favorites', headers=auth_headers).headers['ETag']
+
+    with count_queries() as statements:
+        response = client.get('/api/v1/pokemon/favorites', headers={**auth_headers, 'If-None-Match': etag})
+    assert response.status_code == 304
+    assert statements == []
+
+    stats = client.get('/api/v1/monitoring/token-blocklist', headers=auth_headers).get_json()['data']
+    assert stats['bloom_items'] == 1
+    assert stats['bloom_negatives'] >= 2
+
+
+def test_revocations_from_other_processes_are_picked_up_on_refresh(app, auth_headers):
+    now = [0.0]
+    blocklist = TokenBlocklist(capacity=2, refresh_seconds=5, clock=lambda: now[0])
+    blocklist.load()
+    assert not blocklist.is_revoked('jti-a')
+
+    # Outro worker revoga tokens direto no BD
+    with unit_of_work():
+        for jti in ('jti-a', 'jti-b', 'jti-c'):
+            TokenRepository.revoke(jti, 1, datetime.utcnow() + timedelta(minutes=15))
+    assert not blocklist.is_revoked('jti-a') # Ainda dentro do intervalo de atualização
+
+    now[0] = 6.0
+    assert blocklist.is_revoked('jti-a')
+    assert blocklist.is_revoked('jti-c')
+
+    # Passou da capacidade: o filtro é recriado maior, sem perder revogações
+    now[0] = 12.0
+    assert blocklist.is_revoked('jti-b')
+    stats = blocklist.get_stats()
+    assert stats['rebuilds'] == 2
+    assert stats['bloom_capacity'] >= 6
+
+
+def test_load_purges_expired_revocations(app, auth_headers):
+    with unit_of_work():
+        TokenRepository.revoke('expirado', 1, datetime.utcnow() - timedelta(minutes=1))
+        TokenRepository.revoke('valido', 1, datetime.utcnow() + timedelta(minutes=15))
+
+    blocklist = TokenBlocklist()
+    blocklist.load()
+    assert blocklist.get_stats()['bloom_items'] == 1
+    assert not blocklist.is_revoked('expirado')
+    assert blocklist.is_revoked('valido')
+
+
+def test_local_revocations_are_added_to_the_filter_once(app, auth_headers):
+    """A atualização periódica não adiciona de novo o que este processo já revogou."""
+    now = [0.0]
+    blocklist = TokenBlocklist(refresh_seconds=5, clock=lambda: now[0])
+    blocklist.load()
+    blocklist.revoke('jti-local', 1, datetime.utcnow() + timedelta(minutes=15))
+    with unit_of_work():
+        TokenRepository.revoke('jti-outro', 1, datetime.utcnow() + timedelta(minutes=15))
+
+    now[0] = 6.0
+    assert blocklist.is_revoked('jti-local')
+    assert blocklist.is_revoked('jti-outro')
+    stats = blocklist.get_stats()
+    assert stats['bloom_items'] == 2
+    assert stats['checks'] == stats['db_checks'] == stats['revoked_hits'] == 2
+
+
+def test_checks_during_a_rebuild_still_see_revoked_tokens(app, auth_headers, monkeypatch):
+    """Enquanto o filtro novo é montado, as checagens continuam usando o antigo (nunca um vazio)."""
+    blocklist = TokenBlocklist(refresh_seconds=3600)
+    with unit_of_work():
+        TokenRepository.revoke('revogado', 1, datetime.utcnow() + timedelta(minutes=15))
+    blocklist.load()
+
+    seen_during_rebuild = []
+    original = TokenRepository.get_active_since
+
+    def get_active_since(last_id, now):
+        # Checagem "concorrente": chega no meio da reconstrução, sem pegar o lock
+        seen_during_rebuild.append(blocklist.is_revoked('revogado'))
+        return original(last_id, now)
+
+    monkeypatch.setattr(TokenRepository, 'get_active_since', staticmethod(get_active_since))
+    blocklist.load()
+
+    assert seen_during_rebuild == [True]
+    assert blocklist.is_revoked('revogado')
@@ -0,0 +1,73 @@
+
+import json
+import threading
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from flask_jwt_extended import create_access_token
+from app import db
+from app.models.pokemon_usuario_model import PokemonUsuarioModel
+from app.models.tipo_pokemon_model import TipoPokemonModel
+from app.models.user_model import UsuarioModel
+from app.repositories.unit_of_work import unit_of_work
+
+POKEMON_DATA = {"nome": "Poke", "imagem_uri": "uri", "tipos": ["Normal"]}
+
+
+def test_toggle_commits_once(client, auth_headers):
+    """Criar o registro (tipo novo + Pokémon) custa um único commit."""
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(Session, 'after_commit', listener)
+    try:
+        response = client.post('/api/v1/pokemon/1/team', headers=auth_headers, data=json.dumps(POKEMON_DATA))
+    finally:
+        event.remove(Session, 'after_commit', listener)
+
+    assert response.status_code == 200
+    assert len(commits) == 1
+
+
+def test_unit_of_work_rolls_back_on_error(app):
+    """Se a operação falhar, nada do que foi preparado é gravado."""
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            db.session.add(TipoPokemonModel(descricao='Fantasma'))
+            db.session.flush()
+            raise RuntimeError("falha no meio da operação")
+
+    assert TipoPokemonModel.query.filter_by(descricao='Fantasma').first() is None
+
+
+def test_concurrent_team_toggles_respect_the_limit(make_file_app):
+    """Com o banco em arquivo, toggles simultâneos não ultrapassam o limite de 6."""
+    app = make_file_app()
+    with app.app_context():
+        user = UsuarioModel(nome='Corrida', login='corrida', email='corrida@pokedex.com', senha='x')
+        db.session.add(user)
+        db.session.commit()
+        headers = {
+            'Authorization': f"Bearer {create_access_token(identity=str(user.id_usuario))}",
+            'Content-Type': 'application/json'
+        }
+
+    barrier = threading.Barrier(12)
+    statuses = []
+
+    def toggle(code):
+        client = app.test_client()
+        barrier.wait()
+        response = client.post(f'/api/v1/pokemon/{code}/team', headers=headers, data=json.dumps(POKEMON_DATA))
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=toggle, args=(str(code),)) for code in range(1, 13)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    with app.app_context():
+        team_size = PokemonUsuarioModel.query.filter_by(grupo_batalha=True).count()
+        db.engine.dispose()
+    assert team_size == 6
+    assert sorted(statuses) == [200] * 6 + [400] * 6
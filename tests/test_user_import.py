@@ -0,0 +1,91 @@
+
+import json
+from unittest.mock import patch
+from app.models.user_model import UsuarioModel
+from app.repositories.user_repository import UserRepository
+from app.repositories.unit_of_work import unit_of_work
+from app.services.user_service import UserService
+from app.services.user_import import read_user_rows
+from tests.test_listing_queries import count_queries
+
+NEW_USER = {'nome': 'Ash', 'login': 'ash', 'email': 'ash@pokedex.com', 'senha': 'pikachu'}
+
+
+def _register(client, **overrides):
+    return client.post('/api/v1/auth/register', data=json.dumps({**NEW_USER, **overrides}), content_type='application/json')
+
+
+def test_register_checks_login_and_email_in_one_query(client):
+    with count_queries() as statements:
+        assert _register(client).status_code == 201
+    before_insert = statements[:next(i for i, s in enumerate(statements) if s.startswith('INSERT INTO "Usuario"'))]
+    assert len([s for s in before_insert if 'FROM "Usuario"' in s]) == 1
+
+    assert _register(client, email='outro@pokedex.com').get_json()['msg'] == "O login fornecido já está em uso."
+    assert _register(client, login='outro').get_json()['msg'] == "O email fornecido já está em uso."
+    assert _register(client, login='outro').status_code == 409
+
+
+def test_register_race_maps_integrity_error_to_409(client):
+    """Se outro cadastro vencer a corrida depois da verificação, a constraint vira 409 (não 500)."""
+    assert _register(client).status_code == 201
+    with patch.object(UserRepository, 'find_taken', return_value=(False, False)):
+        response = _register(client)
+    assert response.status_code == 409
+    assert UsuarioModel.query.filter_by(login='ash').count() == 1
+
+
+def _write_csv(tmp_path, lines):
+    path = tmp_path / 'usuarios.csv'
+    path.write_text('nome,login,email,senha\n' + '\n'.join(lines) + '\n', encoding='utf-8')
+    return path
+
+
+def test_import_cli_from_csv(app, client, tmp_path):
+    assert _register(client).status_code == 201
+    path = _write_csv(tmp_path, [f'Treinador {i},trainer{i},trainer{i}@pokedex.com,senha{i}' for i in range(5)] + [
+        'Repetido,trainer0,repetido@pokedex.com,x',   # login repetido no arquivo
+        'Antigo,ash,novo@pokedex.com,x',              # login já cadastrado
+        'Sem senha,semsenha,semsenha@pokedex.com,',   # campo obrigatório vazio
+    ])
+
+    result = app.test_cli_runner().invoke(args=['users', 'import', str(path), '--batch-size', '3', '--workers', '1'])
+    assert result.exit_code == 0, result.output
+    assert 'Importação concluída: 5 inseridos, 2 já existentes, 1 inválidos.' in result.output
+    assert 'Linha 9: campo \'senha\' ausente' in result.output
+    assert UsuarioModel.query.count() == 6
+
+    # Os usuários importados conseguem fazer login
+    response = client.post('/api/v1/auth/login', data=json.dumps({'login': 'trainer3', 'senha': 'senha3'}),
+                           content_type='application/json')
+    assert response.status_code == 200
+
+
+def test_import_hashes_in_process_pool_and_commits_per_batch(app, tmp_path):
+    path = tmp_path / 'usuarios.jsonl'
+    lines = [json.dumps({'nome': f'T{i}', 'login': f't{i}', 'email': f't{i}@p.com', 'senha': f's{i}'}) for i in range(7)]
+    path.write_text('\n'.join(lines[:3] + ['{quebrado'] + lines[3:]) + '\n', encoding='utf-8')
+
+    batches = []
+    with open(path, encoding='utf-8') as stream:
+        summary = UserService().import_users(
+            read_user_rows(stream, 'jsonl'), batch_size=4, workers=2, hash_method='pbkdf2:sha256:500',
+            progress=lambda partial: batches.append(partial['inserted'])
+        )
+
+    assert batches == [3, 7]
+    assert (summary['inserted'], summary['skipped'], summary['invalid']) == (7, 0, 1)
+    assert summary['errors'] == [(4, 'linha malformada')]
+    assert all(u.senha.startswith('pbkdf2:sha256:500$') for u in UsuarioModel.query.all())
+
+
+def test_insert_many_ignores_conflicts(app, client):
+    """Logins/emails inseridos por outra requisição no meio do lote são ignorados, não derrubam o lote."""
+    assert _register(client).status_code == 201
+    with unit_of_work():
+        inserted = UserRepository.insert_many([
+            {**NEW_USER, 'senha': 'hash'},
+            {'nome': 'Misty', 'login': 'misty', 'email': 'misty@pokedex.com', 'senha': 'hash'},
+        ])
+    assert inserted == 1
+    assert UsuarioModel.query.filter_by(login='misty').one().dt_inclusao is not None
@@ -0,0 +1,116 @@
+
+import json
+import os
+import runpy
+import pytest
+from app import create_app
+from app.config import TestingConfig
+from app.services.cache_backends import InMemoryCacheBackend, RedisCacheBackend
+from app.services.user_list_cache import UserListCache
+from app.services.user_state_versions import UserStateVersions
+from tests.test_listing_queries import count_queries
+
+
+class FakeRedis:
+    """Servidor Redis mínimo em memória (get/set/incr), compartilhado entre 'workers'."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    def incr(self, key):
+        value = int(self.data.get(key, b'0')) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+def test_favorites_are_served_from_cache_until_a_toggle(app, client, auth_headers, sync_catalog):
+    """A segunda leitura não consulta o BD; um toggle faz a próxima leitura recarregar."""
+    sync_catalog()
+    client.post('/api/v1/pokemon/3/favorite', headers=auth_headers, data=json.dumps({}))
+
+    client.get('/api/v1/pokemon/favorites', headers=auth_headers)
+    with count_queries() as statements:
+        response = client.get('/api/v1/pokemon/favorites', headers=auth_headers)
+    assert response.status_code == 200
+    assert [p['codigo'] for p in response.get_json()['data']] == ['3']
+    assert statements == []
+
+    client.post('/api/v1/pokemon/5/favorite', headers=auth_headers, data=json.dumps({}))
+    response = client.get('/api/v1/pokemon/favorites', headers=auth_headers)
+    assert sorted(p['codigo'] for p in response.get_json()['data']) == ['3', '5']
+
+    stats = client.get('/api/v1/monitoring/user-cache', headers=auth_headers).get_json()['data']
+    assert stats['hits'] >= 1 and stats['misses'] >= 2
+
+
+def test_memory_backend_is_bounded_by_bytes():
+    """As listas mais antigas saem pelo LRU; os contadores de versão não."""
+    backend = InMemoryCacheBackend(max_bytes=200)
+    cache = UserListCache(backend)
+    versions = UserStateVersions(backend)
+
+    versions.bump(1)
+    for user_id in range(10):
+        cache.set(user_id, 'team', 0, [{'codigo': str(user_id), 'nome': 'x' * 20}])
+
+    assert backend.get_stats()['bytes'] <= 200
+    assert backend.get_stats()['evictions'] > 0
+    assert cache.get(0, 'team', 0) is None
+    assert cache.get(9, 'team', 0) == [{'codigo': '9', 'nome': 'x' * 20}]
+    assert versions.get(1) == 1
+
+
+def test_shared_backend_keeps_workers_coherent():
+    """Com um backend compartilhado, a alteração feita em um worker invalida o cache do outro."""
+    server = FakeRedis()
+    worker_a = RedisCacheBackend(server)
+    worker_b = RedisCacheBackend(server)
+    versions_a, versions_b = UserStateVersions(worker_a), UserStateVersions(worker_b)
+    lists_b = UserListCache(worker_b)
+
+    lists_b.set(1, 'favorites', versions_b.get(1), [{'codigo': '25'}])
+    token = versions_b.token(1)
+    assert versions_a.token(1) == token
+
+    versions_a.bump(1)
+    assert lists_b.get(1, 'favorites', versions_b.get(1)) is None
+    assert versions_b.token(1) != token
+
+
+def test_memory_backend_refuses_multiple_workers():
+    """Com vários workers, o cache por processo deixaria ETags desatualizadas: a aplicação não sobe."""
+    class MultiWorkerConfig(TestingConfig):
+        WEB_CONCURRENCY = 4
+
+    with pytest.raises(RuntimeError, match='USER_CACHE_REDIS_URL'):
+        create_app(MultiWorkerConfig)
+
+    class SharedCacheConfig(MultiWorkerConfig):
+        USER_CACHE_REDIS_URL = 'redis://localhost:6379/0'
+
+    assert create_app(SharedCacheConfig) is not None
+
+
+def test_gunicorn_config_checks_the_real_worker_count(monkeypatch):
+    """O gunicorn.conf.py recusa `-w 4` com o cache em memória, mesmo sem WEB_CONCURRENCY."""
+    from types import SimpleNamespace
+    from app.config import Config
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    on_starting = runpy.run_path(os.path.join(root, 'gunicorn.conf.py'))['on_starting']
+
+    monkeypatch.setattr(Config, 'USER_CACHE_REDIS_URL', '')
+    with pytest.raises(RuntimeError, match='USER_CACHE_REDIS_URL'):
+        on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=4)))
+    on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=1)))
+
+    monkeypatch.setattr(Config, 'USER_CACHE_REDIS_URL', 'redis://localhost:6379/0')
+    on_starting(SimpleNamespace(cfg=SimpleNamespace(workers=4)))